@@ -55,11 +55,34 @@ export function useSound() {
     }
   }
 
+  /**
+   * Plays a pre-rendered effect from /assets/sounds/[name].wav.
+   * Falls back to synthesising the effect if the file cannot be played.
+   */
+  const playEffect = (name: string, volume: number, synthesize: () => void) => {
+    try {
+      const audio = new Audio(`/assets/sounds/${name}.wav`)
+      audio.volume = volume
+      audio.play().catch(() => synthesize())
+    } catch {
+      synthesize()
+    }
+  }
+
+  /**
+   * Plays the classic Mac startup chime.
+   * Uses the pre-rendered startup-chime.wav from scripts/generate_sounds.py.
+   */
+  const playStartupChime = () => {
+    const volume = (settings.value?.soundVolume || 75) / 100
+    playEffect('startup-chime', volume, synthesizeStartupChime)
+  }
+
   /**
    * Generates a classic Mac startup chime using Web Audio API.
    * Plays a C major-ish chord with square waves.
    */
-  const playStartupChime = () => {
+  const synthesizeStartupChime = () => {
     try {
       const AudioContextClass = (window as any).AudioContext || (window as any).webkitAudioContext
       if (!AudioContextClass) return
@@ -103,9 +126,18 @@ export function useSound() {
   }
 
   /**
-   * Generates a "crumpling paper" sound for the trash using Web Audio API.
+   * Plays the "crumpling paper" sound for the trash.
+   * Uses the pre-rendered trash.wav from scripts/generate_sounds.py.
    */
   const playTrashSound = () => {
+    const volume = (settings.value?.soundVolume || 75) / 100
+    playEffect('trash', volume, synthesizeTrashSound)
+  }
+
+  /**
+   * Generates a "crumpling paper" sound for the trash using Web Audio API.
+   */
+  const synthesizeTrashSound = () => {
     try {
       const AudioContextClass = (window as any).AudioContext || (window as any).webkitAudioContext
       if (!AudioContextClass) return
@@ -0,0 +1,11 @@
+// Generated by scripts/generate_assets.py - do not edit.
+
+/** Pixel-identical duplicates, mapped to the URL of the copy to fetch instead. */
+export const ASSET_ALIASES: Record<string, string> = {
+  '/assets/cards/back-classic.png': '/assets/cards/back.png',
+}
+
+/** Returns the canonical URL of an asset, so identical images are fetched once. */
+export function resolveAssetUrl(url: string): string {
+  return ASSET_ALIASES[url] ?? url
+}
@@ -0,0 +1,30 @@
+// Generated by scripts/inline_assets.py - do not edit.
+
+/** Data URIs for small generated assets, keyed by their /assets URL. */
+export const INLINE_ASSETS: Record<string, string> = {
+  '/assets/icons/ui/apple-logo.png': 'data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAYAAAAf8/9hAAAARklEQVR4nO1QQQ4AIAhS/v9nOrdpwuoYRwUGRHzkYQIqfBji8g5DXAKmWK4g74W4BAwuXyTgZJCuSZVgMtn+XYXOREnoYQFOoQgW4ppCYwAAAABJRU5ErkJggg==',
+  '/assets/icons/ui/checkbox-checked.png': 'data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAAAwAAAAMCAYAAABWdVznAAAAW0lEQVR4nJVSWwrAIAxLZXftmXLaDi0bW9Fa82EL5oUoAAwHuPpBskRW1TGNpK0Ab/DuLXMUEXccXEebETK0SI7TPu4/QbzYJmDTfSqopKSvVBI8Kau0Xvboa9z4dTy8uWXbXQAAAABJRU5ErkJggg==',
+  '/assets/icons/ui/checkbox-unchecked.png': 'data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAAAwAAAAMCAYAAABWdVznAAAAN0lEQVR4nO2SsREAIAwCP567ZiamxdMJQu8X0EDDUYAJ2FckjcLd/dySPAHwImT9woB4pUqvcQBxOi25sw6pUQAAAABJRU5ErkJggg==',
+  '/assets/icons/ui/close-button.png': 'data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAAAwAAAAMCAYAAABWdVznAAAANElEQVR4nGNkYGD4z0ACYAIR////J4jT0tIQGki2gRTARJJqhhGqgQVEpKenE62BkdSkAQCmBh9j+4DyJAAAAABJRU5ErkJggg==',
+  '/assets/icons/ui/collapse-button.png': 'data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAAAwAAAAMCAYAAABWdVznAAAAOklEQVR4nGNkYGD4z0ACYAER//8Tp4eRkZGBiYFEwERzDSzobsQG/iP5kTIb/hMRWoMwlEDBQlLSAAAeAAsYFbYB9QAAAABJRU5ErkJggg==',
+  '/assets/icons/ui/dialog-border-sample.png': 'data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAACAAAAAgCAYAAABzenr0AAAAXElEQVR4nO3XOw7AIAwE0XHE/a/sVJHIR+mwC2YrBAXPiGYDSBpzdF4OMK5FZu1DRMQdMG+uzjzs+DtckeeQ7X9AgAABAgQIECBAgAABr15QVU4+AdX1DCDYvR2fsfYOR4qh0HAAAAAASUVORK5CYII=',
+  '/assets/icons/ui/menu-checkmark.png': 'data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAAAwAAAAMCAYAAABWdVznAAAAP0lEQVR4nGNgGCzgP4zBRILi/8RogJvMwMDAiE0DsgIGdMXoGv7joBmR1KBoQJbAZROGk1BMw8LHCXDaQHsAACybCgkK/fMBAAAAAElFTkSuQmCC',
+  '/assets/icons/ui/progress-fill.png': 'data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAACAAAAAMCAYAAAADFL+5AAAALElEQVR4nGNgYGD4n5aW9n/A6LSBtJyBAYRHQ4BhNA38H80FaaPlQNoILgkB/1RkH2/k18sAAAAASUVORK5CYII=',
+  '/assets/icons/ui/progress-indeterminate.png': 'data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAAQAAAAAMCAYAAACNx2OpAAAA+UlEQVR4nO2aQQrDMBAD5aVvtd8Uf9Y9hTjNOqXQrA3S3IoMGoqVQ0gC0CCEoOQFADlnAMC2baewlHL6/e88pYS+P9rB64902Ptba4//117e9z/VcZfXWk/90Q5ef6TD3p9zDt9eKQW1VtiTBb/kMxw8ZjjMGL8cfBjufZ/bbIGojhUdPBiGJ4cx0Q6GDxiGJ4cxDMOTw4HdHWB4AkZ0yMHPPRiGt5KDfTsQlc9w8GAYnhzGMNz7PrfZAlEdKzp4MAxPDmOiHS7vABiGJ4cxDMOTw4HdHWB4AkZ0yMHPPRiGt5KDvgNYwIFx/Cs4eDDc+z5P0KfAQtDyBsZwm0Te2T1TAAAAAElFTkSuQmCC',
+  '/assets/icons/ui/progress-track.png': 'data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAACAAAAAMCAYAAAADFL+5AAAAMklEQVR4nO3UwQkAQAwCwVXSf8seV4Uf55H3ghABoej+SToNkjBlXgCboMwLoEztV/wAZp0FFwxiwDgAAAAASUVORK5CYII=',
+  '/assets/icons/ui/radio-selected.png': 'data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAAAwAAAAMCAYAAABWdVznAAAAZ0lEQVR4nH2SWxLAMARF3U7Xak9Wq5NEW4T4Cs71GAHtpslH50xQRKbDzAsASqEOExHtjFLnAFuyFWgFd6IrLPTP28ZgVVoBLeDLhw5v4hQbAvjKHvBvY3CfRqhsO1yG8+GqLY9f4wHFmHgcAq2gSwAAAABJRU5ErkJggg==',
+  '/assets/icons/ui/radio-unselected.png': 'data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAAAwAAAAMCAYAAABWdVznAAAAXElEQVR4nJ2SUQ7AIAhD6Q7LnXpaFnAmC1PU9cc0eQhFIV9Z8piZAEmGUdUGAMNCc5G0mSR1LuFcsIS7nL3kUHjm34MBOe7gBXitrrzdj18ZuiJIzpMfbjRL+TVuBil4EZuTtq4AAAAASUVORK5CYII=',
+  '/assets/icons/ui/resize-handle.png': 'data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAYAAAAf8/9hAAAAPElEQVR4nGNgGNLg/////ynSnJaW9n+Ia/5PShj8x6KZaJf8H7Sa/+MLg/9EaMbpkv9DRjNKGJCjGWQYAEravN0r6XaYAAAAAElFTkSuQmCC',
+  '/assets/icons/ui/scroll-arrow-down.png': 'data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAYAAAAf8/9hAAAANklEQVR4nGNgGAWMWILgPyn6mPBJEtKMywCSABMOcUZixZlo5QJstmF1FRMDHcB/eljCMIQBAEXXAhP1iBcvAAAAAElFTkSuQmCC',
+  '/assets/icons/ui/scroll-arrow-left.png': 'data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAYAAAAf8/9hAAAAOElEQVR4nGNgGAWkgv/oAizkaiTWAJwaCRlAUCMMMFGiGZcBjJQaADOEKINwGUCyQcQCksJniAAADG4GFAeYHukAAAAASUVORK5CYII=',
+  '/assets/icons/ui/scroll-arrow-right.png': 'data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAYAAAAf8/9hAAAAOUlEQVR4nGNgGAXYwH9SFDPhMYQog3AZQLRBhAwgaBCxBiAbRJEBjOgCLORqJNYAnBrxAZLSwTAAAEcsCQ2KKa+3AAAAAElFTkSuQmCC',
+  '/assets/icons/ui/scroll-arrow-up.png': 'data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAYAAAAf8/9hAAAAMklEQVR4nGNgGAXEgP/4JJmI1PyfXAMIAiY8cui2/qerC/4TK85ECxf8J6CHkDzDSAMAF4YJBtuP8GwAAAAASUVORK5CYII=',
+  '/assets/icons/ui/scrollbar-thumb.png': 'data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAYAAAAf8/9hAAAAPUlEQVR4nGNkYGD4z0ABYAIR////JxmnpaUhDKAEMFGke9QAMGBioBAwjRrAQHEYsICI9PR0sg1gpDQ7AwDYQStf+gnExAAAAABJRU5ErkJggg==',
+  '/assets/icons/ui/scrollbar-track.png': 'data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAYAAAAf8/9hAAAAJ0lEQVR4nGP4/////zNnzvwnl2agRDMIMIy64P9oGPwfDYP/gyEMAMoUr67e6BjAAAAAAElFTkSuQmCC',
+  '/assets/icons/ui/zoom-button.png': 'data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAAAwAAAAMCAYAAABWdVznAAAAR0lEQVR4nGNkYGD4z0ACYAER//8Tp4eRkZGBiRTT4TYgm4AN/EdyAQs+SWyGMDGQCJhoroEFXQCXx7FqICY+SHYSyH6SkgYAh+AOH0R2A5QAAAAASUVORK5CYII=',
+}
+
+/** Returns the inlined data URI for an asset URL, or the URL itself. */
+export function inlineAssetUrl(url: string): string {
+  return INLINE_ASSETS[url] ?? url
+}
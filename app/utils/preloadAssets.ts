@@ -0,0 +1,23 @@
+// Generated by scripts/preload_assets.py - do not edit.
+
+export interface PreloadLink {
+  rel: 'preload'
+  as: 'image'
+  type: string
+  href: string
+  fetchpriority: 'high' | 'low' | 'auto'
+}
+
+/** Boot-critical images in load order, as <link rel="preload"> attributes. */
+export const PRELOAD_LINKS: PreloadLink[] = [
+  { rel: 'preload', as: 'image', type: 'image/png', href: '/assets/icons/system/happy-mac.png', fetchpriority: 'high' },
+  { rel: 'preload', as: 'image', type: 'image/png', href: '/assets/icons/system/preferences.png', fetchpriority: 'high' },
+  { rel: 'preload', as: 'image', type: 'image/png', href: '/assets/icons/system/finder.png', fetchpriority: 'high' },
+  { rel: 'preload', as: 'image', type: 'image/png', href: '/assets/icons/system/hard-drive.png', fetchpriority: 'high' },
+  { rel: 'preload', as: 'image', type: 'image/png', href: '/assets/icons/system/application.png', fetchpriority: 'high' },
+  { rel: 'preload', as: 'image', type: 'image/png', href: '/assets/icons/apps/calculator.png', fetchpriority: 'high' },
+  { rel: 'preload', as: 'image', type: 'image/png', href: '/assets/icons/apps/notepad.png', fetchpriority: 'high' },
+  { rel: 'preload', as: 'image', type: 'image/png', href: '/assets/icons/system/document.png', fetchpriority: 'auto' },
+  { rel: 'preload', as: 'image', type: 'image/png', href: '/assets/icons/apps/chat.png', fetchpriority: 'auto' },
+  { rel: 'preload', as: 'image', type: 'image/png', href: '/assets/icons/system/trash-empty.png', fetchpriority: 'auto' },
+]
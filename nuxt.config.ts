@@ -1,4 +1,6 @@
 // https://nuxt.com/docs/api/configuration/nuxt-config
+import { PRELOAD_LINKS } from './app/utils/preloadAssets'
+
 export default defineNuxtConfig({
   compatibilityDate: '2025-07-15',
   
@@ -33,7 +35,9 @@ export default defineNuxtConfig({
         { name: 'theme-color', content: '#CCCCCC' }
       ],
       link: [
-        { rel: 'icon', type: 'image/x-icon', href: '/favicon.ico' }
+        { rel: 'icon', type: 'image/x-icon', href: '/favicon.ico' },
+        // Boot-critical images, generated by scripts/preload_assets.py
+        ...PRELOAD_LINKS
       ]
     }
   },
@@ -0,0 +1,9 @@
+"""
+m00-os-7 Asset Generation Scripts
+
+Generators for the Mac OS 7 style assets in public/assets. Run the modules
+from the project root, e.g. ``python -m scripts.generate_icons --help``.
+
+Importing the package (or any generator module) does not load PIL or
+NumPy; they are loaded the first time a drawing or encoding stage runs.
+"""
@@ -0,0 +1,35 @@
+"""
+Deferred imports for the asset scripts.
+
+PIL and NumPy dominate the start-up time of every script, so the modules
+bind them through lazy_import() and only pay for them once a stage that
+draws or encodes actually runs. `--help` and argument errors return
+without loading either.
+"""
+
+import importlib.util
+import sys
+
+
+def lazy_import(name):
+    """
+    Return a module whose body runs on first attribute access.
+
+    Args:
+        name: Absolute module name, e.g. 'PIL.Image'
+
+    Returns:
+        The (possibly not yet executed) module object
+    """
+    if name in sys.modules:
+        return sys.modules[name]
+
+    spec = importlib.util.find_spec(name)
+    if spec is None:
+        raise ModuleNotFoundError(f'No module named {name!r}', name=name)
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
@@ -0,0 +1,327 @@
+#!/usr/bin/env python3
+"""
+m00-os-7 Asset Usage Analyser
+
+Cross-references the asset URLs in the app sources with the assets the
+generator units produce:
+
+    unused     generated assets no source refers to
+    missing    URLs in the sources that no generator produces
+    aliased    URLs in the sources of a duplicate image; refer to the
+               canonical copy instead, so it is fetched once
+    critical   the assets each boot phase (boot screen, login, desktop)
+               shows, ranked for preloading (see preload_assets.py)
+
+URLs are found as '/assets/...' literals in app/**/*.{vue,ts,css}. A
+template literal such as `/assets/icons/apps/${item.icon}.png` is a
+dynamic reference: it matches every asset of that shape, so none of them
+is reported unused. The app passes such URLs through resolveAssetUrl()
+(app/utils/assetAliases.ts) to map duplicates to their canonical copy.
+Modules generated by the asset scripts are not scanned.
+
+Boot phases list their critical URLs explicitly, in display order: which
+image a screen shows first (and which only appear on an error branch or
+after a click) cannot be told from the source text. Each listed URL must
+still be referenced by the phase's source and produced by a generator;
+entries that are not are reported as stale.
+
+The registry comes from rendering every unit of generate_assets.py (in
+parallel, without writing anything), so it reflects what the generators
+produce now rather than what happens to be in public/assets.
+
+Usage:
+    python -m scripts.analyze_assets [--asset URL ...] [--json FILE] [--jobs N]
+
+Exits with status 1 when the sources refer to missing or aliased assets,
+or a BOOT_PHASES entry is stale.
+"""
+
+import json
+import os
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, NamedTuple
+
+from .asset_utils import get_output_layout, write_json_asset
+from .build_log import add_logging_arguments, configure_from_args, info, print_summary
+
+
+SOURCE_DIR = 'app'
+SOURCE_EXTENSIONS = ('.vue', '.ts', '.css')
+
+# First line of the modules the asset scripts generate (inlineAssets.ts,
+# preloadAssets.ts, ...): derived from the assets, so not evidence of use
+GENERATED_HEADER = re.compile(r'(//|/\*) Generated by scripts/')
+
+# Phases on the way to a usable desktop, in order:
+# (name, fetch priority, source, URLs shown on entering the phase)
+BOOT_PHASES = [
+    ('boot', 'high', 'app/components/system/BootScreen.vue', [
+        '/assets/icons/system/happy-mac.png',
+        # Extensions parading along the bottom while booting
+        '/assets/icons/system/preferences.png',
+        '/assets/icons/system/finder.png',
+        '/assets/icons/system/hard-drive.png',
+        '/assets/icons/system/application.png',
+        '/assets/icons/apps/calculator.png',
+        '/assets/icons/apps/notepad.png',
+    ]),
+    # Avatar fallback of the user list
+    ('login', 'auto', 'app/components/system/LoginScreen.vue', [
+        '/assets/icons/system/document.png',
+    ]),
+    # Default desktop icons (Desktop.vue only adds icons on user actions)
+    ('desktop', 'auto', 'app/composables/useDesktop.ts', [
+        '/assets/icons/system/hard-drive.png',
+        '/assets/icons/system/document.png',
+        '/assets/icons/apps/chat.png',
+        '/assets/icons/system/trash-empty.png',
+    ]),
+]
+
+# '/assets/' followed by path characters and ${...} interpolations
+ASSET_URL = re.compile(r"/assets/(?:[A-Za-z0-9_.\-/]|\$\{[^}]*\})+")
+INTERPOLATION = re.compile(r"\$\{[^}]*\}")
+
+def get_project_dir():
+    return os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# ============================================
+# Source Scan
+# ============================================
+
+class AssetReference(NamedTuple):
+    url: str
+    source: str
+    line: int
+
+    @property
+    def dynamic(self) -> bool:
+        return '${' in self.url
+
+    def matches(self, url: str) -> bool:
+        if not self.dynamic:
+            return url == self.url
+        parts = INTERPOLATION.split(self.url)
+        pattern = '[^/]+'.join(re.escape(part) for part in parts)
+        return re.fullmatch(pattern, url) is not None
+
+def scan_sources(project_dir=None) -> List[AssetReference]:
+    """
+    Find asset URLs in the app sources.
+
+    Returns:
+        List of AssetReference in file and line order
+    """
+    project_dir = project_dir or get_project_dir()
+    references = []
+    for dirpath, dirnames, filenames in os.walk(os.path.join(project_dir, SOURCE_DIR)):
+        dirnames.sort()
+        for filename in sorted(filenames):
+            if not filename.endswith(SOURCE_EXTENSIONS):
+                continue
+            filepath = os.path.join(dirpath, filename)
+            source = os.path.relpath(filepath, project_dir).replace(os.sep, '/')
+            with open(filepath, encoding='utf-8') as f:
+                lines = f.read().splitlines()
+            if lines and GENERATED_HEADER.match(lines[0]):
+                continue
+            for lineno, line in enumerate(lines, 1):
+                for match in ASSET_URL.finditer(line):
+                    url = match.group(0).rstrip('.')
+                    # Directory mentions ('/assets/sounds/') in comments
+                    if not url.endswith('/'):
+                        references.append(AssetReference(url, source, lineno))
+    return references
+
+# ============================================
+# Generator Registry
+# ============================================
+
+def unit_outputs(generate) -> List[str]:
+    """Render one unit in a worker and return only its asset names."""
+    from .generate_assets import render_unit
+
+    outputs, _ = render_unit(generate)
+    root = get_output_layout().root
+    return [os.path.relpath(filepath, root).replace(os.sep, '/') for filepath, _ in outputs]
+
+def build_registry(jobs=None) -> Dict[str, str]:
+    """
+    Render every generator unit.
+
+    Returns:
+        Dict mapping asset URL to the name of the unit producing it
+    """
+    # Imported here: generate_assets itself uses this module after a build
+    from .generate_assets import IMAGE_UNITS, SOUND_UNITS
+
+    units = {**IMAGE_UNITS, **SOUND_UNITS}
+    info(f'Rendering {len(units)} units...')
+    registry = {}
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        futures = [(name, executor.submit(unit_outputs, generate)) for name, generate in units.items()]
+        for name, future in futures:
+            for asset in future.result():
+                registry.setdefault(f'/assets/{asset}', name)
+    return dict(sorted(registry.items()))
+
+def load_aliases(root) -> Dict[str, str]:
+    """Alias table of the last full build (duplicate URL -> canonical URL)."""
+    filepath = os.path.join(root, 'manifest.json')
+    if not os.path.exists(filepath):
+        return {}
+    with open(filepath, encoding='utf-8') as f:
+        return json.load(f).get('aliases', {})
+
+# ============================================
+# Analysis
+# ============================================
+
+def file_sizes(urls, root):
+    """Byte size of each URL's file below root (None if absent)."""
+    sizes = {}
+    for url in urls:
+        filepath = os.path.join(root, *url[len('/assets/'):].split('/'))
+        sizes[url] = os.path.getsize(filepath) if os.path.exists(filepath) else None
+    return sizes
+
+def analyze(references, registry, aliases=None, sizes=None):
+    """
+    Build the asset dependency graph.
+
+    Args:
+        references: AssetReference list from scan_sources()
+        registry: Asset URL -> unit, from build_registry()
+        aliases: Duplicate URL -> URL of an identical copy, from load_aliases()
+        sizes: URL -> byte size of the files as written (default: read
+            from public/assets)
+
+    Returns:
+        Dict with 'assets' (URL -> unit, identical copy, size and the
+        sources referring to it), 'unused', 'missing', 'aliased',
+        'critical' and 'stale_preloads' lists
+    """
+    aliases = aliases or {}
+    if sizes is None:
+        sizes = file_sizes(registry, get_output_layout().root)
+
+    assets = {}
+    for url, unit in registry.items():
+        assets[url] = {
+            'unit': unit,
+            'alias_of': aliases.get(url),
+            'bytes': sizes.get(url),
+            'referenced_by': [],
+        }
+
+    missing = []
+    aliased = []
+    for ref in references:
+        if not ref.dynamic and ref.url in aliases:
+            aliased.append({'url': ref.url, 'canonical': aliases[ref.url],
+                            'source': ref.source, 'line': ref.line})
+        matched = [url for url in assets if ref.matches(url)]
+        for url in matched:
+            location = f'{ref.source}:{ref.line}'
+            if location not in assets[url]['referenced_by']:
+                assets[url]['referenced_by'].append(location)
+        if not matched:
+            missing.append({'url': ref.url, 'source': ref.source, 'line': ref.line})
+
+    critical = {}
+    stale = []
+    for phase, priority, source, urls in BOOT_PHASES:
+        referenced = {ref.url for ref in references if ref.source == source}
+        for url in urls:
+            if url not in referenced or url not in assets:
+                stale.append({'url': url, 'phase': phase, 'source': source})
+            elif url not in critical:
+                critical[url] = {'url': url, 'bytes': assets[url]['bytes'],
+                                 'phase': phase, 'fetchpriority': priority}
+
+    return {
+        'assets': assets,
+        'unused': [url for url, asset in assets.items() if not asset['referenced_by']],
+        'missing': missing,
+        'aliased': aliased,
+        'critical': list(critical.values()),
+        'stale_preloads': stale,
+    }
+
+def format_report(graph) -> str:
+    """Format the unused/missing/critical lists, grouped by unit."""
+    lines = []
+    unused_bytes = sum(graph['assets'][url]['bytes'] or 0 for url in graph['unused'])
+    lines.append(f'Unused assets: {len(graph["unused"])} of {len(graph["assets"])} '
+                 f'({unused_bytes / 1024:.1f} KiB)')
+    by_unit = {}
+    for url in graph['unused']:
+        by_unit.setdefault(graph['assets'][url]['unit'], []).append(url)
+    for unit, urls in by_unit.items():
+        lines.append(f'  {unit} ({len(urls)})')
+        lines += [f'    {url}' for url in urls]
+
+    lines.append(f'Missing assets: {len(graph["missing"])}')
+    lines += [f'  {ref["url"]}  ({ref["source"]}:{ref["line"]})' for ref in graph['missing']]
+
+    if graph['aliased']:
+        lines.append(f'References to duplicates: {len(graph["aliased"])}')
+        lines += [f'  {ref["url"]} -> {ref["canonical"]}  ({ref["source"]}:{ref["line"]})'
+                  for ref in graph['aliased']]
+
+    critical_bytes = sum(entry['bytes'] or 0 for entry in graph['critical'])
+    lines.append(f'Critical path: {len(graph["critical"])} assets ({critical_bytes / 1024:.1f} KiB)')
+    lines += [f'  {entry["phase"]:<8} {entry["bytes"] or 0:>7}  {entry["url"]}'
+              for entry in graph['critical']]
+    if graph['stale_preloads']:
+        lines.append(f'Stale BOOT_PHASES entries: {len(graph["stale_preloads"])}')
+        lines += [f'  {entry["phase"]:<8} {entry["url"]}  (not generated or not in {entry["source"]})'
+                  for entry in graph['stale_preloads']]
+    return '\n'.join(lines)
+
+def format_lookup(graph, url) -> str:
+    """Reverse lookup: which unit produces an asset and which sources use it."""
+    asset = graph['assets'].get(url)
+    if asset is None:
+        return f'{url}: not generated'
+    lines = [f'{url}: generated by {asset["unit"]}'
+             + (f', identical to {asset["alias_of"]}' if asset['alias_of'] else '')]
+    lines += [f'  {location}' for location in asset['referenced_by']] or ['  (unused)']
+    return '\n'.join(lines)
+
+
+# ============================================
+# CLI Entry Point
+# ============================================
+
+if __name__ == '__main__':
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Cross-reference generated assets with app usage')
+    parser.add_argument('--asset', action='append', default=[],
+                        help='Show the unit and sources of an asset URL (repeatable)')
+    parser.add_argument('--json', default=None, help='Write the full dependency graph to this file')
+    parser.add_argument('--jobs', type=int, default=None,
+                        help='Number of render processes (default: CPU count)')
+    add_logging_arguments(parser)
+
+    args = parser.parse_args()
+    configure_from_args(args)
+
+    info('Scanning app sources...')
+    references = scan_sources()
+    registry = build_registry(args.jobs)
+    graph = analyze(references, registry, load_aliases(get_output_layout().root))
+
+    if args.asset:
+        for url in args.asset:
+            print(format_lookup(graph, url))
+    else:
+        print(format_report(graph))
+    if args.json:
+        write_json_asset(args.json, graph)
+        info(f'Wrote: {args.json}')
+    print_summary()
+    sys.exit(1 if graph['missing'] or graph['aliased'] or graph['stale_preloads'] else 0)
@@ -0,0 +1,308 @@
+#!/usr/bin/env python3
+"""
+m00-os-7 Asset Pack
+
+Stores the whole asset set in one uncompressed pack file, so a container
+image copies one layer-friendly file instead of hundreds of small ones.
+
+Pack layout (little-endian):
+
+    header    magic 'M00PACK1', entry count (u32), name blob size (u32)
+    index     one 24-byte entry per asset, sorted by name:
+              data offset (u64), data size (u64), name offset (u32), name size (u32)
+    names     UTF-8 asset names ('icons/system/folder.png'), concatenated
+    data      asset bytes, each starting on an 8-byte boundary; identical
+              files (pixel-identical assets) share one copy
+
+Entry i lives at a fixed offset (16 + 24 * i), so the reader binary-searches
+the memory-mapped index and returns assets as memoryview slices of the
+mapping, without copying or parsing the rest of the pack.
+
+Usage:
+    python -m scripts.asset_pack create [--source DIR] PACK
+    python -m scripts.asset_pack list PACK
+    python -m scripts.asset_pack extract PACK DEST [NAME ...]
+    python -m scripts.asset_pack serve PACK [--host HOST] [--port PORT]
+
+The pipelined build writes a pack directly with
+`python -m scripts.generate_assets --pack PACK`.
+"""
+
+import mimetypes
+import mmap
+import os
+import struct
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List
+
+from .asset_utils import get_assets_root, write_asset
+
+
+PACK_MAGIC = b'M00PACK1'
+HEADER = struct.Struct('<8sII')
+ENTRY = struct.Struct('<QQII')
+DATA_ALIGN = 8
+
+# ============================================
+# Writing
+# ============================================
+
+def encode_pack(files: Dict[str, bytes]) -> bytes:
+    """
+    Encode assets as a pack.
+
+    Args:
+        files: Dict mapping asset names ('icons/system/folder.png') to bytes
+
+    Returns:
+        The complete pack
+    """
+    names = sorted(files)
+    encoded_names = [name.encode('utf-8') for name in names]
+    name_blob = b''.join(encoded_names)
+
+    head_size = HEADER.size + ENTRY.size * len(names) + len(name_blob)
+    offset = head_size + (-head_size) % DATA_ALIGN
+
+    index = []
+    chunks = []
+    # bytes -> data offset, so duplicates point at the first copy
+    stored = {}
+    name_offset = 0
+    for name, encoded in zip(names, encoded_names):
+        data = files[name]
+        data_offset = stored.get(data)
+        if data_offset is None:
+            data_offset = stored[data] = offset
+            padding = (-len(data)) % DATA_ALIGN
+            chunks.append(data + b'\0' * padding)
+            offset += len(data) + padding
+        index.append(ENTRY.pack(data_offset, len(data), name_offset, len(encoded)))
+        name_offset += len(encoded)
+
+    head = HEADER.pack(PACK_MAGIC, len(names), len(name_blob)) + b''.join(index) + name_blob
+    return head + b'\0' * ((-len(head)) % DATA_ALIGN) + b''.join(chunks)
+
+class PackWriter:
+    """
+    Output sink collecting assets for one pack.
+
+    write() has the signature of asset_utils.write_asset(), so the writer
+    can stand in for it (e.g. as the AssetPipeline sink).
+    """
+
+    def __init__(self, path: str, root: str):
+        self.path = path
+        self.root = root
+        self.files: Dict[str, bytes] = {}
+
+    def write(self, filepath: str, data: bytes) -> bool:
+        name = os.path.relpath(filepath, self.root).replace(os.sep, '/')
+        self.files[name] = bytes(data)
+        return True
+
+    def read(self, filepath: str) -> bytes:
+        """Read back a file written with write() (stands in for read_asset())."""
+        return self.files[os.path.relpath(filepath, self.root).replace(os.sep, '/')]
+
+    def close(self) -> bool:
+        """Write the pack (atomically, and only if it changed)."""
+        return write_asset(self.path, encode_pack(self.files))
+
+def pack_directory(source: str, path: str) -> int:
+    """
+    Pack every file below a directory.
+
+    Returns:
+        Number of packed assets
+    """
+    writer = PackWriter(path, source)
+    for dirpath, _, filenames in os.walk(source):
+        for filename in filenames:
+            filepath = os.path.join(dirpath, filename)
+            if os.path.abspath(filepath) == os.path.abspath(path):
+                continue
+            with open(filepath, 'rb') as f:
+                writer.write(filepath, f.read())
+    writer.close()
+    return len(writer.files)
+
+# ============================================
+# Reading
+# ============================================
+
+class AssetPack:
+    """
+    Memory-mapped, read-only view of a pack.
+
+    get() returns memoryview slices of the mapping; release them before
+    close() (or leaving the with block).
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, 'rb') as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self._view = memoryview(self._mmap)
+
+        magic, self._count, self._names_size = HEADER.unpack_from(self._mmap, 0)
+        if magic != PACK_MAGIC:
+            self.close()
+            raise ValueError(f'Not an asset pack: {path}')
+        self._names_start = HEADER.size + ENTRY.size * self._count
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __len__(self):
+        return self._count
+
+    def __contains__(self, name):
+        return self._find(name.encode('utf-8')) is not None
+
+    def close(self) -> None:
+        self._view.release()
+        self._mmap.close()
+
+    def _entry(self, i):
+        return ENTRY.unpack_from(self._mmap, HEADER.size + ENTRY.size * i)
+
+    def _name(self, i) -> bytes:
+        _, _, name_offset, name_size = self._entry(i)
+        start = self._names_start + name_offset
+        return self._mmap[start:start + name_size]
+
+    def _find(self, name: bytes):
+        lo, hi = 0, self._count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._name(mid) < name:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo < self._count and self._name(lo) == name:
+            return lo
+        return None
+
+    def names(self) -> List[str]:
+        return [self._name(i).decode('utf-8') for i in range(self._count)]
+
+    def get(self, name: str) -> memoryview:
+        """
+        Look up an asset without copying it.
+
+        Raises:
+            KeyError: If the pack has no such asset
+        """
+        i = self._find(name.encode('utf-8'))
+        if i is None:
+            raise KeyError(name)
+        offset, size, _, _ = self._entry(i)
+        return self._view[offset:offset + size]
+
+    def extract(self, name: str, dest: str) -> str:
+        """
+        Write one asset below dest; returns its path.
+
+        Raises:
+            KeyError: If the pack has no such asset
+            ValueError: If the asset name would resolve outside dest
+                (absolute, '..' or through a symlink)
+        """
+        root = os.path.realpath(dest)
+        filepath = os.path.realpath(os.path.join(root, *name.split('/')))
+        if os.path.commonpath([root, filepath]) != root or filepath == root:
+            raise ValueError(f'Asset name escapes {dest}: {name!r}')
+        os.makedirs(os.path.dirname(filepath), exist_ok=True)
+        with self.get(name) as data, open(filepath, 'wb') as f:
+            f.write(data)
+        return filepath
+
+# ============================================
+# HTTP Service
+# ============================================
+
+class PackRequestHandler(BaseHTTPRequestHandler):
+    """Serves GET /assets/<name> straight from the mapped pack."""
+
+    pack = None
+
+    def do_GET(self):
+        path = self.path.split('?', 1)[0]
+        if not path.startswith('/assets/'):
+            self.send_error(404)
+            return
+        name = path[len('/assets/'):]
+        try:
+            data = self.pack.get(name)
+        except KeyError:
+            self.send_error(404)
+            return
+
+        with data:
+            self.send_response(200)
+            self.send_header('Content-Type', mimetypes.guess_type(name)[0] or 'application/octet-stream')
+            self.send_header('Content-Length', str(len(data)))
+            self.send_header('Cache-Control', 'public, max-age=3600')
+            self.end_headers()
+            self.wfile.write(data)
+
+def create_server(pack, host='127.0.0.1', port=8078):
+    """Create (but do not start) a server for an open AssetPack."""
+    handler = type('Handler', (PackRequestHandler,), {'pack': pack})
+    return ThreadingHTTPServer((host, port), handler)
+
+
+# ============================================
+# CLI Entry Point
+# ============================================
+
+if __name__ == '__main__':
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Create and read Mac OS 7 asset packs')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    create = commands.add_parser('create', help='Pack a directory of generated assets')
+    create.add_argument('pack', help='Pack file to write')
+    create.add_argument('--source', default=None, help='Directory to pack (default: public/assets)')
+
+    list_ = commands.add_parser('list', help='List the assets in a pack')
+    list_.add_argument('pack')
+
+    extract = commands.add_parser('extract', help='Extract assets from a pack')
+    extract.add_argument('pack')
+    extract.add_argument('dest', help='Directory to extract into')
+    extract.add_argument('names', nargs='*', help='Assets to extract (default: all)')
+
+    serve = commands.add_parser('serve', help='Serve a pack over HTTP at /assets/')
+    serve.add_argument('pack')
+    serve.add_argument('--host', default='127.0.0.1', help='Address to bind (default: %(default)s)')
+    serve.add_argument('--port', type=int, default=8078, help='Port to listen on (default: %(default)s)')
+
+    args = parser.parse_args()
+
+    if args.command == 'create':
+        count = pack_directory(args.source or get_assets_root(), args.pack)
+        print(f'Packed {count} assets ({os.path.getsize(args.pack)} bytes): {args.pack}')
+    else:
+        with AssetPack(args.pack) as pack:
+            if args.command == 'list':
+                for name in pack.names():
+                    with pack.get(name) as data:
+                        print(f'{len(data):>9}  {name}')
+            elif args.command == 'extract':
+                for name in args.names or pack.names():
+                    print(f'Extracted: {pack.extract(name, args.dest)}')
+            else:
+                server = create_server(pack, args.host, args.port)
+                print(f'Serving {len(pack)} assets on http://{args.host}:{args.port}/assets/')
+                try:
+                    server.serve_forever()
+                except KeyboardInterrupt:
+                    pass
+                finally:
+                    server.server_close()
@@ -0,0 +1,347 @@
+#!/usr/bin/env python3
+"""
+m00-os-7 On-Demand Asset Server
+
+Small local HTTP service that renders assets on request with the existing
+generator functions, so rarely used variants (other sizes, scales, theme
+colours) can be produced lazily instead of being built up front.
+
+Rendered PNG bytes are kept in a bounded LRU cache and served with strong
+ETags; hot variants are answered straight from memory.
+
+The first request for a group (icons, cursors, patterns, cards) runs its
+generator in a worker process, which keeps the generators' module state
+(capture_assets(), defer_writes()) and their logging out of the server's
+request threads; the images come back to the server and are kept.
+
+Request format:
+    GET /assets/<subdir>/<name>.png[?size=N][&scale=N][&theme=NAME][&<color>=RRGGBB ...]
+
+    size   Re-render a template-based icon (folder, document, trash) at
+           16, 32 or 48 px
+    scale  Integer nearest-neighbour upscale (1-8)
+    theme  Theme name from generate_themes.THEMES
+    <color> Override any COLORS entry, e.g. folder_yellow=ff6666
+
+Examples:
+    /assets/icons/avatars/avatar-mac.png?scale=2
+    /assets/icons/system/folder.png?size=48&folder_yellow=ff6666
+    /assets/patterns/bricks.png?theme=graphite
+
+Usage:
+    python -m scripts.asset_server [--host HOST] [--port PORT] [--cache-size N] [--jobs N]
+"""
+
+import os
+import io
+import hashlib
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit, parse_qs
+
+from ._lazy import lazy_import
+from .asset_utils import (
+    COLORS, ICON_SIZE_SMALL, ICON_SIZE_STANDARD, capture_assets, create_template_icon, add_shadow,
+    defer_writes, draw_folder_base, draw_document_base, draw_trash_base,
+    palette_index, remap_palette
+)
+from .build_log import add_logging_arguments, configure_from_args, info, print_summary
+from . import generate_cards
+from . import generate_icons
+from . import generate_patterns
+from . import generate_themes
+
+Image = lazy_import('PIL.Image')
+ImageDraw = lazy_import('PIL.ImageDraw')
+np = lazy_import('numpy')
+
+
+# ============================================
+# Asset Rendering
+# ============================================
+
+# Generator run to render every asset of a subdirectory group
+GROUP_GENERATORS = {
+    'icons': generate_icons.generate_all_icons,
+    'cursors': generate_icons.generate_cursors,
+    'patterns': generate_patterns.generate_all,
+    'cards': generate_cards.generate_cards,
+}
+
+# Icons built on an asset_utils template, which can be drawn at any size
+# as (template, template arguments)
+TEMPLATE_ICONS = {
+    'icons/system/folder': (draw_folder_base, {}),
+    'icons/system/document': (draw_document_base, {}),
+    'icons/system/trash-empty': (draw_trash_base, {'is_full': False}),
+    'icons/system/trash-full': (draw_trash_base, {'is_full': True}),
+}
+
+TEMPLATE_SIZES = (16, 32, 48)
+MAX_SCALE = 8
+
+class AssetError(Exception):
+    """Raised for a request that cannot be rendered."""
+
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+def render_group(group):
+    """Run a group's generator (in a worker process); returns its images by asset key."""
+    with defer_writes(), capture_assets() as captured:
+        GROUP_GENERATORS[group]()
+    return captured
+
+class AssetRenderer:
+    """Renders assets from request parameters, caching base renders per group."""
+
+    def __init__(self, jobs=1):
+        self._lock = threading.Lock()
+        self._executor = ProcessPoolExecutor(max_workers=jobs)
+        # Group -> future of its render_group() images
+        self._groups = {}
+        # Request threads draw, recolour and encode with the lazily bound
+        # modules; importlib's LazyLoader is not thread-safe before Python
+        # 3.12, so load them here rather than on the first concurrent use
+        for module in (Image, ImageDraw, np):
+            getattr(module, '__name__')
+
+    def base_asset(self, key):
+        """Return the default rendering of an asset key such as 'icons/system/folder'."""
+        group = key.split('/', 1)[0]
+        if group not in GROUP_GENERATORS:
+            raise AssetError(404, f'Unknown asset group: {group}')
+
+        # Requests arriving while a group renders wait for the same result
+        with self._lock:
+            future = self._groups.get(group)
+            if future is None:
+                future = self._groups[group] = self._executor.submit(render_group, group)
+        assets = future.result()
+
+        if key not in assets:
+            raise AssetError(404, f'Unknown asset: {key}')
+        return assets[key]
+
+    def close(self):
+        """Stop the render workers."""
+        self._executor.shutdown(cancel_futures=True)
+
+    def template_asset(self, key, size):
+        """Draw a template-based icon at the given square size."""
+        if key not in TEMPLATE_ICONS:
+            raise AssetError(400, f'{key} has a fixed size')
+        if size not in TEMPLATE_SIZES:
+            raise AssetError(400, f'size must be one of {TEMPLATE_SIZES}')
+
+        template, kwargs = TEMPLATE_ICONS[key]
+        # The asset_utils template cache is not thread-safe
+        with self._lock:
+            img, _ = create_template_icon(template, size=(size, size), **kwargs)
+        # Small icons are drawn without a shadow, like generate_small_system_icons()
+        if (size, size) != ICON_SIZE_SMALL:
+            img = add_shadow(img)
+        return img
+
+    def render(self, key, size=None, scale=1, color_map=None):
+        """
+        Render an asset variant.
+
+        Args:
+            key: Asset key ('<subdir>/<name>')
+            size: Square size for template icons, or None for the default
+            scale: Integer nearest-neighbour upscale factor
+            color_map: Mapping of source RGB to replacement RGB
+
+        Returns:
+            PNG-encoded bytes
+        """
+        if size is None:
+            img = self.base_asset(key)
+        else:
+            img = self.template_asset(key, size)
+
+        if color_map:
+            mode = 'RGB' if img.mode == 'RGB' else 'RGBA'
+            img = remap_palette(*palette_index(img), color_map, mode)
+
+        if scale != 1:
+            img = img.resize((img.width * scale, img.height * scale), Image.NEAREST)
+
+        buffer = io.BytesIO()
+        img.save(buffer, 'PNG')
+        return buffer.getvalue()
+
+def parse_color_map(params):
+    """Build an RGB lookup from the theme and per-colour query parameters."""
+    color_map = {}
+
+    theme_name = params.pop('theme', None)
+    if theme_name is not None:
+        if theme_name not in generate_themes.THEMES:
+            raise AssetError(400, f'Unknown theme: {theme_name}')
+        color_map.update(generate_themes.get_color_map(generate_themes.THEMES[theme_name]))
+
+    for name, value in params.items():
+        if name not in COLORS:
+            raise AssetError(400, f'Unknown parameter: {name}')
+        try:
+            color = bytes.fromhex(value)
+        except ValueError:
+            color = b''
+        if len(color) != 3:
+            raise AssetError(400, f'{name} must be an RRGGBB hex colour')
+        color_map[COLORS[name]] = tuple(color)
+
+    return color_map
+
+def parse_int(params, name, default):
+    value = params.pop(name, None)
+    if value is None:
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        raise AssetError(400, f'{name} must be an integer')
+
+# ============================================
+# LRU Cache
+# ============================================
+
+class LRUCache:
+    """Thread-safe LRU cache of rendered responses, bounded by entry count."""
+
+    def __init__(self, max_entries=256):
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def put(self, key, entry):
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def __len__(self):
+        return len(self._entries)
+
+# ============================================
+# HTTP Service
+# ============================================
+
+class AssetRequestHandler(BaseHTTPRequestHandler):
+    """Serves GET /assets/... requests from the renderer and cache."""
+
+    renderer = None
+    cache = None
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        if not url.path.startswith('/assets/') or not url.path.endswith('.png'):
+            self.send_error(404)
+            return
+
+        key = url.path[len('/assets/'):-len('.png')]
+        params = {name: values[-1] for name, values in parse_qs(url.query).items()}
+
+        try:
+            size = parse_int(params, 'size', None)
+            scale = parse_int(params, 'scale', 1)
+            if not 1 <= scale <= MAX_SCALE:
+                raise AssetError(400, f'scale must be between 1 and {MAX_SCALE}')
+            color_map = parse_color_map(params)
+            # The default rendering of a template icon is already that size
+            if key in TEMPLATE_ICONS and (size, size) == ICON_SIZE_STANDARD:
+                size = None
+
+            cache_key = (key, size, scale, tuple(sorted(color_map.items())))
+            entry = self.cache.get(cache_key)
+            if entry is None:
+                body = self.renderer.render(key, size, scale, color_map)
+                etag = '"%s"' % hashlib.sha1(body).hexdigest()[:16]
+                entry = (body, etag)
+                self.cache.put(cache_key, entry)
+        except AssetError as e:
+            self.send_error(e.status, str(e))
+            return
+        except Exception as e:
+            # A failing generator or a broken worker pool: answer rather
+            # than drop the connection
+            self.log_error('Rendering %s failed: %r', self.path, e)
+            self.send_error(500)
+            return
+
+        body, etag = entry
+        if self.headers.get('If-None-Match') == etag:
+            self.send_response(304)
+            self.send_header('ETag', etag)
+            self.end_headers()
+            return
+
+        self.send_response(200)
+        self.send_header('Content-Type', 'image/png')
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('ETag', etag)
+        self.send_header('Cache-Control', 'public, max-age=3600')
+        self.end_headers()
+        self.wfile.write(body)
+
+def create_server(host='127.0.0.1', port=8077, cache_size=256, jobs=1):
+    """
+    Create (but do not start) the asset server.
+
+    Call server.RequestHandlerClass.renderer.close() after server_close()
+    to stop the render workers.
+    """
+    handler = type('Handler', (AssetRequestHandler,), {
+        'renderer': AssetRenderer(jobs),
+        'cache': LRUCache(cache_size),
+    })
+    return ThreadingHTTPServer((host, port), handler)
+
+
+# ============================================
+# CLI Entry Point
+# ============================================
+
+if __name__ == '__main__':
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Serve Mac OS 7 style assets on demand')
+    parser.add_argument('--host', default='127.0.0.1', help='Address to bind (default: %(default)s)')
+    parser.add_argument('--port', type=int, default=8077, help='Port to listen on (default: %(default)s)')
+    parser.add_argument('--cache-size', type=int, default=256,
+                        help='Maximum number of rendered variants kept in memory (default: %(default)s)')
+    parser.add_argument('--jobs', type=int, default=1,
+                        help='Number of render processes (default: %(default)s)')
+    add_logging_arguments(parser)
+
+    args = parser.parse_args()
+    configure_from_args(args)
+
+    server = create_server(args.host, args.port, args.cache_size, args.jobs)
+    info(f'Serving assets on http://{args.host}:{args.port}/assets/')
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        server.RequestHandlerClass.renderer.close()
+        print_summary()
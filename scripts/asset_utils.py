@@ -5,9 +5,25 @@ Base utilities for generating Mac OS 7 style assets using PIL.
 Includes color palette, icon templates, and common drawing functions.
 """
 
-from PIL import Image, ImageDraw
-from typing import Tuple, Optional
+from __future__ import annotations
+
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Tuple, Optional
+import hashlib
+import io
+import json
 import os
+import struct
+import time
+
+from ._lazy import lazy_import
+from .build_log import event
+
+# Bound lazily; annotations are strings, so only calls load PIL and NumPy
+Image = lazy_import('PIL.Image')
+ImageDraw = lazy_import('PIL.ImageDraw')
+np = lazy_import('numpy')
 
 # ============================================
 # Mac OS 7 Color Palette (Classic 16-color)
@@ -59,14 +75,90 @@ ICON_SIZE_LARGE = (48, 48)
 # Output Directories
 # ============================================
 
+# Subdirectories the generators write into, created up front for each build
+OUTPUT_SUBDIRS = [
+    'icons', 'icons/system', 'icons/apps', 'icons/ui', 'icons/avatars', 'icons/labels',
+    'cursors', 'patterns', 'cards', 'sounds',
+]
+
+def get_assets_root() -> str:
+    """Get the public/assets directory of the project."""
+    base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    return os.path.join(base_dir, 'public', 'assets')
+
+class OutputLayout:
+    """
+    Output directories of one build, resolved once.
+
+    The known subdirectories are created and checked for writability when
+    the layout is built. Any other subdirectory is only resolved and
+    remembered, so saving an asset costs a dict lookup instead of a
+    makedirs() call; write_asset() creates it with the first file written
+    there. Outputs that never reach the disk (deferred to a pipeline whose
+    sink is an asset pack) leave no empty directories behind.
+    """
+
+    def __init__(self, root: Optional[str] = None, subdirs: List[str] = OUTPUT_SUBDIRS):
+        self.root = os.path.abspath(root or get_assets_root())
+        self._dirs: Dict[str, str] = {}
+        self.prepare([''] + list(subdirs))
+
+    def prepare(self, subdirs: List[str]) -> None:
+        """
+        Create and validate a batch of subdirectories.
+
+        Raises:
+            PermissionError: If a directory cannot be written to
+        """
+        for subdir in subdirs:
+            if subdir in self._dirs:
+                continue
+            path = os.path.join(self.root, subdir) if subdir else self.root
+            os.makedirs(path, exist_ok=True)
+            if not os.access(path, os.W_OK):
+                raise PermissionError(f'Output directory is not writable: {path}')
+            self._dirs[subdir] = path
+
+    def path(self, subdir: str = '') -> str:
+        """Get the directory for a subdirectory of the assets root (not created)."""
+        path = self._dirs.get(subdir)
+        if path is None:
+            path = self._dirs[subdir] = os.path.join(self.root, *subdir.split('/'))
+        return path
+
+    def file(self, subdir: str, filename: str) -> str:
+        """Get the output path of a file in a subdirectory."""
+        return os.path.join(self.path(subdir), filename)
+
+# Layout of the running build; see get_output_layout() and output_layout()
+_output_layout: Optional[OutputLayout] = None
+
+def get_output_layout() -> OutputLayout:
+    """Get the active output layout, creating the default one on first use."""
+    global _output_layout
+    if _output_layout is None:
+        _output_layout = OutputLayout()
+    return _output_layout
+
+@contextmanager
+def output_layout(root: Optional[str] = None) -> Iterator[OutputLayout]:
+    """
+    Direct a build into another assets root.
+
+    Yields:
+        The layout used by save_icon(), get_output_dir() etc. while active
+    """
+    global _output_layout
+    previous = _output_layout
+    _output_layout = OutputLayout(root)
+    try:
+        yield _output_layout
+    finally:
+        _output_layout = previous
+
 def get_output_dir(subdir: str = '') -> str:
     """Get the output directory for generated assets."""
-    base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-    output_dir = os.path.join(base_dir, 'public', 'assets')
-    if subdir:
-        output_dir = os.path.join(output_dir, subdir)
-    os.makedirs(output_dir, exist_ok=True)
-    return output_dir
+    return get_output_layout().path(subdir)
 
 # ============================================
 # Image Creation Utilities
@@ -172,6 +264,141 @@ def draw_border(
     for i in range(width):
         draw.rectangle([x1 + i, y1 + i, x2 - i, y2 - i], outline=color)
 
+# ============================================
+# Asset Writer
+# ============================================
+
+_write_stats = {'written': 0, 'unchanged': 0}
+
+# Set while defer_writes() is active
+_deferred_writes: Optional[List[tuple]] = None
+
+def encode_png(img: Image.Image, optimize: bool = False) -> bytes:
+    """Encode an image as PNG bytes."""
+    buffer = io.BytesIO()
+    img.save(buffer, 'PNG', optimize=optimize)
+    return buffer.getvalue()
+
+def pixel_hash(img: Image.Image) -> str:
+    """Hash an image's mode, size and pixel buffer (not its encoding)."""
+    digest = hashlib.sha256(f'{img.mode} {img.width}x{img.height}\n'.encode('ascii'))
+    digest.update(img.tobytes())
+    return digest.hexdigest()
+
+def write_asset(filepath: str, data: bytes) -> bool:
+    """
+    Write a generated file atomically, skipping it if nothing changed.
+
+    The encoded bytes are compared with the existing file by hash; an
+    identical file is left alone, so its mtime (and the dev server's file
+    watchers) are not disturbed. Otherwise the data goes to a temporary
+    file in the same directory, which is renamed over the target, so a
+    crash never leaves a truncated asset behind. A missing directory is
+    created.
+
+    Args:
+        filepath: Destination path
+        data: Complete file contents
+
+    Returns:
+        True if the file was written (or deferred), False if it was
+        already up to date
+    """
+    if _deferred_writes is not None:
+        _deferred_writes.append((filepath, data))
+        return True
+
+    start = time.perf_counter()
+    try:
+        if os.path.getsize(filepath) == len(data):
+            with open(filepath, 'rb') as f:
+                existing = hashlib.sha256(f.read()).digest()
+            if existing == hashlib.sha256(data).digest():
+                _write_stats['unchanged'] += 1
+                event('write', filepath, time.perf_counter() - start, len(data), status='unchanged')
+                return False
+    except FileNotFoundError:
+        pass
+
+    tmp_path = f'{filepath}.{os.getpid()}.tmp'
+    try:
+        try:
+            f = open(tmp_path, 'wb')
+        except FileNotFoundError:
+            # First file in a directory OutputLayout only resolved
+            os.makedirs(os.path.dirname(filepath), exist_ok=True)
+            f = open(tmp_path, 'wb')
+        with f:
+            f.write(data)
+        os.replace(tmp_path, filepath)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    _write_stats['written'] += 1
+    event('write', filepath, time.perf_counter() - start, len(data), status='written')
+    return True
+
+def read_asset(filepath: str) -> bytes:
+    """Read back a file written by write_asset()."""
+    with open(filepath, 'rb') as f:
+        return f.read()
+
+def write_text_asset(filepath: str, text: str) -> bool:
+    """write_asset() for UTF-8 text."""
+    return write_asset(filepath, text.encode('utf-8'))
+
+def write_json_asset(filepath: str, data) -> bool:
+    """write_asset() for a JSON document (2-space indent, trailing newline)."""
+    return write_text_asset(filepath, json.dumps(data, indent=2) + '\n')
+
+def write_stats() -> Dict[str, int]:
+    """Report how many files this process wrote and left unchanged."""
+    return dict(_write_stats)
+
+# Set while capture_assets() is active
+_captured_assets: Optional[Dict[str, Image.Image]] = None
+
+@contextmanager
+def capture_assets() -> Iterator[Dict[str, Image.Image]]:
+    """
+    Collect saved assets in memory instead of writing them to disk.
+
+    While active, save_icon() stores each image under its asset key
+    ('<subdir>/<name>', e.g. 'icons/system/folder') in the yielded dict.
+
+    Yields:
+        Dict mapping asset keys to images
+    """
+    global _captured_assets
+    previous = _captured_assets
+    _captured_assets = {}
+    try:
+        yield _captured_assets
+    finally:
+        _captured_assets = previous
+
+@contextmanager
+def defer_writes() -> Iterator[List[tuple]]:
+    """
+    Collect outputs instead of encoding and writing them.
+
+    While active, save_icon() appends (filepath, image) and write_asset()
+    appends (filepath, bytes) to the yielded list, so a build pipeline can
+    encode and write them elsewhere (see pipeline.py). capture_assets()
+    takes precedence for images.
+
+    Yields:
+        List of (filepath, image or bytes) tuples in save order
+    """
+    global _deferred_writes
+    previous = _deferred_writes
+    _deferred_writes = []
+    try:
+        yield _deferred_writes
+    finally:
+        _deferred_writes = previous
+
 def save_icon(img: Image.Image, name: str, subdir: str = 'icons') -> str:
     """
     Save an icon to the output directory.
@@ -184,12 +411,214 @@ def save_icon(img: Image.Image, name: str, subdir: str = 'icons') -> str:
     Returns:
         Full path to saved file
     """
-    output_dir = get_output_dir(subdir)
-    filepath = os.path.join(output_dir, f'{name}.png')
-    img.save(filepath, 'PNG')
-    print(f'Saved: {filepath}')
+    if _captured_assets is not None:
+        _captured_assets[f'{subdir}/{name}'] = img
+        return f'{subdir}/{name}.png'
+
+    filepath = get_output_layout().file(subdir, f'{name}.png')
+    if _deferred_writes is not None:
+        _deferred_writes.append((filepath, img))
+        return filepath
+
+    start = time.perf_counter()
+    data = encode_png(img)
+    event('encode', filepath, time.perf_counter() - start, len(data))
+    write_asset(filepath, data)
     return filepath
 
+# ============================================
+# Sprite Strips
+# ============================================
+
+def render_strip(
+    draw_frame,
+    count: int,
+    size: Tuple[int, int] = ICON_SIZE_STANDARD
+) -> Tuple[Image.Image, List[Image.Image]]:
+    """
+    Render an animation into one horizontal sprite strip.
+
+    Args:
+        draw_frame: Called as draw_frame(draw, index) for each frame
+        count: Number of frames
+        size: Frame dimensions (width, height)
+
+    Returns:
+        Tuple of (strip image, list of frame images)
+    """
+    w, h = size
+    strip = Image.new('RGBA', (w * count, h), (0, 0, 0, 0))
+    frames = []
+    for i in range(count):
+        img, draw = create_icon(size=size)
+        draw_frame(draw, i)
+        strip.paste(img, (i * w, 0))
+        frames.append(img)
+    return strip, frames
+
+# ============================================
+# Cursor Files
+# ============================================
+
+def encode_cur(img: Image.Image, hotspot: Tuple[int, int]) -> bytes:
+    """
+    Encode an image as a Windows .cur file (32-bit BGRA DIB with AND mask).
+
+    Args:
+        img: Cursor image
+        hotspot: Hotspot (x, y) in pixels
+
+    Returns:
+        .cur file bytes
+    """
+    pixels = np.asarray(img.convert('RGBA'))
+    height, width = pixels.shape[:2]
+
+    # DIB rows are stored bottom-up as BGRA
+    bgra = pixels[::-1, :, [2, 1, 0, 3]].tobytes()
+    # 1-bit AND mask (1 = transparent), rows padded to 32 bits
+    transparent = pixels[::-1, :, 3] == 0
+    mask_stride = ((width + 31) // 32) * 4
+    mask_rows = np.packbits(transparent, axis=1)
+    mask = np.zeros((height, mask_stride), dtype=np.uint8)
+    mask[:, :mask_rows.shape[1]] = mask_rows
+
+    info_header = struct.pack(
+        '<IiiHHIIiiII', 40, width, height * 2, 1, 32, 0,
+        len(bgra) + mask.size, 0, 0, 0, 0
+    )
+    image_data = info_header + bgra + mask.tobytes()
+
+    header = struct.pack('<HHH', 0, 2, 1)
+    entry = struct.pack(
+        '<BBBBHHII', width % 256, height % 256, 0, 0,
+        hotspot[0], hotspot[1], len(image_data), 6 + 16
+    )
+    return header + entry + image_data
+
+def encode_ani(
+    frames: List[Image.Image],
+    hotspot: Tuple[int, int],
+    frame_ms: int
+) -> bytes:
+    """
+    Encode frames as an animated .ani cursor (RIFF 'ACON' of .cur frames).
+
+    Args:
+        frames: Cursor frames, all the same size
+        hotspot: Hotspot (x, y) in pixels
+        frame_ms: Display time of each frame in milliseconds
+
+    Returns:
+        .ani file bytes
+    """
+    def chunk(chunk_id: bytes, data: bytes) -> bytes:
+        padding = b'\0' if len(data) % 2 else b''
+        return chunk_id + struct.pack('<I', len(data)) + data + padding
+
+    # Rates are in jiffies (1/60 s); flag 1 = frames are icon/cursor data
+    jiffies = max(1, round(frame_ms * 60 / 1000))
+    anih = struct.pack('<9I', 36, len(frames), len(frames), 0, 0, 0, 0, jiffies, 1)
+    icons = b''.join(chunk(b'icon', encode_cur(frame, hotspot)) for frame in frames)
+    body = b'ACON' + chunk(b'anih', anih) + chunk(b'LIST', b'fram' + icons)
+    return b'RIFF' + struct.pack('<I', len(body)) + body
+
+def save_cursor(
+    frames: List[Image.Image],
+    name: str,
+    hotspot: Tuple[int, int],
+    frame_ms: int = 0,
+    subdir: str = 'cursors'
+) -> Optional[str]:
+    """
+    Save a native cursor: .cur for one frame, .ani for an animation.
+
+    Args:
+        frames: Cursor frames
+        name: Filename (without extension)
+        hotspot: Hotspot (x, y) in pixels
+        frame_ms: Display time per frame for animated cursors
+        subdir: Subdirectory within assets
+
+    Returns:
+        Full path to saved file, or None while capture_assets() is active
+    """
+    if _captured_assets is not None:
+        return None
+
+    if len(frames) == 1:
+        filename, data = f'{name}.cur', encode_cur(frames[0], hotspot)
+    else:
+        filename, data = f'{name}.ani', encode_ani(frames, hotspot, frame_ms)
+
+    filepath = get_output_layout().file(subdir, filename)
+    write_asset(filepath, data)
+    return filepath
+
+# ============================================
+# Palette Indexing
+# ============================================
+
+def palette_index(img: Image.Image) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Split an image into palette-index form.
+
+    Every asset is drawn from the COLORS palette, so an image is fully
+    described by its distinct RGB colours, a per-pixel index into them and
+    its alpha channel.
+
+    Args:
+        img: Source image (any mode)
+
+    Returns:
+        Tuple of (palette, indices, alpha): palette is an (N, 3) uint8 array
+        of distinct colours, indices an (H, W) array into palette and alpha
+        an (H, W) uint8 array
+    """
+    arr = np.asarray(img.convert('RGBA'))
+    rgb = arr[..., :3].astype(np.uint32)
+    keys = (rgb[..., 0] << 16) | (rgb[..., 1] << 8) | rgb[..., 2]
+    unique, inverse = np.unique(keys, return_inverse=True)
+    palette = np.stack(
+        [(unique >> 16) & 0xFF, (unique >> 8) & 0xFF, unique & 0xFF], axis=1
+    ).astype(np.uint8)
+    return palette, inverse.reshape(keys.shape), arr[..., 3]
+
+def remap_palette(
+    palette: np.ndarray,
+    indices: np.ndarray,
+    alpha: np.ndarray,
+    color_map: Dict[Tuple[int, int, int], Tuple[int, int, int]],
+    mode: str = 'RGBA'
+) -> Image.Image:
+    """
+    Rebuild an image from palette-index form, recolouring through a LUT.
+
+    Only the palette entries are looked up in color_map; the pixels are then
+    recoloured with a single table lookup over the whole buffer. Colours
+    missing from color_map are kept as they are.
+
+    Args:
+        palette: (N, 3) palette from palette_index()
+        indices: (H, W) palette indices from palette_index()
+        alpha: (H, W) alpha channel from palette_index()
+        color_map: Mapping of source RGB to replacement RGB
+        mode: Output image mode ('RGBA' or 'RGB')
+
+    Returns:
+        Recoloured image
+    """
+    lut = palette.copy()
+    for i, color in enumerate(palette):
+        replacement = color_map.get(tuple(int(c) for c in color))
+        if replacement is not None:
+            lut[i] = replacement[:3]
+
+    rgb = lut[indices]
+    if mode == 'RGB':
+        return Image.fromarray(rgb)
+    return Image.fromarray(np.dstack([rgb, alpha]))
+
 # ============================================
 # Common Icon Drawing Functions
 # ============================================
@@ -241,6 +670,54 @@ def draw_folder_base(
         draw.line([(3, h - 4), (w - 4, h - 4)], fill=dark_color)
         draw.line([(w - 4, 7), (w - 4, h - 4)], fill=dark_color)
 
+def draw_folder_open_base(
+    draw: ImageDraw.ImageDraw,
+    size: Tuple[int, int] = ICON_SIZE_STANDARD,
+    fill_color: Tuple[int, int, int] = COLORS['folder_yellow'],
+    dark_color: Tuple[int, int, int] = COLORS['folder_dark']
+) -> None:
+    """
+    Draw an open folder shape.
+
+    Args:
+        draw: ImageDraw object
+        size: Icon size
+        fill_color: Main folder color
+        dark_color: Darker shade for the inside of the folder
+    """
+    w, h = size
+
+    if size == ICON_SIZE_SMALL:
+        # Simple open folder for 16x16
+        draw.rectangle([1, 4, w - 2, h - 3], fill=fill_color, outline=COLORS['black'])
+        draw.line([(1, 4), (5, 4)], fill=dark_color)
+    else:
+        # Back of folder
+        draw.rectangle([2, 8, w - 3, h - 3], fill=dark_color, outline=COLORS['black'])
+
+        # Open lid (tilted)
+        lid_points = [
+            (2, 8),
+            (4, 3),
+            (w - 5, 3),
+            (w - 3, 8)
+        ]
+        draw.polygon(lid_points, fill=fill_color, outline=COLORS['black'])
+
+        # Front of folder
+        front_points = [
+            (0, 12),
+            (4, 8),
+            (w - 5, 8),
+            (w - 1, 12),
+            (w - 3, h - 3),
+            (2, h - 3)
+        ]
+        draw.polygon(front_points, fill=fill_color, outline=COLORS['black'])
+
+        # 3D highlights
+        draw.line([(1, 13), (w - 4, h - 4)], fill=dark_color)
+
 def draw_document_base(
     draw: ImageDraw.ImageDraw,
     size: Tuple[int, int] = ICON_SIZE_STANDARD,
@@ -353,6 +830,174 @@ def draw_trash_base(
         if is_full:
             draw.polygon([(10, 6), (14, 2), (18, 6)], fill=COLORS['white'], outline=COLORS['black'])
 
+# ============================================
+# Template Icons
+# ============================================
+
+def create_template_icon(
+    template,
+    size: Tuple[int, int] = ICON_SIZE_STANDARD,
+    **kwargs
+) -> Tuple[Image.Image, ImageDraw.ImageDraw]:
+    """
+    Create an icon that starts from a template shape, like create_icon().
+
+    The template (e.g. draw_folder_base) is the layer(template, size,
+    **kwargs) of the composition graph below, so it is drawn once and kept
+    in the layer cache; each call returns a private copy, so callers only
+    pay for their own decorations and can never modify the cached layer.
+
+    Args:
+        template: Drawing function called as template(draw, size=size, **kwargs)
+        size: Icon dimensions (width, height)
+        **kwargs: Extra template arguments (colours, is_full, ...)
+
+    Returns:
+        Tuple of (Image, ImageDraw) objects
+    """
+    img = render_layers({'icon': layer(template, size, **kwargs)})['icon']
+    return img, ImageDraw.Draw(img)
+
+# ============================================
+# Layered Composition
+# ============================================
+#
+# A layer is a hashable recipe tuple, so identical layers anywhere in the
+# build are the same graph node. Rendered layers are kept in an LRU cache
+# shared by every render_layers() call in the process, so a layer used by
+# several icons is drawn once (template icons included, see
+# create_template_icon()):
+#
+#   ('draw', fn, size, kwargs)      fn(draw, size=size, **kwargs) on a blank icon
+#   ('transpose', layer, method)    Image.transpose() of another layer
+#   ('overlay', base, top)          top alpha-composited over base
+
+# Most recently used layers kept in memory
+LAYER_CACHE_SIZE = 128
+
+_layer_cache: 'OrderedDict[tuple, Image.Image]' = OrderedDict()
+_layer_cache_stats = {'hits': 0, 'misses': 0}
+
+def layer(fn, size: Tuple[int, int] = ICON_SIZE_STANDARD, **kwargs) -> tuple:
+    """Layer drawn by fn(draw, size=size, **kwargs) on a transparent icon of size."""
+    return ('draw', fn, size, tuple(sorted(kwargs.items())))
+
+def transposed(base: tuple, method: int) -> tuple:
+    """Layer flipped or rotated with Image.transpose() (e.g. Image.ROTATE_90)."""
+    return ('transpose', base, method)
+
+def overlay(base: tuple, top: tuple) -> tuple:
+    """Layer with top composited over base."""
+    return ('overlay', base, top)
+
+def _layer_inputs(node: tuple) -> List[tuple]:
+    if node[0] == 'transpose':
+        return [node[1]]
+    if node[0] == 'overlay':
+        return [node[1], node[2]]
+    return []
+
+def _render_node(node: tuple, inputs: List[Image.Image]) -> Image.Image:
+    kind = node[0]
+    if kind == 'draw':
+        _, fn, size, kwargs = node
+        img, draw = create_icon(size=size)
+        fn(draw, size=size, **dict(kwargs))
+        return img
+    if kind == 'transpose':
+        return inputs[0].transpose(node[2])
+    if kind == 'overlay':
+        return Image.alpha_composite(inputs[0], inputs[1])
+    raise ValueError(f'Unknown layer type: {kind}')
+
+def _cache_layer(node: tuple, img: Image.Image) -> None:
+    _layer_cache[node] = img
+    while len(_layer_cache) > LAYER_CACHE_SIZE:
+        _layer_cache.popitem(last=False)
+
+def layer_cache_info() -> Dict[str, int]:
+    """Return layer cache hits, misses (layers rendered) and current size."""
+    return dict(_layer_cache_stats, size=len(_layer_cache))
+
+def layer_levels(targets: Dict[str, tuple], done=frozenset()) -> List[List[tuple]]:
+    """
+    Deduplicate the composition graph of targets and group it into levels.
+
+    Every node appears once; nodes in the same level only depend on earlier
+    levels, so each level can be rendered in parallel.
+
+    Args:
+        targets: Mapping of output names to layers
+        done: Layers already rendered; they and their inputs are left out
+
+    Returns:
+        List of levels, each a list of unique layers
+    """
+    depth: Dict[tuple, int] = {}
+
+    def visit(node: tuple) -> int:
+        if node in done:
+            return -1
+        if node not in depth:
+            depth[node] = 1 + max((visit(child) for child in _layer_inputs(node)), default=-1)
+        return depth[node]
+
+    for node in targets.values():
+        visit(node)
+
+    levels: List[List[tuple]] = [[] for _ in range(max(depth.values(), default=-1) + 1)]
+    for node, level in depth.items():
+        levels[level].append(node)
+    return levels
+
+def _render_level_node(args):
+    node, inputs = args
+    return _render_node(node, inputs)
+
+def render_layers(targets: Dict[str, tuple], executor=None) -> Dict[str, Image.Image]:
+    """
+    Render every target of a composition graph, level by level.
+
+    Layers found in the layer cache (from this or an earlier call) are
+    reused, and so are never re-rendered along with their inputs; newly
+    rendered layers are added to the cache.
+
+    Args:
+        targets: Mapping of output names to layers
+        executor: Optional concurrent.futures executor for each level; draw
+                  functions must then be picklable (module-level)
+
+    Returns:
+        Mapping of output names to private copies of the rendered images
+    """
+    rendered: Dict[tuple, Image.Image] = {}
+    seen = set()
+
+    def lookup(node: tuple) -> None:
+        if node in seen:
+            return
+        seen.add(node)
+        img = _layer_cache.get(node)
+        if img is not None:
+            _layer_cache_stats['hits'] += 1
+            _layer_cache.move_to_end(node)
+            rendered[node] = img
+            return
+        for child in _layer_inputs(node):
+            lookup(child)
+
+    for node in targets.values():
+        lookup(node)
+
+    for level in layer_levels(targets, done=set(rendered)):
+        jobs = [(node, [rendered[child] for child in _layer_inputs(node)]) for node in level]
+        results = executor.map(_render_level_node, jobs) if executor else map(_render_level_node, jobs)
+        for node, img in zip(level, results):
+            _layer_cache_stats['misses'] += 1
+            rendered[node] = img
+            _cache_layer(node, img)
+    return {name: rendered[node].copy() for name, node in targets.items()}
+
 # ============================================
 # Main execution (for testing)
 # ============================================
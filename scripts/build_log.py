@@ -0,0 +1,185 @@
+"""
+m00-os-7 Build Log
+
+Structured, quiet-by-default logging for the asset scripts.
+
+    info()    progress banners ('Generating system icons...'), shown unless --quiet
+    debug()   per-file lines, shown with --verbose
+    event()   one JSON object per line (stage, asset, duration, bytes) in
+              the event log, which print_summary() aggregates into a table
+
+Every line goes out in a single write; the event log is opened with
+O_APPEND, so worker processes (which inherit the level and log file
+through the environment) can log concurrently without interleaving.
+"""
+
+import json
+import os
+import sys
+import time
+from typing import Optional
+
+
+LEVELS = {'quiet': 0, 'normal': 1, 'verbose': 2}
+
+# Inherited by worker processes
+LEVEL_ENV = 'M00_ASSET_LOG_LEVEL'
+LOG_FILE_ENV = 'M00_ASSET_LOG_FILE'
+
+# Event log opened by this process: (pid, fd)
+_log_fd = None
+# Temporary event log created by configure(), removed by print_summary()
+_owned_log_file: Optional[str] = None
+# Size of the event log when this run started; earlier runs are not summarised
+_log_offset = 0
+
+def get_project_dir():
+    return os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def get_level() -> int:
+    return LEVELS.get(os.environ.get(LEVEL_ENV, 'normal'), LEVELS['normal'])
+
+def configure(level: str = 'normal', log_file: Optional[str] = None) -> None:
+    """
+    Set the level and event log for this process and its workers.
+
+    Args:
+        level: 'quiet', 'normal' or 'verbose'
+        log_file: JSON-lines event log to append to; a temporary one is
+            used for the summary if None
+    """
+    global _owned_log_file, _log_offset
+    os.environ[LEVEL_ENV] = level
+    _log_offset = 0
+    if log_file is None:
+        import tempfile
+        fd, log_file = tempfile.mkstemp(prefix='m00-assets-', suffix='.jsonl')
+        os.close(fd)
+        _owned_log_file = log_file
+    elif os.path.exists(log_file):
+        _log_offset = os.path.getsize(log_file)
+    os.environ[LOG_FILE_ENV] = os.path.abspath(log_file)
+
+def _write_line(stream, line: str) -> None:
+    stream.write(line + '\n')
+    stream.flush()
+
+def info(message: str) -> None:
+    """Print a progress message unless --quiet."""
+    if get_level() >= LEVELS['normal']:
+        _write_line(sys.stdout, message)
+
+def debug(message: str) -> None:
+    """Print a detail message with --verbose."""
+    if get_level() >= LEVELS['verbose']:
+        _write_line(sys.stdout, message)
+
+def asset_name(filepath: str) -> str:
+    """Path of an output relative to public/assets (or the project)."""
+    project_dir = get_project_dir()
+    assets_dir = os.path.join(project_dir, 'public', 'assets')
+    base = assets_dir if filepath.startswith(assets_dir + os.sep) else project_dir
+    return os.path.relpath(filepath, base).replace(os.sep, '/')
+
+def _event_fd():
+    global _log_fd
+    log_file = os.environ.get(LOG_FILE_ENV)
+    if log_file is None:
+        return None
+    if _log_fd is None or _log_fd[0] != os.getpid():
+        _log_fd = (os.getpid(), os.open(log_file, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644))
+    return _log_fd[1]
+
+def event(stage: str, asset: str, duration: float = 0.0, nbytes: int = 0, **fields) -> None:
+    """
+    Record one structured event.
+
+    Args:
+        stage: Build stage ('render', 'encode', 'write', ...)
+        asset: Asset name or path (paths are made relative)
+        duration: Seconds spent
+        nbytes: Bytes produced
+        **fields: Extra JSON-serialisable fields
+    """
+    if os.path.isabs(asset):
+        asset = asset_name(asset)
+    record = {
+        'ts': round(time.time(), 6),
+        'pid': os.getpid(),
+        'stage': stage,
+        'asset': asset,
+        'ms': round(duration * 1000, 3),
+        'bytes': nbytes,
+        **fields,
+    }
+    fd = _event_fd()
+    if fd is not None:
+        os.write(fd, (json.dumps(record, separators=(',', ':')) + '\n').encode('utf-8'))
+
+    status = fields.get('status')
+    debug(f'{stage:<7} {asset}' + (f' ({status})' if status else ''))
+
+# ============================================
+# Summary
+# ============================================
+
+def read_events(log_file: Optional[str] = None, offset: int = 0):
+    """Load the events logged from byte offset on."""
+    log_file = log_file or os.environ.get(LOG_FILE_ENV)
+    if not log_file or not os.path.exists(log_file):
+        return []
+    with open(log_file, 'rb') as f:
+        f.seek(offset)
+        return [json.loads(line) for line in f if line.strip()]
+
+def summarize(events):
+    """
+    Aggregate events per stage.
+
+    Returns:
+        Dict of stage -> {'count', 'bytes', 'ms', 'unchanged', 'processes'}
+    """
+    stages = {}
+    for record in events:
+        stage = stages.setdefault(record['stage'], {
+            'count': 0, 'bytes': 0, 'ms': 0.0, 'unchanged': 0, 'processes': set(),
+        })
+        stage['count'] += 1
+        stage['bytes'] += record['bytes']
+        stage['ms'] += record['ms']
+        stage['unchanged'] += record.get('status') == 'unchanged'
+        stage['processes'].add(record['pid'])
+    return stages
+
+def print_summary() -> None:
+    """Print the per-stage summary table (at every level) and drop a temporary log."""
+    global _owned_log_file
+    stages = summarize(read_events(offset=_log_offset))
+    if stages:
+        print(f'{"stage":<8} {"events":>7} {"unchanged":>9} {"KiB":>9} {"time s":>8} {"procs":>6}')
+        for name, stage in stages.items():
+            print(f'{name:<8} {stage["count"]:>7} {stage["unchanged"]:>9} '
+                  f'{stage["bytes"] / 1024:>9.1f} {stage["ms"] / 1000:>8.2f} {len(stage["processes"]):>6}')
+    if _owned_log_file is not None:
+        os.remove(_owned_log_file)
+        os.environ.pop(LOG_FILE_ENV, None)
+        _owned_log_file = None
+
+# ============================================
+# CLI Helpers
+# ============================================
+
+def add_logging_arguments(parser) -> None:
+    """Add --quiet, --verbose and --log-file to an argparse parser."""
+    group = parser.add_mutually_exclusive_group()
+    group.add_argument('-q', '--quiet', action='store_true',
+                       help='Only print the summary table and errors')
+    group.add_argument('-v', '--verbose', action='store_true',
+                       help='Also print a line per file')
+    parser.add_argument('--log-file', default=None,
+                        help='Append JSON-lines build events to this file')
+
+def configure_from_args(args) -> None:
+    """configure() from the parsed --quiet/--verbose/--log-file options."""
+    level = 'quiet' if args.quiet else 'verbose' if args.verbose else 'normal'
+    configure(level, args.log_file)
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+m00-os-7 Script Start-up Check
+
+Imports every asset script in a fresh interpreter under `-X importtime`
+and fails if a module executes a heavy dependency (PIL, NumPy) at import
+time. Heavy dependencies are bound with _lazy.lazy_import() and must only
+load once a stage draws or encodes something, so `--help` stays instant.
+
+Import times are reported against a per-module budget as well. Timings
+vary with machine load, so a module over budget is only flagged as slow;
+it fails when the median of several runs exceeds TIME_MARGIN times its
+budget, which takes an eager import rather than noise.
+
+Usage:
+    python -m scripts.check_startup [--runs N]
+"""
+
+import os
+import statistics
+import subprocess
+import sys
+
+
+# Modules checked, with their expected cumulative import time in milliseconds
+IMPORT_BUDGETS_MS = {
+    'scripts.asset_utils': 60,
+    'scripts.generate_icons': 120,
+    'scripts.generate_patterns': 100,
+    'scripts.generate_cards': 120,
+    'scripts.generate_sounds': 60,
+    'scripts.generate_themes': 120,
+    'scripts.export_svg': 100,
+    'scripts.inline_assets': 100,
+    'scripts.pipeline': 100,
+    'scripts.generate_assets': 200,
+    'scripts.asset_pack': 150,
+    'scripts.analyze_assets': 100,
+    'scripts.preload_assets': 100,
+    'scripts.upscale_assets': 200,
+    # http.server and email.* are most of this
+    'scripts.asset_server': 250,
+}
+
+# Packages that must not execute while a script module is imported
+HEAVY_MODULES = ('numpy', 'PIL')
+
+# Locating PIL.Image for the lazy loader imports the (tiny) PIL package
+ALLOWED_MODULES = {'PIL', 'PIL._version'}
+
+# A module fails the time check when its median import time is over
+# this multiple of its budget
+TIME_MARGIN = 2.0
+
+def get_project_dir():
+    return os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def measure_import(module):
+    """
+    Import a module in a fresh interpreter.
+
+    Returns:
+        (cumulative import time in microseconds, list of imported module names)
+    """
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        cwd=get_project_dir(), capture_output=True, text=True, check=True,
+    )
+    cumulative = None
+    imported = []
+    # Lines look like 'import time:   self [us] | cumulative | name'
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative_us, name = line[len('import time:'):].split('|')
+        name = name.strip()
+        imported.append(name)
+        if name == module:
+            cumulative = int(cumulative_us)
+    return cumulative, imported
+
+def check_startup(runs=5):
+    """
+    Check every module in IMPORT_BUDGETS_MS and print a report.
+
+    Returns:
+        Number of failed modules
+    """
+    failures = 0
+    print(f'{"module":<28} {"import ms":>9} {"budget":>7}  status')
+    for module, budget_ms in IMPORT_BUDGETS_MS.items():
+        times_us = []
+        heavy = set()
+        for _ in range(runs):
+            cumulative_us, imported = measure_import(module)
+            times_us.append(cumulative_us)
+            heavy.update(
+                name.split('.')[0] for name in imported
+                if name.startswith(HEAVY_MODULES) and name not in ALLOWED_MODULES
+            )
+        median_ms = statistics.median(times_us) / 1000
+
+        problems = []
+        if heavy:
+            problems.append('loads ' + ', '.join(sorted(heavy)))
+        if median_ms > budget_ms * TIME_MARGIN:
+            problems.append(f'over {TIME_MARGIN:g}x budget')
+        failures += bool(problems)
+        if problems:
+            status = '; '.join(problems)
+        else:
+            status = 'slow' if median_ms > budget_ms else 'ok'
+        print(f'{module:<28} {median_ms:>9.1f} {budget_ms:>7}  {status}')
+    return failures
+
+
+# ============================================
+# CLI Entry Point
+# ============================================
+
+if __name__ == '__main__':
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Check asset script import time')
+    parser.add_argument('--runs', type=int, default=5,
+                        help='Imports per module; the median counts (default: %(default)s)')
+
+    args = parser.parse_args()
+    failures = check_startup(args.runs)
+    if failures:
+        print(f'{failures} module(s) failed the start-up check')
+    sys.exit(1 if failures else 0)
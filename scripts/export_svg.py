@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+"""
+m00-os-7 SVG Exporter
+
+Exports rendered pixel-art icons as SVG so they scale crisply at any DPI.
+
+Same-colour pixels are merged into as few rectangles as possible (greedy
+meshing: grow each run right, then down), and all rectangles of one colour
+become a single <path>. Every icon is written as its own SVG and as a
+<symbol> in one sprite sheet.
+
+Usage:
+    python -m scripts.export_svg [--sprite-only]
+"""
+
+import os
+import io
+import contextlib
+
+from ._lazy import lazy_import
+from .build_log import add_logging_arguments, configure_from_args, info, print_summary
+from .asset_utils import capture_assets, encode_png, get_output_layout, write_text_asset
+
+np = lazy_import('numpy')
+
+
+# ============================================
+# Rectangle Merging
+# ============================================
+
+def merge_rectangles(img):
+    """
+    Cover the visible pixels of an image with same-colour rectangles.
+
+    Scans row-major; each unvisited pixel starts a rectangle that grows
+    right along its run, then down while the whole run below matches.
+
+    Args:
+        img: Source image
+
+    Returns:
+        List of (x, y, w, h, (r, g, b, a)) tuples
+    """
+    pixels = np.asarray(img.convert('RGBA'))
+    # One comparable value per pixel
+    keys = pixels.view(np.uint32).reshape(pixels.shape[:2])
+    visible = pixels[..., 3] > 0
+    done = ~visible
+    height, width = keys.shape
+
+    rects = []
+    for y in range(height):
+        for x in range(width):
+            if done[y, x]:
+                continue
+            key = keys[y, x]
+
+            # Grow right along the run
+            w = 1
+            while x + w < width and not done[y, x + w] and keys[y, x + w] == key:
+                w += 1
+
+            # Grow down while the whole run matches
+            h = 1
+            while y + h < height:
+                row = slice(x, x + w)
+                if done[y + h, row].any() or (keys[y + h, row] != key).any():
+                    break
+                h += 1
+
+            done[y:y + h, x:x + w] = True
+            rects.append((x, y, w, h, tuple(int(c) for c in pixels[y, x])))
+    return rects
+
+# ============================================
+# SVG Encoding
+# ============================================
+
+def svg_paths(rects):
+    """Render merged rectangles as one <path> element per colour."""
+    by_color = {}
+    for x, y, w, h, color in rects:
+        by_color.setdefault(color, []).append(f'M{x} {y}h{w}v{h}h-{w}z')
+
+    paths = []
+    for (r, g, b, a), subpaths in by_color.items():
+        opacity = '' if a == 255 else f' fill-opacity="{a / 255:.3g}"'
+        paths.append(f'<path fill="#{r:02x}{g:02x}{b:02x}"{opacity} d="{"".join(subpaths)}"/>')
+    return paths
+
+def image_to_svg(img, rects=None):
+    """Encode an image as a standalone SVG document."""
+    if rects is None:
+        rects = merge_rectangles(img)
+    return (
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{img.width}" height="{img.height}" '
+        f'viewBox="0 0 {img.width} {img.height}" shape-rendering="crispEdges">'
+        + ''.join(svg_paths(rects))
+        + '</svg>\n'
+    )
+
+def image_to_symbol(img, symbol_id, rects=None):
+    """Encode an image as a <symbol> for an SVG sprite sheet."""
+    if rects is None:
+        rects = merge_rectangles(img)
+    return (
+        f'<symbol id="{symbol_id}" viewBox="0 0 {img.width} {img.height}">'
+        + ''.join(svg_paths(rects))
+        + '</symbol>'
+    )
+
+def png_size(img):
+    return len(encode_png(img))
+
+# ============================================
+# Export
+# ============================================
+
+def export_icons(images, sprite_only=False):
+    """
+    Export icons as SVG files plus an SVG sprite sheet and print a report.
+
+    Args:
+        images: Dict mapping asset keys ('icons/system/folder') to images
+        sprite_only: Only write the sprite sheet
+
+    Returns:
+        Path to the sprite sheet, or None if there were no icons
+    """
+    if not images:
+        info('No icons to export')
+        return None
+
+    layout = get_output_layout()
+    symbols = []
+    report = []
+
+    for key, img in sorted(images.items()):
+        rects = merge_rectangles(img)
+        svg = image_to_svg(img, rects)
+        # 'icons/system/folder' -> 'system/folder', symbol 'system-folder'
+        relpath = key.split('/', 1)[1]
+        symbols.append(image_to_symbol(img, relpath.replace('/', '-'), rects))
+
+        if not sprite_only:
+            subdir, filename = os.path.split(relpath)
+            filepath = layout.file(f'icons/svg/{subdir}', f'{filename}.svg')
+            write_text_asset(filepath, svg)
+
+        pixels = int((np.asarray(img.convert('RGBA'))[..., 3] > 0).sum())
+        report.append((relpath, pixels, len(rects), len(svg.encode('utf-8')), png_size(img)))
+
+    sprite_path = layout.file('icons/svg', 'sprite.svg')
+    write_text_asset(sprite_path, ''.join([
+        '<svg xmlns="http://www.w3.org/2000/svg" style="display:none" '
+        'shape-rendering="crispEdges">\n',
+        *(symbol + '\n' for symbol in symbols),
+        '</svg>\n',
+    ]))
+
+    lines = [f'{"icon":<32} {"pixels":>7} {"rects":>6} {"svg":>7} {"png":>7}']
+    lines += [f'{relpath:<32} {pixels:>7} {rects:>6} {svg_bytes:>7} {png_bytes:>7}'
+              for relpath, pixels, rects, svg_bytes, png_bytes in report]
+    totals = [sum(column) for column in list(zip(*report))[1:]]
+    lines.append(f'{"total":<32} {totals[0]:>7} {totals[1]:>6} {totals[2]:>7} {totals[3]:>7}')
+    info('\n'.join(lines))
+    info(f'Saved sprite: {sprite_path}')
+    return sprite_path
+
+def export_all(sprite_only=False):
+    """Render every icon in memory and export it as SVG."""
+    from . import generate_icons
+
+    info('Exporting icons as SVG...')
+    with capture_assets() as captured, contextlib.redirect_stdout(io.StringIO()):
+        generate_icons.generate_all_icons()
+    icons = {key: img for key, img in captured.items() if key.startswith('icons/')}
+    export_icons(icons, sprite_only)
+    info('SVG export complete!')
+
+
+# ============================================
+# CLI Entry Point
+# ============================================
+
+if __name__ == '__main__':
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Export Mac OS 7 style icons as SVG')
+    parser.add_argument('--sprite-only', action='store_true',
+                        help='Only write icons/svg/sprite.svg')
+    add_logging_arguments(parser)
+
+    args = parser.parse_args()
+    configure_from_args(args)
+    export_all(args.sprite_only)
+    print_summary()
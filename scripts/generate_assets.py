@@ -0,0 +1,309 @@
+#!/usr/bin/env python3
+"""
+m00-os-7 Asset Build
+
+Builds the whole asset set through the pipeline in pipeline.py: generator
+units render in worker processes while the main process encodes and
+writes their output, so drawing and I/O overlap. Optional theme and deck
+scale variants multiply the units into a matrix that renders in parallel.
+
+Pixel-identical images are encoded once and written at every URL;
+manifest.json maps every image URL to its pixel hash and lists duplicates
+as aliases of the canonical copy (the asset pack stores their bytes once).
+The alias table is also written as app/utils/assetAliases.ts, whose
+resolveAssetUrl() the app applies to the asset URLs it builds at runtime,
+so a duplicate is fetched (and cached) under one URL.
+Prints per-stage throughput and backpressure when the build finishes.
+
+After the build, the app sources are cross-referenced with the outputs
+(see analyze_assets.py) and the boot-critical images are written to the
+preload manifest (see preload_assets.py).
+
+With --pack, everything goes into one uncompressed pack file (see
+asset_pack.py) instead of loose files under public/assets.
+
+Usage:
+    python -m scripts.generate_assets [--theme NAME ... | --all-themes] [--scale N ...]
+                                      [--jobs N] [--encode-threads N] [--queue-size N]
+                                      [--pack PACK]
+"""
+
+import io
+import os
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
+from functools import partial
+import time
+
+from .asset_utils import (
+    capture_assets, defer_writes, get_output_layout, palette_index, remap_palette,
+    write_json_asset, write_text_asset
+)
+from .analyze_assets import analyze, scan_sources
+from .asset_pack import PackWriter
+from .build_log import (
+    add_logging_arguments, configure_from_args, event, info, print_summary
+)
+from .pipeline import AssetPipeline
+from . import generate_cards
+from . import generate_icons
+from . import generate_patterns
+from . import generate_sounds
+from . import generate_themes
+from .inline_assets import generate_inline_assets
+from .preload_assets import generate_preload_manifest
+
+
+# ============================================
+# Build Units
+# ============================================
+
+# Independent generator calls, each rendered by one worker
+IMAGE_UNITS = {
+    'system-icons': generate_icons.generate_system_icons,
+    'small-icons': generate_icons.generate_small_system_icons,
+    'app-icons': generate_icons.generate_app_icons,
+    'avatar-icons': generate_icons.generate_avatar_icons,
+    'label-icons': generate_icons.generate_label_icons,
+    'ui-icons': generate_icons.generate_ui_icons,
+    'animations': generate_icons.generate_animations,
+    'misc-graphics': generate_icons.generate_miscellaneous_graphics,
+    'patterns': generate_patterns.generate_all_tiles,
+    'cards': generate_cards.generate_cards,
+}
+
+SOUND_UNITS = {
+    'sounds': generate_sounds.main,
+}
+
+def render_unit(generate, theme=None):
+    """
+    Run one generator in a worker process and return what it would save.
+
+    With a theme, the generator's images are recoloured into
+    themes/<theme>/ instead (other outputs are dropped).
+
+    Returns:
+        (list of (filepath, image or bytes), render seconds)
+    """
+    start = time.perf_counter()
+    with redirect_stdout(io.StringIO()), defer_writes() as outputs:
+        if theme is None:
+            generate()
+        else:
+            with capture_assets() as captured:
+                generate()
+
+    if theme is not None:
+        color_map = generate_themes.get_color_map(generate_themes.THEMES[theme])
+        layout = get_output_layout()
+        outputs = []
+        for key, img in captured.items():
+            mode = 'RGB' if img.mode == 'RGB' else 'RGBA'
+            subdir, name = key.rsplit('/', 1)
+            filepath = layout.file(f'themes/{theme}/{subdir}', f'{name}.png')
+            outputs.append((filepath, remap_palette(*palette_index(img), color_map, mode)))
+    return outputs, time.perf_counter() - start
+
+def build_units(themes=(), scales=()):
+    """
+    Expand the unit matrix.
+
+    Returns:
+        List of (label, generate, theme) tuples
+    """
+    image_units = dict(IMAGE_UNITS)
+    for scale in scales:
+        image_units[f'deck-{scale}x'] = partial(generate_cards.generate_deck, scale)
+
+    units = [(name, generate, None) for name, generate in image_units.items()]
+    units += [(name, generate, None) for name, generate in SOUND_UNITS.items()]
+    for theme in themes:
+        units += [(f'{name}@{theme}', generate, theme) for name, generate in image_units.items()]
+    return units
+
+# ============================================
+# Asset Manifest
+# ============================================
+
+# Generated module, relative to the project directory
+ALIAS_MODULE = 'app/utils/assetAliases.ts'
+
+HEADER = 'Generated by scripts/generate_assets.py - do not edit.'
+
+def get_project_dir():
+    return os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def asset_url(filepath, root):
+    return '/assets/' + os.path.relpath(filepath, root).replace(os.sep, '/')
+
+def write_alias_module(aliases, filepath):
+    """Write ASSET_ALIASES (duplicate URL -> canonical URL) and resolveAssetUrl()."""
+    lines = [
+        f'// {HEADER}',
+        '',
+        '/** Pixel-identical duplicates, mapped to the URL of the copy to fetch instead. */',
+        'export const ASSET_ALIASES: Record<string, string> = {',
+    ]
+    lines += [f"  '{alias}': '{canonical}'," for alias, canonical in aliases.items()]
+    lines += [
+        '}',
+        '',
+        '/** Returns the canonical URL of an asset, so identical images are fetched once. */',
+        'export function resolveAssetUrl(url: string): string {',
+        '  return ASSET_ALIASES[url] ?? url',
+        '}',
+        '',
+    ]
+    return write_text_asset(filepath, '\n'.join(lines))
+
+def write_asset_manifest(pipeline, root, write_module=True):
+    """
+    Write manifest.json: the pixel hash of every unique image and the
+    alias table mapping duplicate URLs to their canonical URL; with
+    write_module, also the alias table as app/utils/assetAliases.ts.
+    """
+    manifest = {
+        'assets': dict(sorted(
+            (asset_url(filepath, root), digest) for filepath, digest in pipeline.pixel_hashes.items())),
+        'aliases': dict(sorted(
+            (asset_url(alias, root), asset_url(canonical, root))
+            for alias, canonical in pipeline.aliases.items())),
+    }
+    filepath = os.path.join(root, 'manifest.json')
+    write_json_asset(filepath, manifest)
+    if write_module:
+        write_alias_module(manifest['aliases'],
+                           os.path.join(get_project_dir(), *ALIAS_MODULE.split('/')))
+
+def analyze_build(pipeline, root, registry, packer=None):
+    """
+    Cross-reference the app sources with what this build produced.
+
+    Sizes are those of the files as stored (on disk, or in the pack), which
+    can differ from this build's encoding when a file was left unchanged.
+    """
+    aliases = {asset_url(alias, root): asset_url(canonical, root)
+               for alias, canonical in pipeline.aliases.items()}
+    sizes = None
+    if packer is not None:
+        sizes = {f'/assets/{name}': len(data) for name, data in packer.files.items()}
+    return analyze(scan_sources(), registry, aliases, sizes)
+
+def write_manifests(pipeline, root, themes, themed_assets, registry, packer=None):
+    """
+    Write manifest.json, preload.json and, when themes were built,
+    themes/manifest.json; without a packer, also the generated app modules
+    assetAliases.ts and preloadAssets.ts.
+    """
+    write_asset_manifest(pipeline, root, write_module=packer is None)
+    graph = analyze_build(pipeline, root, registry, packer)
+    generate_preload_manifest(graph, root, write_module=packer is None)
+    if themes:
+        # Same order as generate_themes.load_base_assets() walks the tree
+        assets = sorted(themed_assets, key=lambda relpath: (
+            generate_themes.THEMED_SUBDIRS.index(relpath.split('/', 1)[0]),
+            *os.path.split(relpath)))
+        generate_themes.write_manifest(
+            {name: generate_themes.THEMES[name] for name in themes}, assets)
+
+# ============================================
+# Build
+# ============================================
+
+def generate_assets(themes=(), scales=(), jobs=None, encode_threads=4, queue_size=64,
+                    pack_path=None):
+    """
+    Build every asset through the render/encode/write pipeline.
+
+    Args:
+        themes: Theme names from generate_themes.THEMES to render as well
+        scales: Extra full-pip deck scales (cards/<scale>x)
+        jobs: Number of render processes (default: one per CPU)
+        encode_threads: Number of PNG encoder threads
+        queue_size: Capacity of the write queue
+        pack_path: Write one asset pack here instead of loose files; the
+            generated app modules (inline and preload assets) are then left
+            as they are
+    """
+    units = build_units(themes, scales)
+    # Resolve the layout before forking so workers inherit it
+    layout = get_output_layout()
+    root = layout.root + os.sep
+
+    packer = None if pack_path is None else PackWriter(pack_path, layout.root)
+
+    info(f'Building {len(units)} units...')
+    if packer is None:
+        pipeline = AssetPipeline(encode_threads, queue_size)
+    else:
+        pipeline = AssetPipeline(encode_threads, queue_size, packer.write, packer.read)
+    themed_assets = set()
+    # Asset URL -> unit label, for the usage analysis
+    registry = {}
+    try:
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            futures = [
+                (label, executor.submit(render_unit, generate, theme))
+                for label, generate, theme in units
+            ]
+            # Collected in unit order, so the first copy of a duplicate
+            # (base before theme) is the same on every build
+            for label, future in futures:
+                outputs, seconds = future.result()
+                pipeline.metrics['render'].record(seconds, items=len(outputs))
+                event('render', label, seconds, outputs=len(outputs))
+                for filepath, payload in outputs:
+                    relpath = filepath[len(root):].replace(os.sep, '/')
+                    if relpath.startswith('themes/'):
+                        themed_assets.add(relpath.split('/', 2)[2])
+                    else:
+                        registry.setdefault('/assets/' + relpath, label)
+                    pipeline.submit(filepath, payload)
+    finally:
+        pipeline.close()
+
+    if packer is None:
+        write_manifests(pipeline, layout.root, themes, themed_assets, registry)
+        generate_inline_assets()
+    else:
+        # Manifests go into the pack with everything else
+        with defer_writes() as manifests:
+            write_manifests(pipeline, layout.root, themes, themed_assets, registry, packer)
+        for filepath, data in manifests:
+            packer.write(filepath, data)
+        packer.close()
+        info(f'Packed {len(packer.files)} assets: {pack_path}')
+
+    info(pipeline.report())
+    info('All assets generated successfully!')
+
+
+# ============================================
+# CLI Entry Point
+# ============================================
+
+if __name__ == '__main__':
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Build all Mac OS 7 style assets')
+    parser.add_argument('--theme', action='append', default=[], choices=sorted(generate_themes.THEMES),
+                        help='Also render a colour theme (repeatable)')
+    parser.add_argument('--all-themes', action='store_true', help='Render every colour theme')
+    parser.add_argument('--scale', type=int, action='append', default=[],
+                        help='Also render a full-pip deck at this scale (repeatable)')
+    parser.add_argument('--jobs', type=int, default=None,
+                        help='Number of render processes (default: CPU count)')
+    parser.add_argument('--encode-threads', type=int, default=4,
+                        help='Number of PNG encoder threads (default: %(default)s)')
+    parser.add_argument('--queue-size', type=int, default=64,
+                        help='Write queue capacity (default: %(default)s)')
+    parser.add_argument('--pack', default=None,
+                        help='Write one uncompressed asset pack instead of loose files')
+    add_logging_arguments(parser)
+
+    args = parser.parse_args()
+    configure_from_args(args)
+    themes = list(generate_themes.THEMES) if args.all_themes else args.theme
+    generate_assets(themes, args.scale, args.jobs, args.encode_threads, args.queue_size, args.pack)
+    print_summary()
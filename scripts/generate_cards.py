@@ -1,14 +1,85 @@
-from PIL import Image, ImageDraw, ImageFont
-import os
-from asset_utils import COLORS, get_output_dir
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from ._lazy import lazy_import
+from .asset_utils import COLORS, save_icon
+from .build_log import add_logging_arguments, configure_from_args, info, print_summary
+
+np = lazy_import('numpy')
+Image = lazy_import('PIL.Image')
+ImageDraw = lazy_import('PIL.ImageDraw')
+ImageFont = lazy_import('PIL.ImageFont')
 
 CARD_SIZE = (40, 60)
 SUITS = ['spades', 'hearts', 'diamonds', 'clubs']
 RANKS = ['A', '2', '3', '4', '5', '6', '7', '8', '9', '10', 'J', 'Q', 'K']
+DECK_SCALES = [1, 2, 3]
+
+# Card back designs: name -> (colour, repeating tile). 'X' marks a pixel in
+# the back colour; the tile is repeated over the card inside a 2px margin.
+CARD_BACKS = {
+    'classic': ('blue', [
+        'X...',
+        '.X..',
+        '....',
+        '....',
+    ]),
+    'diagonal': ('blue', [
+        'X...',
+        '.X..',
+        '..X.',
+        '...X',
+    ]),
+    'checker': ('blue', [
+        'XX..',
+        'XX..',
+        '..XX',
+        '..XX',
+    ]),
+    'crosshatch': ('red', [
+        'X...X...',
+        '.X.X....',
+        '..X.....',
+        '.X.X....',
+        'X...X...',
+        '.....X.X',
+        '......X.',
+        '.....X.X',
+    ]),
+    'lattice': ('red', [
+        'XXXX',
+        'X...',
+        'X...',
+        'X...',
+    ]),
+}
+
+# Traditional pip positions for ranks 2-10 as (x, y) fractions of the card.
+# The pip field sits right of the corner index; pips in the lower half are
+# drawn upside down.
+_L, _C, _R = 0.42, 0.62, 0.82
+_TOP, _BOTTOM = 0.25, 0.75
+_PAIRS_4 = [(_L, _TOP), (_R, _TOP), (_L, _BOTTOM), (_R, _BOTTOM)]
+_PAIRS_6 = _PAIRS_4 + [(_L, 0.5), (_R, 0.5)]
+_PAIRS_8 = [(x, y) for y in (_TOP, 5 / 12, 7 / 12, _BOTTOM) for x in (_L, _R)]
+PIP_LAYOUTS = {
+    '2': [(_C, _TOP), (_C, _BOTTOM)],
+    '3': [(_C, _TOP), (_C, 0.5), (_C, _BOTTOM)],
+    '4': _PAIRS_4,
+    '5': _PAIRS_4 + [(_C, 0.5)],
+    '6': _PAIRS_6,
+    '7': _PAIRS_6 + [(_C, 0.375)],
+    '8': _PAIRS_6 + [(_C, 0.375), (_C, 0.625)],
+    '9': _PAIRS_8 + [(_C, 0.5)],
+    '10': _PAIRS_8 + [(_C, 1 / 3), (_C, 2 / 3)],
+}
+
+def suit_color(suit):
+    return COLORS['red'] if suit in ['hearts', 'diamonds'] else COLORS['black']
 
-def draw_suit(draw, suit, pos, size=10):
+def draw_suit(draw, suit, pos, size=10, color=None):
     x, y = pos
-    color = COLORS['red'] if suit in ['hearts', 'diamonds'] else COLORS['black']
+    if color is None:
+        color = suit_color(suit)
 
     if suit == 'hearts':
         draw.polygon([(x+size//2, y+size), (x, y+size//3), (x+size//4, y), (x+size//2, y+size//4), (x+3*size//4, y), (x+size, y+size//3)], fill=color)
@@ -26,44 +97,157 @@ def draw_suit(draw, suit, pos, size=10):
         draw.ellipse([x+size-2*r, y+size//2-r, x+size, y+size//2+r], fill=color) # Right
         draw.rectangle([x+size//2-1, y+size//2, x+size//2+1, y+size], fill=color) # Stem
 
-def generate_cards():
-    output_dir = get_output_dir('cards')
-
-    # Generate card back
-    back_img = Image.new('RGBA', CARD_SIZE, COLORS['white'])
-    back_draw = ImageDraw.Draw(back_img)
-    # Border
-    back_draw.rectangle([0, 0, CARD_SIZE[0]-1, CARD_SIZE[1]-1], outline=COLORS['black'])
-    # Pattern
-    for x in range(2, CARD_SIZE[0]-2, 4):
-        for y in range(2, CARD_SIZE[1]-2, 4):
-            back_draw.point((x, y), fill=COLORS['blue'])
-            back_draw.point((x+1, y+1), fill=COLORS['blue'])
-    back_img.save(os.path.join(output_dir, 'back.png'))
+@lru_cache(maxsize=None)
+def suit_stamp(suit, size, flipped=False):
+    """Alpha mask of a suit pip, rasterised once per (suit, size, orientation)."""
+    if flipped:
+        return suit_stamp(suit, size).transpose(Image.ROTATE_180)
+    mask = Image.new('L', (size + 1, size + 1), 0)
+    draw = ImageDraw.Draw(mask)
+    draw_suit(draw, suit, (0, 0), size, color=255)
+    return mask
 
-    for suit in SUITS:
-        for rank in RANKS:
-            img = Image.new('RGBA', CARD_SIZE, COLORS['white'])
-            draw = ImageDraw.Draw(img)
+@lru_cache(maxsize=None)
+def rank_stamp(rank, font_size=None):
+    """
+    Alpha mask and offset of a rank glyph, rasterised once per (rank, font size).
+    font_size None uses Pillow's default font at its native size.
+    """
+    font = None if font_size is None else ImageFont.load_default(font_size)
+    canvas = 4 * (font_size or 10)
+    mask = Image.new('L', (canvas, canvas), 0)
+    ImageDraw.Draw(mask).text((0, 0), rank, fill=255, font=font)
+    bbox = mask.getbbox()
+    return mask.crop(bbox), bbox[:2]
+
+@lru_cache(maxsize=None)
+def card_template(size=CARD_SIZE, border=1):
+    """Blank card face with its border, copied for every card."""
+    img = Image.new('RGBA', size, COLORS['white'])
+    draw = ImageDraw.Draw(img)
+    draw.rectangle([0, 0, size[0]-1, size[1]-1], outline=COLORS['black'], width=border)
+    return img
+
+def stamp_suit(img, suit, pos, size, flipped=False):
+    img.paste(suit_color(suit), pos, suit_stamp(suit, size, flipped))
+
+def stamp_rank(img, rank, pos, color, font_size=None):
+    mask, (dx, dy) = rank_stamp(rank, font_size)
+    img.paste(color, (pos[0] + dx, pos[1] + dy), mask)
+
+@lru_cache(maxsize=None)
+def back_tile(design, scale=1):
+    """Boolean mask of a back design's tile, scaled up by whole pixels."""
+    _, rows = CARD_BACKS[design]
+    tile = np.array([[c == 'X' for c in row] for row in rows])
+    return np.kron(tile, np.ones((scale, scale), dtype=bool))
+
+def render_back(design='classic', scale=1):
+    """
+    Render a card back by tiling its design over the card in one operation.
+
+    Args:
+        design: One of CARD_BACKS
+        scale: Integer multiple of CARD_SIZE
 
-            # Border
-            draw.rectangle([0, 0, CARD_SIZE[0]-1, CARD_SIZE[1]-1], outline=COLORS['black'])
+    Returns:
+        Card back image
+    """
+    width, height = CARD_SIZE[0] * scale, CARD_SIZE[1] * scale
+    color, _ = CARD_BACKS[design]
+    tile = back_tile(design, scale)
+    tile_h, tile_w = tile.shape
+    margin = 2 * scale
 
-            color = COLORS['red'] if suit in ['hearts', 'diamonds'] else COLORS['black']
+    # Whole tiles that start inside the margin
+    nx = -(-(width - 2 * margin) // tile_w)
+    ny = -(-(height - 2 * margin) // tile_h)
+    pixels = np.array(card_template((width, height), scale))
+    # Tiles may run into the margin but never over the border
+    field = pixels[margin:min(margin + ny * tile_h, height - scale),
+                   margin:min(margin + nx * tile_w, width - scale)]
+    mask = np.tile(tile, (ny, nx))[:field.shape[0], :field.shape[1]]
+    field[mask] = COLORS[color] + (255,)
+    return Image.fromarray(pixels)
 
-            # Rank (top left)
-            draw.text((3, 2), rank, fill=color)
+def render_card(suit, rank, scale=1, pips=False):
+    """
+    Render one card face.
 
-            # Suit (below rank)
-            draw_suit(draw, suit, (3, 15), size=8)
+    Args:
+        suit: One of SUITS
+        rank: One of RANKS
+        scale: Integer multiple of CARD_SIZE
+        pips: Lay out traditional pips for ranks 2-10 instead of a
+              single large centre suit
 
-            # Larger Suit (center)
-            draw_suit(draw, suit, (CARD_SIZE[0]//2-8, CARD_SIZE[1]//2-8), size=16)
+    Returns:
+        Card image
+    """
+    width, height = CARD_SIZE[0] * scale, CARD_SIZE[1] * scale
+    color = suit_color(suit)
+    img = card_template((width, height), scale).copy()
 
-            # Save
-            name = f"{suit}_{rank.lower()}.png"
-            img.save(os.path.join(output_dir, name))
+    # Rank (top left) and suit below it
+    stamp_rank(img, rank, (3 * scale, 2 * scale), color, None if scale == 1 else 10 * scale)
+    corner_size = (6 if pips else 8) * scale
+    stamp_suit(img, suit, (3 * scale, 15 * scale), corner_size)
+
+    if pips and rank in PIP_LAYOUTS:
+        pip_size = 6 * scale
+        for fx, fy in PIP_LAYOUTS[rank]:
+            pos = (round(width * fx) - pip_size // 2, round(height * fy) - pip_size // 2)
+            stamp_suit(img, suit, pos, pip_size, flipped=fy > 0.5)
+    else:
+        # Larger Suit (center)
+        center_size = 16 * scale
+        stamp_suit(img, suit, (width//2 - center_size//2, height//2 - center_size//2), center_size)
+
+    return img
+
+def generate_cards():
+    # Generate card backs ('back' is the default design)
+    save_icon(render_back('classic'), 'back', 'cards')
+    for design in CARD_BACKS:
+        save_icon(render_back(design), f'back-{design}', 'cards')
+
+    for suit in SUITS:
+        for rank in RANKS:
+            img = render_card(suit, rank)
+            save_icon(img, f"{suit}_{rank.lower()}", 'cards')
+
+def generate_deck(scale):
+    """Generate a full-pip deck and its backs at an integer scale into cards/<scale>x."""
+    for design in CARD_BACKS:
+        save_icon(render_back(design, scale), f'back-{design}', f'cards/{scale}x')
+    for suit in SUITS:
+        for rank in RANKS:
+            img = render_card(suit, rank, scale, pips=True)
+            save_icon(img, f"{suit}_{rank.lower()}", f'cards/{scale}x')
+    return scale
+
+def generate_decks(scales=DECK_SCALES, jobs=None):
+    """Generate full-pip decks for several scales in parallel."""
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        for scale in executor.map(generate_deck, scales):
+            info(f"Deck generated: cards/{scale}x")
 
 if __name__ == '__main__':
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Generate Mac OS 7 style playing cards')
+    parser.add_argument('--decks', action='store_true',
+                        help='Also generate full-pip decks in cards/<scale>x')
+    parser.add_argument('--scale', type=int, action='append', dest='scales',
+                        help='Deck scale to generate with --decks (repeatable, default: 1 2 3)')
+    parser.add_argument('--jobs', type=int, default=None,
+                        help='Number of worker processes for --decks (default: CPU count)')
+    add_logging_arguments(parser)
+
+    args = parser.parse_args()
+    configure_from_args(args)
     generate_cards()
-    print("Cards generated successfully!")
+    if args.decks:
+        generate_decks(args.scales or DECK_SCALES, args.jobs)
+    info("Cards generated successfully!")
+    print_summary()
@@ -6,22 +6,76 @@ Generates Mac OS 7 style system icons using PIL.
 Run this script to regenerate all icons.
 
 Usage:
-    python generate_icons.py [--all | --system | --apps | --ui]
+    python -m scripts.generate_icons [--all | --system | --apps | --ui]
 """
 
-import sys
 import os
+import math
+
+from ._lazy import lazy_import
+from .build_log import add_logging_arguments, configure_from_args, info, print_summary
+from .asset_utils import (
+    COLORS, ICON_SIZE_STANDARD, ICON_SIZE_SMALL, ICON_SIZE_LARGE,
+    create_icon, create_template_icon, save_icon, save_cursor, get_output_dir, add_shadow, render_strip,
+    write_text_asset, write_json_asset,
+    palette_index, remap_palette, layer, transposed, overlay, render_layers,
+    draw_folder_base, draw_folder_open_base, draw_document_base, draw_trash_base
+)
 
-# Add scripts directory to path for imports
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+Image = lazy_import('PIL.Image')
+ImageDraw = lazy_import('PIL.ImageDraw')
 
-from asset_utils import (
-    COLORS, ICON_SIZE_STANDARD, ICON_SIZE_SMALL,
-    create_icon, save_icon, add_shadow,
-    draw_folder_base, draw_document_base, draw_trash_base
-)
-from PIL import ImageDraw
 
+# ============================================
+# Composed Icons
+# ============================================
+
+def composed_icon_layers():
+    """
+    The one composition graph of every layered icon.
+
+    Returns:
+        Dict mapping asset keys ('icons/ui/scroll-arrow-up') to layers
+    """
+    arrow_up = layer(draw_scroll_arrow, (16, 16))
+    box = layer(draw_checkbox, (12, 12))
+    button = layer(draw_radio_button, (12, 12))
+    targets = {
+        'icons/ui/scroll-arrow-up': arrow_up,
+        'icons/ui/scroll-arrow-down': transposed(arrow_up, Image.Transpose.FLIP_TOP_BOTTOM),
+        'icons/ui/scroll-arrow-left': transposed(arrow_up, Image.Transpose.TRANSPOSE),
+        'icons/ui/scroll-arrow-right': transposed(arrow_up, Image.Transpose.ROTATE_270),
+        'icons/ui/checkbox-unchecked': box,
+        'icons/ui/checkbox-checked': overlay(box, layer(draw_checkbox_mark, (12, 12))),
+        'icons/ui/radio-unselected': button,
+        'icons/ui/radio-selected': overlay(button, layer(draw_radio_dot, (12, 12))),
+    }
+    for size, suffix in ((ICON_SIZE_STANDARD, ''), (ICON_SIZE_SMALL, '-16')):
+        targets.update({
+            f'icons/system/folder{suffix}': layer(draw_folder_base, size),
+            f'icons/system/folder-open{suffix}': layer(draw_folder_open_base, size),
+            f'icons/system/document{suffix}': layer(draw_document_base, size),
+            f'icons/system/trash-empty{suffix}': layer(draw_trash_base, size, is_full=False),
+            f'icons/system/trash-full{suffix}': layer(draw_trash_base, size, is_full=True),
+        })
+    return targets
+
+def render_composed_icons(*keys):
+    """
+    Render icons of the composition graph; layers shared between icons
+    (and already rendered by earlier calls) are drawn once.
+
+    Returns:
+        Dict mapping the requested asset keys to images
+    """
+    targets = composed_icon_layers()
+    return render_layers({key: targets[key] for key in keys})
+
+def save_composed_icons(*keys, shadow=False):
+    """Render composed icons and save them under their asset keys."""
+    for key, img in render_composed_icons(*keys).items():
+        subdir, name = key.rsplit('/', 1)
+        save_icon(add_shadow(img) if shadow else img, name, subdir)
 
 # ============================================
 # System Icons
@@ -29,65 +83,23 @@ from PIL import ImageDraw
 
 def generate_folder_icon():
     """Generate closed folder icon."""
-    img, draw = create_icon()
-    draw_folder_base(draw)
-    img = add_shadow(img)
-    save_icon(img, 'folder', 'icons/system')
+    save_composed_icons('icons/system/folder', shadow=True)
 
 def generate_folder_open_icon():
     """Generate open folder icon."""
-    img, draw = create_icon()
-    w, h = ICON_SIZE_STANDARD
-
-    # Back of folder
-    draw.rectangle([2, 8, w - 3, h - 3], fill=COLORS['folder_dark'], outline=COLORS['black'])
-
-    # Open lid (tilted)
-    lid_points = [
-        (2, 8),
-        (4, 3),
-        (w - 5, 3),
-        (w - 3, 8)
-    ]
-    draw.polygon(lid_points, fill=COLORS['folder_yellow'], outline=COLORS['black'])
-
-    # Front of folder
-    front_points = [
-        (0, 12),
-        (4, 8),
-        (w - 5, 8),
-        (w - 1, 12),
-        (w - 3, h - 3),
-        (2, h - 3)
-    ]
-    draw.polygon(front_points, fill=COLORS['folder_yellow'], outline=COLORS['black'])
-
-    # 3D highlights
-    draw.line([(1, 13), (w - 4, h - 4)], fill=COLORS['folder_dark'])
-
-    img = add_shadow(img)
-    save_icon(img, 'folder-open', 'icons/system')
+    save_composed_icons('icons/system/folder-open', shadow=True)
 
 def generate_document_icon():
     """Generate generic document icon."""
-    img, draw = create_icon()
-    draw_document_base(draw)
-    img = add_shadow(img)
-    save_icon(img, 'document', 'icons/system')
+    save_composed_icons('icons/system/document', shadow=True)
 
 def generate_trash_empty_icon():
     """Generate empty trash icon."""
-    img, draw = create_icon()
-    draw_trash_base(draw, is_full=False)
-    img = add_shadow(img)
-    save_icon(img, 'trash-empty', 'icons/system')
+    save_composed_icons('icons/system/trash-empty', shadow=True)
 
 def generate_trash_full_icon():
     """Generate full trash icon."""
-    img, draw = create_icon()
-    draw_trash_base(draw, is_full=True)
-    img = add_shadow(img)
-    save_icon(img, 'trash-full', 'icons/system')
+    save_composed_icons('icons/system/trash-full', shadow=True)
 
 def generate_hard_drive_icon():
     """Generate hard drive icon."""
@@ -217,11 +229,9 @@ def generate_calculator_icon():
 
 def generate_simpletext_icon():
     """Generate SimpleText application icon."""
-    img, draw = create_icon()
-    w, h = ICON_SIZE_STANDARD
-
     # Document with pencil
-    draw_document_base(draw)
+    img, draw = create_template_icon(draw_document_base)
+    w, h = ICON_SIZE_STANDARD
 
     # Pencil overlay (diagonal)
     pencil_points = [
@@ -301,7 +311,7 @@ def generate_preferences_icon():
 
 def generate_control_panel_icons():
     """Generate unique icons for each control panel."""
-    print('Generating control panel icons...')
+    info('Generating control panel icons...')
 
     # Network
     img, draw = create_icon()
@@ -399,7 +409,7 @@ def generate_control_panel_icons():
     img = add_shadow(img)
     save_icon(img, 'cp-startup-disk', 'icons/system')
 
-    print('Control panel icons complete!')
+    info('Control panel icons complete!')
 
 def generate_solitaire_icon():
     """Generate Solitaire game icon."""
@@ -744,29 +754,15 @@ def generate_resize_handle():
 
     save_icon(img, 'resize-handle', 'icons/ui')
 
+def draw_scroll_arrow(draw, size=(16, 16)):
+    """Draw the up scrollbar arrow; the other directions are transposes of it."""
+    w, h = size
+    draw.polygon([(w // 2, h // 4), (w // 4, h - 5), (w - 4, h - 5)], fill=COLORS['black'])
+
 def generate_scrollbar_arrows():
     """Generate scrollbar arrow icons."""
-    size = (16, 16)
-
-    # Arrow Up
-    img, draw = create_icon(size=size)
-    draw.polygon([(8, 4), (4, 11), (12, 11)], fill=COLORS['black'])
-    save_icon(img, 'scroll-arrow-up', 'icons/ui')
-
-    # Arrow Down
-    img, draw = create_icon(size=size)
-    draw.polygon([(8, 11), (4, 4), (12, 4)], fill=COLORS['black'])
-    save_icon(img, 'scroll-arrow-down', 'icons/ui')
-
-    # Arrow Left
-    img, draw = create_icon(size=size)
-    draw.polygon([(4, 8), (11, 4), (11, 12)], fill=COLORS['black'])
-    save_icon(img, 'scroll-arrow-left', 'icons/ui')
-
-    # Arrow Right
-    img, draw = create_icon(size=size)
-    draw.polygon([(11, 8), (4, 4), (4, 12)], fill=COLORS['black'])
-    save_icon(img, 'scroll-arrow-right', 'icons/ui')
+    save_composed_icons(*(f'icons/ui/scroll-arrow-{direction}'
+                          for direction in ('up', 'down', 'left', 'right')))
 
 def generate_scrollbar_thumb():
     """Generate scrollbar thumb (elevator) pattern."""
@@ -797,48 +793,115 @@ def generate_scrollbar_track():
 
     save_icon(img, 'scrollbar-track', 'icons/ui')
 
-def generate_checkboxes():
-    """Generate checkbox icons (checked and unchecked)."""
-    # Unchecked
-    img, draw = create_icon(size=(12, 12))
-    draw.rectangle([0, 0, 11, 11], fill=COLORS['white'], outline=COLORS['black'])
+def draw_checkbox(draw, size=(12, 12)):
+    """Draw an empty checkbox."""
+    w, h = size
+    draw.rectangle([0, 0, w - 1, h - 1], fill=COLORS['white'], outline=COLORS['black'])
     # 3D inner shadow
-    draw.line([(1, 1), (10, 1)], fill=COLORS['gray_medium'])
-    draw.line([(1, 1), (1, 10)], fill=COLORS['gray_medium'])
-    save_icon(img, 'checkbox-unchecked', 'icons/ui')
+    draw.line([(1, 1), (w - 2, 1)], fill=COLORS['gray_medium'])
+    draw.line([(1, 1), (1, h - 2)], fill=COLORS['gray_medium'])
 
-    # Checked
-    img, draw = create_icon(size=(12, 12))
-    draw.rectangle([0, 0, 11, 11], fill=COLORS['white'], outline=COLORS['black'])
-    # 3D inner shadow
-    draw.line([(1, 1), (10, 1)], fill=COLORS['gray_medium'])
-    draw.line([(1, 1), (1, 10)], fill=COLORS['gray_medium'])
+def draw_checkbox_mark(draw, size=(12, 12)):
+    """Draw the checkbox checkmark overlay (for a 12x12 box)."""
     # Checkmark (X-style or tick? Mac OS 7 uses a heavy checkmark)
     draw.line([(2, 4), (5, 9)], fill=COLORS['black'], width=2)
     draw.line([(5, 9), (9, 2)], fill=COLORS['black'], width=2)
-    save_icon(img, 'checkbox-checked', 'icons/ui')
+
+def generate_checkboxes():
+    """Generate checkbox icons (checked and unchecked)."""
+    save_composed_icons('icons/ui/checkbox-unchecked', 'icons/ui/checkbox-checked')
+
+def draw_radio_button(draw, size=(12, 12)):
+    """Draw an unselected radio button."""
+    w, h = size
+    draw.ellipse([0, 0, w - 1, h - 1], fill=COLORS['white'], outline=COLORS['black'])
+    # 3D inner shadow
+    draw.arc([1, 1, w - 2, h - 2], 180, 270, fill=COLORS['gray_medium'])
+
+def draw_radio_dot(draw, size=(12, 12)):
+    """Draw the selected radio button dot overlay."""
+    w, h = size
+    draw.ellipse([w // 4, h // 4, w - 4, h - 4], fill=COLORS['black'])
 
 def generate_radio_buttons():
     """Generate radio button icons (selected and unselected)."""
-    # Unselected
-    img, draw = create_icon(size=(12, 12))
-    draw.ellipse([0, 0, 11, 11], fill=COLORS['white'], outline=COLORS['black'])
-    # 3D inner shadow
-    draw.arc([1, 1, 10, 10], 180, 270, fill=COLORS['gray_medium'])
-    save_icon(img, 'radio-unselected', 'icons/ui')
+    save_composed_icons('icons/ui/radio-unselected', 'icons/ui/radio-selected')
+
+# Cursor hotspots (x, y), written into the .cur/.ani files and the CSS manifest
+CURSOR_HOTSPOTS = {
+    'cursor-arrow': (0, 0),
+    'cursor-text': (8, 8),
+    'cursor-wait': (7, 7),
+    'cursor-hand': (5, 2),
+}
+
+# Animated wait cursor: the minute hand sweeps once around the watch face
+WAIT_CURSOR_FRAMES = 8
+WAIT_CURSOR_FRAME_MS = 125
+
+def draw_watch(draw, minute_angle=0, hour_angle=90):
+    """
+    Draw the wait cursor watch with its hands at the given angles.
+
+    Args:
+        draw: ImageDraw object for a 16x16 icon
+        minute_angle: Minute hand angle in degrees clockwise from 12
+        hour_angle: Hour hand angle in degrees clockwise from 12
+    """
+    # Watch face
+    draw.ellipse([3, 3, 12, 12], fill=COLORS['white'], outline=COLORS['black'])
+    # Watch hands (ends snapped to the half-pixel grid)
+    cx, cy = 7.5, 7.5
+    for angle in (minute_angle, hour_angle):
+        radians = math.radians(angle)
+        end = (round((cx + 2.5 * math.sin(radians)) * 2) / 2,
+               round((cy - 2.5 * math.cos(radians)) * 2) / 2)
+        draw.line([(cx, cy), end], fill=COLORS['black'])
+    # Watch stem
+    draw.rectangle([6, 1, 9, 3], fill=COLORS['gray_medium'], outline=COLORS['black'])
 
-    # Selected
-    img, draw = create_icon(size=(12, 12))
-    draw.ellipse([0, 0, 11, 11], fill=COLORS['white'], outline=COLORS['black'])
-    # 3D inner shadow
-    draw.arc([1, 1, 10, 10], 180, 270, fill=COLORS['gray_medium'])
-    # Inner dot
-    draw.ellipse([3, 3, 8, 8], fill=COLORS['black'])
-    save_icon(img, 'radio-selected', 'icons/ui')
+def render_wait_cursor(count=WAIT_CURSOR_FRAMES):
+    """
+    Render the wait cursor animation from the parametric watch drawing.
+
+    Returns:
+        Tuple of (sprite strip, list of frames), as render_strip()
+    """
+    return render_strip(
+        lambda draw, i: draw_watch(draw, minute_angle=i * 360 / count), count, (16, 16))
+
+def write_cursor_manifest():
+    """Write cursors/cursors.css and cursors/cursors.json with hotspots."""
+    output_dir = get_output_dir('cursors')
+    css_fallbacks = {'cursor-arrow': 'default', 'cursor-text': 'text',
+                     'cursor-wait': 'wait', 'cursor-hand': 'pointer'}
+    manifest = {}
+    css = ['/* Generated by scripts/generate_icons.py - do not edit. */', '']
+    for name, (x, y) in CURSOR_HOTSPOTS.items():
+        entry = {
+            'png': f'/assets/cursors/{name}.png',
+            'cur': f'/assets/cursors/{name}.cur',
+            'hotspot': [x, y],
+        }
+        if name == 'cursor-wait':
+            entry['ani'] = f'/assets/cursors/{name}.ani'
+            entry['frames'] = WAIT_CURSOR_FRAMES
+            entry['frameMs'] = WAIT_CURSOR_FRAME_MS
+        manifest[name] = entry
+        css.append(f'.{name} {{')
+        css.append(f"  cursor: url('{entry['png']}') {x} {y}, url('{entry['cur']}'), "
+                   f'{css_fallbacks[name]};')
+        css.append('}')
+        css.append('')
+
+    css_path = os.path.join(output_dir, 'cursors.css')
+    write_text_asset(css_path, '\n'.join(css))
+    json_path = os.path.join(output_dir, 'cursors.json')
+    write_json_asset(json_path, manifest)
 
 def generate_cursors():
     """Generate system cursor graphics."""
-    print('Generating cursors...')
+    info('Generating cursors...')
 
     # Arrow cursor (standard)
     img, draw = create_icon(size=(16, 16))
@@ -851,6 +914,7 @@ def generate_cursors():
     ]
     draw.polygon(points, fill=COLORS['white'], outline=COLORS['black'])
     save_icon(img, 'cursor-arrow', 'cursors')
+    save_cursor([img], 'cursor-arrow', CURSOR_HOTSPOTS['cursor-arrow'])
 
     # Text cursor (I-beam)
     img, draw = create_icon(size=(16, 16))
@@ -858,17 +922,13 @@ def generate_cursors():
     draw.line([(6, 2), (10, 2)], fill=COLORS['black'])
     draw.line([(6, 13), (10, 13)], fill=COLORS['black'])
     save_icon(img, 'cursor-text', 'cursors')
+    save_cursor([img], 'cursor-text', CURSOR_HOTSPOTS['cursor-text'])
 
-    # Wait cursor (Watch)
-    img, draw = create_icon(size=(16, 16))
-    # Watch face
-    draw.ellipse([3, 3, 12, 12], fill=COLORS['white'], outline=COLORS['black'])
-    # Watch hands
-    draw.line([(7.5, 7.5), (7.5, 5)], fill=COLORS['black'])
-    draw.line([(7.5, 7.5), (10, 7.5)], fill=COLORS['black'])
-    # Watch stem
-    draw.rectangle([6, 1, 9, 3], fill=COLORS['gray_medium'], outline=COLORS['black'])
-    save_icon(img, 'cursor-wait', 'cursors')
+    # Wait cursor (Watch), static first frame plus the animation
+    _, frames = render_wait_cursor()
+    save_icon(frames[0], 'cursor-wait', 'cursors')
+    save_cursor(frames[:1], 'cursor-wait', CURSOR_HOTSPOTS['cursor-wait'])
+    save_cursor(frames, 'cursor-wait', CURSOR_HOTSPOTS['cursor-wait'], WAIT_CURSOR_FRAME_MS)
 
     # Hand cursor (Pointer)
     img, draw = create_icon(size=(16, 16))
@@ -876,12 +936,14 @@ def generate_cursors():
     draw.rectangle([4, 6, 12, 14], fill=COLORS['white'], outline=COLORS['black'])
     draw.rectangle([4, 2, 6, 6], fill=COLORS['white'], outline=COLORS['black']) # Pointer finger
     save_icon(img, 'cursor-hand', 'cursors')
+    save_cursor([img], 'cursor-hand', CURSOR_HOTSPOTS['cursor-hand'])
 
-    print('Cursors complete!')
+    write_cursor_manifest()
+    info('Cursors complete!')
 
 def generate_menu_bar_elements():
     """Generate menu bar related graphics."""
-    print('Generating menu bar elements...')
+    info('Generating menu bar elements...')
 
     # Apple logo for menu bar
     img, draw = create_icon(size=(16, 16))
@@ -900,16 +962,15 @@ def generate_menu_bar_elements():
     draw.line([(5, 8), (10, 2)], fill=COLORS['black'], width=2)
     save_icon(img, 'menu-checkmark', 'icons/ui')
 
-    print('Menu bar elements complete!')
+    info('Menu bar elements complete!')
 
 
 # ============================================
 # Boot/System Icons
 # ============================================
 
-def generate_happy_mac():
-    """Generate Happy Mac boot icon."""
-    img, draw = create_icon(size=(48, 48))
+def draw_happy_mac(draw, eyes_open=True):
+    """Draw the Happy Mac, optionally with its eyes closed (for blinking)."""
     w, h = 48, 48
 
     # Mac body
@@ -920,8 +981,12 @@ def generate_happy_mac():
 
     # Happy face
     # Eyes
-    draw.rectangle([18, 14, 22, 20], fill=COLORS['black'])
-    draw.rectangle([26, 14, 30, 20], fill=COLORS['black'])
+    if eyes_open:
+        draw.rectangle([18, 14, 22, 20], fill=COLORS['black'])
+        draw.rectangle([26, 14, 30, 20], fill=COLORS['black'])
+    else:
+        draw.rectangle([18, 18, 22, 19], fill=COLORS['black'])
+        draw.rectangle([26, 18, 30, 19], fill=COLORS['black'])
 
     # Nose
     draw.polygon([(23, 22), (25, 26), (21, 26)], fill=COLORS['black'])
@@ -932,6 +997,10 @@ def generate_happy_mac():
     # Base
     draw.rectangle([16, h - 10, w - 17, h - 6], fill=COLORS['gray_medium'], outline=COLORS['black'])
 
+def generate_happy_mac():
+    """Generate Happy Mac boot icon."""
+    img, draw = create_icon(size=(48, 48))
+    draw_happy_mac(draw)
     save_icon(img, 'happy-mac', 'icons/system')
 
 def generate_sad_mac():
@@ -1093,7 +1162,7 @@ def generate_sharing_icon():
 
 def generate_avatar_icons():
     """Generate a set of simple avatar icons."""
-    print('Generating avatar icons...')
+    info('Generating avatar icons...')
     # Avatar 1: Classic Mac
     img, draw = create_icon()
     # Screen
@@ -1119,7 +1188,131 @@ def generate_avatar_icons():
     draw.polygon([(16, 6), (20, 2), (22, 6)], fill=COLORS['green'], outline=COLORS['black'])
     save_icon(img, 'avatar-apple', 'icons/avatars')
 
-    print('Avatar icons complete!')
+    info('Avatar icons complete!')
+
+
+# ============================================
+# Animations
+# ============================================
+
+# Frames of the indeterminate progress bar; one frame per pixel of stripe travel
+PROGRESS_STRIPE_PERIOD = 8
+
+def draw_progress_stripes(draw, offset=0):
+    """Draw the indeterminate (barber pole) progress bar, shifted by offset pixels."""
+    draw.rectangle([0, 0, 31, 11], fill=COLORS['white'], outline=COLORS['black'])
+    for y in range(1, 11):
+        for x in range(1, 31):
+            if (x + y - offset) % PROGRESS_STRIPE_PERIOD < PROGRESS_STRIPE_PERIOD // 2:
+                draw.point((x, y), fill=COLORS['gray_dark'])
+
+def save_animation(manifest, strip, frames, name, subdir, durations):
+    """Save a sprite strip and record its frame layout and timing in manifest."""
+    save_icon(strip, name, subdir)
+    manifest[name] = {
+        'url': f'/assets/{subdir}/{name}.png',
+        'frameWidth': frames[0].width,
+        'frameHeight': frames[0].height,
+        'frames': len(frames),
+        'durations': durations,
+    }
+
+def generate_animations():
+    """
+    Generate sprite strips for animated visuals.
+
+    Each animation is rendered from a parameterised drawing function into a
+    single horizontal strip; icons/animations.json gives the frame size,
+    count and per-frame durations (ms) so the client can animate by moving
+    the background offset.
+    """
+    info('Generating animations...')
+    manifest = {}
+
+    # Blinking Happy Mac: long open, short closed
+    strip, frames = render_strip(
+        lambda draw, i: draw_happy_mac(draw, eyes_open=(i == 0)), 2, (48, 48))
+    save_animation(manifest, strip, frames, 'happy-mac-blink', 'icons/system', [2000, 150])
+
+    # Indeterminate progress bar
+    strip, frames = render_strip(
+        lambda draw, i: draw_progress_stripes(draw, offset=i), PROGRESS_STRIPE_PERIOD, (32, 12))
+    save_animation(manifest, strip, frames, 'progress-indeterminate', 'icons/ui',
+                   [60] * PROGRESS_STRIPE_PERIOD)
+
+    # Spinning wait cursor watch
+    strip, frames = render_wait_cursor()
+    save_animation(manifest, strip, frames, 'cursor-wait-strip', 'cursors',
+                   [WAIT_CURSOR_FRAME_MS] * WAIT_CURSOR_FRAMES)
+
+    filepath = os.path.join(get_output_dir('icons'), 'animations.json')
+    write_json_asset(filepath, manifest)
+    info('Animations complete!')
+
+
+# ============================================
+# Label Variants
+# ============================================
+
+# Finder label colours, mirroring DEFAULT_LABEL_COLORS in
+# app/types/filesystem.ts (index 0 is "None")
+LABEL_COLORS = [
+    None,
+    (255, 128, 0),   # Orange
+    (255, 0, 0),     # Red
+    (255, 0, 255),   # Pink
+    (0, 255, 255),   # Light Blue
+    (0, 0, 255),     # Dark Blue
+    (128, 0, 255),   # Purple
+    (0, 255, 0),     # Green
+]
+
+LABEL_ICON_SIZES = [ICON_SIZE_SMALL, ICON_SIZE_STANDARD, ICON_SIZE_LARGE]
+
+# Base shapes that get label variants: name -> (drawing function, recoloured palette roles)
+LABEL_ICON_SHAPES = {
+    'folder': (draw_folder_base, ('folder_yellow', 'folder_dark')),
+    'folder-open': (draw_folder_open_base, ('folder_yellow', 'folder_dark')),
+    'document': (draw_document_base, ('document_white', 'document_fold')),
+}
+
+def shade(color, factor):
+    """Scale an RGB colour towards black (factor < 1) or white (factor > 1)."""
+    if factor <= 1:
+        return tuple(int(c * factor) for c in color)
+    return tuple(int(c + (255 - c) * (factor - 1)) for c in color)
+
+def get_label_color_map(roles, label_color):
+    """Map a shape's fill and shade colours onto a label colour."""
+    fill_role, dark_role = roles
+    return {
+        COLORS[fill_role]: shade(label_color, 1.5),
+        COLORS[dark_role]: shade(label_color, 0.6),
+    }
+
+def generate_label_icons():
+    """
+    Generate label-coloured folder and document icons.
+
+    Each base shape is drawn once per size and every label colour is then
+    derived by palette remapping, without re-running the drawing code.
+    """
+    info('Generating label icons...')
+    for shape, (draw_base, roles) in LABEL_ICON_SHAPES.items():
+        for size in LABEL_ICON_SIZES:
+            img, _ = create_template_icon(draw_base, size=size)
+            if size != ICON_SIZE_SMALL:
+                img = add_shadow(img)
+            palette, indices, alpha = palette_index(img)
+
+            for label, label_color in enumerate(LABEL_COLORS):
+                if label_color is None:
+                    continue
+                color_map = get_label_color_map(roles, label_color)
+                variant = remap_palette(palette, indices, alpha, color_map)
+                save_icon(variant, f'{shape}-label-{label}-{size[0]}', 'icons/labels')
+
+    info('Label icons complete!')
 
 
 # ============================================
@@ -1128,7 +1321,7 @@ def generate_avatar_icons():
 
 def generate_system_icons():
     """Generate all system icons."""
-    print('Generating system icons...')
+    info('Generating system icons...')
     generate_folder_icon()
     generate_folder_open_icon()
     generate_document_icon()
@@ -1145,11 +1338,11 @@ def generate_system_icons():
     generate_sharing_icon()
     generate_preferences_icon()
     generate_control_panel_icons()
-    print('System icons complete!')
+    info('System icons complete!')
 
 def generate_app_icons():
     """Generate all application icons."""
-    print('Generating application icons...')
+    info('Generating application icons...')
     generate_calculator_icon()
     generate_simpletext_icon()
     generate_notepad_icon()
@@ -1165,11 +1358,11 @@ def generate_app_icons():
     generate_galaga_icon()
     generate_brickle_icon()
     generate_minesweeper_icon()
-    print('Application icons complete!')
+    info('Application icons complete!')
 
 def generate_progress_bar_elements():
     """Generate progress bar related graphics."""
-    print('Generating progress bar elements...')
+    info('Generating progress bar elements...')
 
     # Progress bar track
     img, draw = create_icon(size=(32, 12))
@@ -1186,11 +1379,11 @@ def generate_progress_bar_elements():
                 draw.point((x, y), fill=COLORS['gray_dark'])
     save_icon(img, 'progress-fill', 'icons/ui')
 
-    print('Progress bar elements complete!')
+    info('Progress bar elements complete!')
 
 def generate_ui_icons():
     """Generate all UI element icons."""
-    print('Generating UI icons...')
+    info('Generating UI icons...')
     generate_close_button()
     generate_zoom_button()
     generate_collapse_button()
@@ -1203,39 +1396,16 @@ def generate_ui_icons():
     generate_cursors()
     generate_menu_bar_elements()
     generate_progress_bar_elements()
-    print('UI icons complete!')
+    info('UI icons complete!')
 
 def generate_small_system_icons():
     """Generate 16x16 small versions of system icons."""
-    print('Generating small system icons...')
+    info('Generating small system icons...')
     size = ICON_SIZE_SMALL
 
-    # Folder
-    img, draw = create_icon(size=size)
-    draw_folder_base(draw, size=size)
-    save_icon(img, 'folder-16', 'icons/system')
-
-    # Open Folder
-    img, draw = create_icon(size=size)
-    # Simple open folder for 16x16
-    draw.rectangle([1, 4, 14, 13], fill=COLORS['folder_yellow'], outline=COLORS['black'])
-    draw.line([(1, 4), (5, 4)], fill=COLORS['folder_dark'])
-    save_icon(img, 'folder-open-16', 'icons/system')
-
-    # Document
-    img, draw = create_icon(size=size)
-    draw_document_base(draw, size=size)
-    save_icon(img, 'document-16', 'icons/system')
-
-    # Trash Empty
-    img, draw = create_icon(size=size)
-    draw_trash_base(draw, size=size, is_full=False)
-    save_icon(img, 'trash-empty-16', 'icons/system')
-
-    # Trash Full
-    img, draw = create_icon(size=size)
-    draw_trash_base(draw, size=size, is_full=True)
-    save_icon(img, 'trash-full-16', 'icons/system')
+    # Folders, document and trash
+    save_composed_icons(*(f'icons/system/{name}-16' for name in (
+        'folder', 'folder-open', 'document', 'trash-empty', 'trash-full')))
 
     # Sharing
     img, draw = create_icon(size=size)
@@ -1247,11 +1417,11 @@ def generate_small_system_icons():
     draw.polygon([(0, 15), (10, 15), (8, 11), (2, 11)], fill=COLORS['white'], outline=COLORS['black'])
     save_icon(img, 'sharing-16', 'icons/system')
 
-    print('Small system icons complete!')
+    info('Small system icons complete!')
 
 def generate_miscellaneous_graphics():
     """Generate miscellaneous system graphics."""
-    print('Generating miscellaneous graphics...')
+    info('Generating miscellaneous graphics...')
 
     # Dialog box border (small sample to show the style)
     # Mac OS 7 dialogs have a 2px black border, then a 1px white, then 1px black
@@ -1260,7 +1430,7 @@ def generate_miscellaneous_graphics():
     draw.rectangle([3, 3, 28, 28], outline=COLORS['black'], width=1)
     save_icon(img, 'dialog-border-sample', 'icons/ui')
 
-    print('Miscellaneous graphics complete!')
+    info('Miscellaneous graphics complete!')
 
 def generate_minesweeper_icon():
     """Generate Minesweeper game icon."""
@@ -1296,9 +1466,11 @@ def generate_all_icons():
     generate_small_system_icons()
     generate_app_icons()
     generate_avatar_icons()
+    generate_label_icons()
     generate_ui_icons()
+    generate_animations()
     generate_miscellaneous_graphics()
-    print('\nAll icons generated successfully!')
+    info('\nAll icons generated successfully!')
 
 
 # ============================================
@@ -1314,8 +1486,12 @@ if __name__ == '__main__':
     parser.add_argument('--small', action='store_true', help='Generate small icons only')
     parser.add_argument('--apps', action='store_true', help='Generate application icons only')
     parser.add_argument('--ui', action='store_true', help='Generate UI icons only')
+    parser.add_argument('--labels', action='store_true', help='Generate label-coloured icons only')
+    parser.add_argument('--animations', action='store_true', help='Generate animation sprite strips only')
+    add_logging_arguments(parser)
 
     args = parser.parse_args()
+    configure_from_args(args)
 
     if args.system:
         generate_system_icons()
@@ -1325,6 +1501,12 @@ if __name__ == '__main__':
         generate_app_icons()
     elif args.ui:
         generate_ui_icons()
+    elif args.labels:
+        generate_label_icons()
+    elif args.animations:
+        generate_animations()
     else:
         # Default: generate all
         generate_all_icons()
+
+    print_summary()
@@ -4,22 +4,33 @@ m00-os-7 Desktop Pattern Generator
 
 Generates Mac OS 7 style desktop background patterns using PIL.
 Patterns are typically 8x8 or 16x16 tiles that repeat.
+
+With --tiled, each pattern is also pre-tiled into larger renditions
+(patterns/tiled/<name>-<w>x<h>.png, palette-indexed PNGs) and a size vs.
+paint-cost report is written to patterns/tiled/report.json.
+
+Usage:
+    python -m scripts.generate_patterns [--tiled] [--size WxH ...]
 """
 
-import sys
 import os
 
-# Add scripts directory to path for imports
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from ._lazy import lazy_import
+from .build_log import add_logging_arguments, configure_from_args, info, print_summary
+from .asset_utils import (
+    COLORS, capture_assets, encode_png, get_output_dir, palette_index, save_icon,
+    write_asset, write_json_asset
+)
+
+np = lazy_import('numpy')
+Image = lazy_import('PIL.Image')
+ImageDraw = lazy_import('PIL.ImageDraw')
 
-from asset_utils import COLORS, get_output_dir
-from PIL import Image, ImageDraw
+# Default renditions for --tiled: a large tile and a full HD screen
+TILED_SIZES = [(256, 256), (1920, 1080)]
 
 def save_pattern(img, name):
-    output_dir = get_output_dir('patterns')
-    filepath = os.path.join(output_dir, f'{name}.png')
-    img.save(filepath, 'PNG')
-    print(f'Saved pattern: {filepath}')
+    return save_icon(img, name, 'patterns')
 
 def create_pattern_tile(size=(16, 16)):
     img = Image.new('RGB', size, COLORS['white'])
@@ -134,8 +145,65 @@ def generate_maze():
                 draw.line([(x, y + 3), (x + 3, y)], fill=COLORS['black'])
     save_pattern(img, 'maze')
 
-def generate_all():
-    print('Generating desktop patterns...')
+def pretile(img, size):
+    """
+    Repeat a pattern tile over size in one operation.
+
+    The tile is tiled as palette indices and encoded as an indexed ('P')
+    PNG, so the large rendition costs about as much to store as the
+    number of distinct colours allows.
+    """
+    palette, indices, _ = palette_index(img)
+    w, h = size
+    reps = (-(-h // img.height), -(-w // img.width))
+    tiled = np.tile(indices.astype(np.uint8), reps)[:h, :w]
+    result = Image.frombytes('P', size, np.ascontiguousarray(tiled).tobytes())
+    result.putpalette(palette.flatten().tolist())
+    return result
+
+def generate_tiled(sizes=TILED_SIZES):
+    """Pre-tile every pattern into each size and report the trade-offs."""
+    info('Generating pre-tiled patterns...')
+    with capture_assets() as captured:
+        generate_all_tiles()
+
+    output_dir = get_output_dir('patterns/tiled')
+    report = {}
+    for key, tile in captured.items():
+        name = key.split('/', 1)[1]
+        tile_bytes = len(encode_png(tile, optimize=True))
+        entries = [{
+            'size': f'{tile.width}x{tile.height}',
+            'url': f'/assets/patterns/{name}.png',
+            'bytes': tile_bytes,
+            # Tiles the browser paints to cover a 1920x1080 screen
+            'paint_tiles': -(-1920 // tile.width) * -(-1080 // tile.height),
+            'decoded_bytes': tile.width * tile.height * 4,
+        }]
+        for w, h in sizes:
+            data = encode_png(pretile(tile, (w, h)), optimize=True)
+            write_asset(os.path.join(output_dir, f'{name}-{w}x{h}.png'), data)
+            entries.append({
+                'size': f'{w}x{h}',
+                'url': f'/assets/patterns/tiled/{name}-{w}x{h}.png',
+                'bytes': len(data),
+                'paint_tiles': -(-1920 // w) * -(-1080 // h),
+                'decoded_bytes': w * h * 4,
+            })
+        report[name] = entries
+
+    write_json_asset(os.path.join(output_dir, 'report.json'), report)
+
+    lines = [f'{"pattern":<18} {"size":>10} {"bytes":>8} {"tiles/paint":>12} {"decoded":>10}']
+    for name, entries in report.items():
+        lines += [f'{name:<18} {entry["size"]:>10} {entry["bytes"]:>8} '
+                  f'{entry["paint_tiles"]:>12} {entry["decoded_bytes"]:>10}'
+                  for entry in entries]
+    info('\n'.join(lines))
+    info('Pre-tiled patterns complete!')
+
+def generate_all_tiles():
+    """Run every pattern generator."""
     generate_standard_gray()
     generate_stripes()
     generate_dots()
@@ -146,7 +214,29 @@ def generate_all():
     generate_circuit()
     generate_diagonal()
     generate_maze()
-    print('All patterns generated successfully!')
+
+def generate_all():
+    info('Generating desktop patterns...')
+    generate_all_tiles()
+    info('All patterns generated successfully!')
+
+def parse_size(value):
+    w, _, h = value.partition('x')
+    return int(w), int(h)
 
 if __name__ == '__main__':
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Generate Mac OS 7 style desktop patterns')
+    parser.add_argument('--tiled', action='store_true',
+                        help='Also write pre-tiled renditions and a size/paint-cost report')
+    parser.add_argument('--size', type=parse_size, action='append', dest='sizes',
+                        help='Pre-tiled size as WxH (repeatable, default: 256x256 1920x1080)')
+    add_logging_arguments(parser)
+
+    args = parser.parse_args()
+    configure_from_args(args)
     generate_all()
+    if args.tiled:
+        generate_tiled(args.sizes or TILED_SIZES)
+    print_summary()
@@ -1,22 +1,31 @@
+import io
 import wave
 import struct
 import math
-import os
-import random
-
-def get_output_dir(subdir='sounds'):
-    """Get the output directory for generated sounds."""
-    base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-    output_dir = os.path.join(base_dir, 'public', 'assets', subdir)
-    os.makedirs(output_dir, exist_ok=True)
-    return output_dir
-
-def save_wav(name, data, sample_rate=44100):
-    """Save a list of floats as a 16-bit PCM WAV file."""
-    output_dir = get_output_dir()
-    file_path = os.path.join(output_dir, f"{name}.wav")
-
-    with wave.open(file_path, 'w') as wav_file:
+import zlib
+
+from ._lazy import lazy_import
+from .asset_utils import get_output_layout, write_asset
+from .build_log import add_logging_arguments, configure_from_args, info, print_summary
+
+np = lazy_import('numpy')
+
+# Build configuration shared by all sound generators. Every stochastic
+# generator draws from a PRNG seeded from 'seed', so rebuilding produces
+# byte-identical WAV files.
+SOUND_CONFIG = {
+    'sample_rate': 44100,
+    'seed': 1991,
+}
+
+def save_wav(name, data, sample_rate=None):
+    """Save a list of floats as a 16-bit PCM WAV file (at SOUND_CONFIG's rate by default)."""
+    if sample_rate is None:
+        sample_rate = SOUND_CONFIG['sample_rate']
+    file_path = get_output_layout().file('sounds', f"{name}.wav")
+
+    buffer = io.BytesIO()
+    with wave.open(buffer, 'wb') as wav_file:
         wav_file.setnchannels(1)  # Mono
         wav_file.setsampwidth(2)  # 2 bytes (16-bit)
         wav_file.setframerate(sample_rate)
@@ -28,11 +37,23 @@ def save_wav(name, data, sample_rate=44100):
             sample = int(value * 32767)
             wav_file.writeframes(struct.pack('<h', sample))
 
-    print(f"Generated: {file_path}")
+    write_asset(file_path, buffer.getvalue())
+
+def noise(name, count, seed=None):
+    """
+    White noise in [-1, 1) for the sound called name.
+
+    Each sound gets its own stream derived from (seed, name), so adding or
+    reordering generators never changes the bytes of another sound.
+    """
+    if seed is None:
+        seed = SOUND_CONFIG['seed']
+    rng = np.random.default_rng([seed, zlib.crc32(name.encode('utf-8'))])
+    return rng.uniform(-1.0, 1.0, count)
 
 def generate_beep():
     """Classic system beep."""
-    sample_rate = 44100
+    sample_rate = SOUND_CONFIG['sample_rate']
     duration = 0.15
     freq = 440.0
     data = []
@@ -43,11 +64,12 @@ def generate_beep():
         data.append(val)
     save_wav('beep', data)
 
-def generate_quack():
+def generate_quack(seed=None):
     """Duck quack-ish sound."""
-    sample_rate = 44100
+    sample_rate = SOUND_CONFIG['sample_rate']
     duration = 0.3
     data = []
+    samples = noise('quack', int(duration * sample_rate), seed)
     for i in range(int(duration * sample_rate)):
         t = i / sample_rate
         # Modulated frequency for the 'quack' effect
@@ -55,7 +77,7 @@ def generate_quack():
         # Mix of square and sine with noise
         val = 0.4 * (1.0 if math.sin(2 * math.pi * freq * t) > 0 else -1.0)
         val += 0.2 * math.sin(2 * math.pi * freq * 2 * t)
-        val += 0.1 * (random.random() * 2 - 1)
+        val += 0.1 * samples[i]
         # Envelope
         env = 1.0 if t < 0.2 else (0.3 - t) / 0.1
         data.append(val * env * 0.5)
@@ -63,7 +85,7 @@ def generate_quack():
 
 def generate_droplet():
     """Water drop sound."""
-    sample_rate = 44100
+    sample_rate = SOUND_CONFIG['sample_rate']
     duration = 0.2
     data = []
     for i in range(int(duration * sample_rate)):
@@ -78,7 +100,7 @@ def generate_droplet():
 
 def generate_indigo():
     """Metallic chime sound."""
-    sample_rate = 44100
+    sample_rate = SOUND_CONFIG['sample_rate']
     duration = 0.5
     data = []
     frequencies = [440, 660, 880, 1100]
@@ -94,7 +116,7 @@ def generate_indigo():
 
 def generate_sosumi():
     """Short, percussive sound."""
-    sample_rate = 44100
+    sample_rate = SOUND_CONFIG['sample_rate']
     duration = 0.25
     data = []
     for i in range(int(duration * sample_rate)):
@@ -111,7 +133,7 @@ def generate_sosumi():
 
 def generate_wild_eep():
     """Sharp, high-pitched eep."""
-    sample_rate = 44100
+    sample_rate = SOUND_CONFIG['sample_rate']
     duration = 0.12
     data = []
     for i in range(int(duration * sample_rate)):
@@ -129,15 +151,94 @@ def generate_wild_eep():
         data.append(val * env * 0.3)
     save_wav('wild-eep', data)
 
-def main():
-    print("Generating alert sounds...")
+def exponential_ramp(start, end, t, duration):
+    """Gain of a Web Audio exponentialRampToValueAtTime() ramp at time t."""
+    if t >= duration:
+        return end
+    return start * (end / start) ** (t / duration)
+
+def highpass(data, cutoff, sample_rate=None, q=1.0):
+    """Second-order high-pass filter (the Web Audio 'highpass' biquad)."""
+    if sample_rate is None:
+        sample_rate = SOUND_CONFIG['sample_rate']
+    w0 = 2 * math.pi * cutoff / sample_rate
+    alpha = math.sin(w0) / (2 * q)
+    cos_w0 = math.cos(w0)
+    a0 = 1 + alpha
+    b0 = (1 + cos_w0) / 2 / a0
+    b1 = -(1 + cos_w0) / a0
+    b2 = b0
+    a1 = -2 * cos_w0 / a0
+    a2 = (1 - alpha) / a0
+
+    out = []
+    x1 = x2 = y1 = y2 = 0.0
+    for x in data:
+        y = b0 * x + b1 * x1 + b2 * x2 - a1 * y1 - a2 * y2
+        x2, x1 = x1, x
+        y2, y1 = y1, y
+        out.append(y)
+    return out
+
+def generate_startup_chime():
+    """Startup chime: C major chord of square waves (see useSound.ts)."""
+    sample_rate = SOUND_CONFIG['sample_rate']
+    duration = 2.0
+    data = []
+    # C major chord: C3, E3, G3, C4
+    frequencies = [130.81, 164.81, 196.00, 261.63]
+    for i in range(int(duration * sample_rate)):
+        t = i / sample_rate
+        val = 0
+        for f in frequencies:
+            val += 1.0 if math.sin(2 * math.pi * f * t) > 0 else -1.0
+        # Each voice ramps from 0.1 down to silence over the full duration
+        env = exponential_ramp(0.1, 0.0001, t, duration)
+        data.append(val * env)
+    save_wav('startup-chime', data)
+
+def generate_trash(seed=None):
+    """Crumpling paper: high-passed white noise (see useSound.ts)."""
+    sample_rate = SOUND_CONFIG['sample_rate']
+    duration = 0.3
+    samples = noise('trash', int(duration * sample_rate), seed)
+    data = []
+    for i, val in enumerate(highpass(samples.tolist(), 1000, sample_rate)):
+        t = i / sample_rate
+        env = exponential_ramp(0.2, 0.01, t, duration)
+        data.append(val * env)
+    save_wav('trash', data)
+
+def generate_alert_sounds(seed=None):
+    """Generate the alert sounds offered in the Sound control panel."""
+    info("Generating alert sounds...")
     generate_beep()
-    generate_quack()
+    generate_quack(seed)
     generate_droplet()
     generate_indigo()
     generate_sosumi()
     generate_wild_eep()
-    print("All sounds generated successfully.")
+
+def generate_effect_sounds(seed=None):
+    """Pre-render the effects useSound.ts would otherwise synthesise at runtime."""
+    info("Generating effect sounds...")
+    generate_startup_chime()
+    generate_trash(seed)
+
+def main(seed=None):
+    generate_alert_sounds(seed)
+    generate_effect_sounds(seed)
+    info("All sounds generated successfully.")
 
 if __name__ == '__main__':
-    main()
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Generate Mac OS 7 style sounds')
+    parser.add_argument('--seed', type=int, default=SOUND_CONFIG['seed'],
+                        help='Seed for noise-based sounds (default: %(default)s)')
+    add_logging_arguments(parser)
+
+    args = parser.parse_args()
+    configure_from_args(args)
+    main(args.seed)
+    print_summary()
@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+"""
+m00-os-7 Theme Generator
+
+Recolours the generated asset set into alternative colour schemes.
+
+Every asset is drawn from the COLORS palette, so instead of re-running the
+generators for each theme, the base assets are indexed once (palette_index)
+and each theme is derived by pushing the index buffers through a colour
+lookup table (remap_palette). Themes are rendered in parallel, one worker
+process per theme.
+
+Run the icon, pattern and card generators first; this script reads their
+output from public/assets.
+
+Usage:
+    python -m scripts.generate_themes [--theme NAME ...] [--jobs N]
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from ._lazy import lazy_import
+from .build_log import add_logging_arguments, configure_from_args, info, print_summary
+from .asset_utils import (
+    COLORS, encode_png, get_output_dir, get_output_layout, output_layout, palette_index,
+    remap_palette, write_asset, write_json_asset
+)
+
+Image = lazy_import('PIL.Image')
+
+
+# ============================================
+# Theme Definitions
+# ============================================
+
+# Each theme overrides entries of COLORS by name. Names that share a value
+# in COLORS (e.g. 'blue' and 'highlight') share one palette entry, so only
+# one of them should be overridden.
+THEMES = {
+    'platinum': {
+        'label': 'Platinum',
+        'colors': {
+            'gray_light': (221, 221, 221),
+            'gray_medium': (170, 170, 170),
+            'gray_dark': (119, 119, 119),
+            'desktop_blue': (102, 102, 204),
+            'folder_yellow': (153, 153, 255),
+            'folder_dark': (102, 102, 204),
+        },
+    },
+    'graphite': {
+        'label': 'Graphite',
+        'colors': {
+            'blue': (68, 68, 85),
+            'cyan': (187, 187, 204),
+            'desktop_blue': (119, 119, 119),
+            'yellow': (204, 204, 204),
+            'folder_yellow': (187, 187, 187),
+            'folder_dark': (136, 136, 136),
+        },
+    },
+    'high-contrast': {
+        'label': 'High Contrast',
+        'colors': {
+            'gray_light': (255, 255, 255),
+            'gray_medium': (0, 0, 0),
+            'gray_dark': (0, 0, 0),
+            'desktop_blue': (0, 0, 0),
+            'folder_dark': (0, 0, 0),
+        },
+    },
+}
+
+# Asset groups that are recoloured (sounds are not images)
+THEMED_SUBDIRS = ['icons', 'cursors', 'patterns', 'cards']
+
+# Renditions derived from other assets, which the full build does not
+# recolour either
+UNTHEMED_SUBDIRS = ['patterns/tiled']
+
+# ============================================
+# Theme Rendering
+# ============================================
+
+def get_color_map(theme):
+    """Build the RGB -> RGB lookup for a theme definition."""
+    return {COLORS[name]: color for name, color in theme['colors'].items()}
+
+def load_base_assets():
+    """
+    Index every base asset once.
+
+    Returns:
+        List of (relative path, mode, palette, indices, alpha) tuples
+    """
+    assets_dir = get_output_dir()
+    base_assets = []
+    for subdir in THEMED_SUBDIRS:
+        root_dir = os.path.join(assets_dir, subdir)
+        for dirpath, _, filenames in sorted(os.walk(root_dir)):
+            reldir = os.path.relpath(dirpath, assets_dir).replace(os.sep, '/')
+            if any(reldir == skip or reldir.startswith(skip + '/') for skip in UNTHEMED_SUBDIRS):
+                continue
+            for filename in sorted(filenames):
+                if not filename.endswith('.png'):
+                    continue
+                filepath = os.path.join(dirpath, filename)
+                with Image.open(filepath) as img:
+                    mode = 'RGB' if img.mode == 'RGB' else 'RGBA'
+                    palette, indices, alpha = palette_index(img)
+                relpath = os.path.relpath(filepath, assets_dir).replace(os.sep, '/')
+                base_assets.append((relpath, mode, palette, indices, alpha))
+    return base_assets
+
+def render_theme(name, theme, base_assets, root):
+    """
+    Render one theme from the indexed base assets (in a worker process).
+
+    Args:
+        name: Theme name
+        theme: Theme definition from THEMES
+        base_assets: load_base_assets() output
+        root: Assets root to write below; passed explicitly, as a spawned
+            worker does not inherit an output_layout() override
+
+    Returns:
+        List of relative paths written under themes/<name>
+    """
+    color_map = get_color_map(theme)
+    written = []
+    with output_layout(root) as layout:
+        for relpath, mode, palette, indices, alpha in base_assets:
+            img = remap_palette(palette, indices, alpha, color_map, mode)
+            subdir, filename = os.path.split(relpath)
+            filepath = layout.file(f'themes/{name}/{subdir}', filename)
+            write_asset(filepath, encode_png(img))
+            written.append(relpath)
+    info(f'Saved theme: {name} ({len(written)} assets)')
+    return written
+
+def write_manifest(themes, assets):
+    """Write themes/manifest.json describing every rendered theme."""
+    manifest = {
+        'base': '/assets',
+        'assets': assets,
+        'themes': {
+            name: {
+                'label': theme['label'],
+                'path': f'/assets/themes/{name}',
+                'colors': {
+                    color_name: '#%02x%02x%02x' % color
+                    for color_name, color in theme['colors'].items()
+                },
+            }
+            for name, theme in themes.items()
+        },
+    }
+    filepath = os.path.join(get_output_dir('themes'), 'manifest.json')
+    write_json_asset(filepath, manifest)
+
+def generate_themes(names=None, jobs=None):
+    """
+    Render the selected themes (all by default) in parallel.
+
+    Args:
+        names: Theme names to render, or None for every theme in THEMES
+        jobs: Number of worker processes (default: one per CPU)
+    """
+    themes = {name: THEMES[name] for name in (names or THEMES)}
+
+    info('Indexing base assets...')
+    base_assets = load_base_assets()
+    root = get_output_layout().root
+
+    info(f'Generating {len(themes)} themes...')
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        futures = [
+            executor.submit(render_theme, name, theme, base_assets, root)
+            for name, theme in themes.items()
+        ]
+        for future in futures:
+            future.result()
+
+    write_manifest(themes, [asset[0] for asset in base_assets])
+    info('All themes generated successfully!')
+
+
+# ============================================
+# CLI Entry Point
+# ============================================
+
+if __name__ == '__main__':
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Generate Mac OS 7 colour themes')
+    parser.add_argument('--theme', action='append', choices=sorted(THEMES),
+                        help='Theme to generate (repeatable, default: all)')
+    parser.add_argument('--jobs', type=int, default=None,
+                        help='Number of worker processes (default: CPU count)')
+    add_logging_arguments(parser)
+
+    args = parser.parse_args()
+    configure_from_args(args)
+    generate_themes(args.theme, args.jobs)
+    print_summary()
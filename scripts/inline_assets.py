@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+m00-os-7 Inline Asset Bundler
+
+Base64-encodes every generated asset below a byte threshold into data URIs,
+so tiny window-chrome graphics (buttons, checkboxes, scrollbar parts)
+can render at first paint without a request each.
+
+Writes two generated modules:
+    app/utils/inlineAssets.ts        INLINE_ASSETS: asset URL -> data URI
+    app/assets/css/inline-assets.css --asset-<group>-<name> custom properties
+
+Neither is loaded globally: a component that draws with these graphics
+calls inlineAssetUrl() (auto-imported from app/utils) or imports the CSS
+module in its <style> block, so pages that don't use them don't pay for
+the data URIs.
+
+Run after the generators; reads the PNGs from public/assets.
+
+Usage:
+    python -m scripts.inline_assets [--max-bytes N] [--dir SUBDIR ...]
+"""
+
+import os
+import base64
+
+from .asset_utils import get_output_dir, write_text_asset
+from .build_log import add_logging_arguments, configure_from_args, info, print_summary
+
+
+# Asset subdirectories bundled by default (generate_ui_icons() output)
+INLINE_DIRS = ['icons/ui']
+
+# Assets larger than this stay separate requests
+INLINE_MAX_BYTES = 1024
+
+MIME_TYPES = {
+    '.png': 'image/png',
+    '.svg': 'image/svg+xml',
+}
+
+HEADER = 'Generated by scripts/inline_assets.py - do not edit.'
+
+# Generated modules, relative to the project directory
+TS_MODULE = 'app/utils/inlineAssets.ts'
+CSS_MODULE = 'app/assets/css/inline-assets.css'
+
+def get_project_dir():
+    return os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def collect_assets(dirs=INLINE_DIRS, max_bytes=INLINE_MAX_BYTES):
+    """
+    Find assets at or below max_bytes.
+
+    Returns:
+        List of (asset URL, data URI) tuples sorted by URL
+    """
+    assets_dir = get_output_dir()
+    inlined = []
+    for subdir in dirs:
+        root_dir = os.path.join(assets_dir, subdir)
+        for dirpath, _, filenames in os.walk(root_dir):
+            for filename in filenames:
+                mime = MIME_TYPES.get(os.path.splitext(filename)[1])
+                filepath = os.path.join(dirpath, filename)
+                if mime is None or os.path.getsize(filepath) > max_bytes:
+                    continue
+                with open(filepath, 'rb') as f:
+                    data = base64.b64encode(f.read()).decode('ascii')
+                relpath = os.path.relpath(filepath, assets_dir).replace(os.sep, '/')
+                inlined.append((f'/assets/{relpath}', f'data:{mime};base64,{data}'))
+    return sorted(inlined)
+
+def css_property_name(url):
+    """'/assets/icons/ui/close-button.png' -> '--asset-icons-ui-close-button'"""
+    path = os.path.splitext(url[len('/assets/'):])[0]
+    return '--asset-' + path.replace('/', '-')
+
+def write_ts_module(inlined, filepath):
+    lines = [
+        f'// {HEADER}',
+        '',
+        '/** Data URIs for small generated assets, keyed by their /assets URL. */',
+        'export const INLINE_ASSETS: Record<string, string> = {',
+    ]
+    lines += [f"  '{url}': '{data_uri}'," for url, data_uri in inlined]
+    lines += [
+        '}',
+        '',
+        '/** Returns the inlined data URI for an asset URL, or the URL itself. */',
+        'export function inlineAssetUrl(url: string): string {',
+        '  return INLINE_ASSETS[url] ?? url',
+        '}',
+        '',
+    ]
+    return write_text_asset(filepath, '\n'.join(lines))
+
+def write_css_module(inlined, filepath):
+    lines = [f'/* {HEADER} */', '', ':root {']
+    lines += [f'  {css_property_name(url)}: url("{data_uri}");' for url, data_uri in inlined]
+    lines += ['}', '']
+    return write_text_asset(filepath, '\n'.join(lines))
+
+def generate_inline_assets(dirs=INLINE_DIRS, max_bytes=INLINE_MAX_BYTES):
+    """Write the TS and CSS data-URI modules."""
+    info(f'Inlining assets up to {max_bytes} bytes...')
+    inlined = collect_assets(dirs, max_bytes)
+
+    project_dir = get_project_dir()
+    ts_path = os.path.join(project_dir, *TS_MODULE.split('/'))
+    css_path = os.path.join(project_dir, *CSS_MODULE.split('/'))
+    write_ts_module(inlined, ts_path)
+    write_css_module(inlined, css_path)
+
+    encoded = sum(len(data_uri) for _, data_uri in inlined)
+    info(f'Inlined {len(inlined)} assets ({encoded} bytes of data URIs)')
+
+
+# ============================================
+# CLI Entry Point
+# ============================================
+
+if __name__ == '__main__':
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Bundle small assets as data URIs')
+    parser.add_argument('--max-bytes', type=int, default=INLINE_MAX_BYTES,
+                        help='Largest file to inline (default: %(default)s)')
+    parser.add_argument('--dir', action='append', dest='dirs',
+                        help='Asset subdirectory to scan (repeatable, default: icons/ui)')
+    add_logging_arguments(parser)
+
+    args = parser.parse_args()
+    configure_from_args(args)
+    generate_inline_assets(args.dirs or INLINE_DIRS, args.max_bytes)
+    print_summary()
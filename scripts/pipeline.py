@@ -0,0 +1,223 @@
+"""
+m00-os-7 Asset Build Pipeline
+
+Splits a build into three overlapping stages:
+
+    render   generator units run in worker processes under defer_writes()
+             and return their outputs (images or encoded bytes)
+    encode   images are PNG-encoded in a thread pool; Pillow's zlib
+             releases the GIL, so encoders run alongside the main thread
+    write    encoded files go through a bounded queue to one writer
+             thread that calls the sink (write_asset() by default, or
+             e.g. asset_pack.PackWriter.write)
+
+Each boundary is bounded. When encoders fall behind, submit() blocks the
+render collector; when the writer falls behind, encoders block on the
+queue. Time spent blocked is reported per stage as backpressure.
+
+Images are hashed by pixel buffer on submission. The first output with a
+given hash is encoded; later identical ones are recorded in `aliases` and
+written with the canonical copy's bytes instead of being encoded again.
+Every submitted path is still written, since the app and the manifests
+refer to all of them. Submit in a deterministic order to keep the
+canonical copies stable.
+
+Encoded bytes are not kept once they are queued: duplicates submitted
+while their canonical copy is being encoded are written along with it,
+and later ones are copied by the writer thread, which reads the
+canonical copy back from the sink.
+"""
+
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Set
+
+from .asset_utils import encode_png, pixel_hash, read_asset, write_asset
+from .build_log import asset_name, event
+
+
+# ============================================
+# Stage Metrics
+# ============================================
+
+class StageMetrics:
+    """Thread-safe counters for one pipeline stage."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.items = 0
+        self.bytes = 0
+        self.busy = 0.0
+        self.blocked = 0.0
+        self.stalls = 0
+        self._lock = threading.Lock()
+
+    def record(self, seconds: float, items: int = 1, nbytes: int = 0) -> None:
+        """Record work done by the stage."""
+        with self._lock:
+            self.items += items
+            self.bytes += nbytes
+            self.busy += seconds
+
+    def record_stall(self, seconds: float) -> None:
+        """Record time the stage spent blocked on the next one."""
+        with self._lock:
+            self.stalls += 1
+            self.blocked += seconds
+
+# ============================================
+# Pipeline
+# ============================================
+
+class AssetPipeline:
+    """
+    Encodes and writes outputs handed over by render workers.
+
+    Args:
+        encode_threads: Size of the PNG encoder pool
+        queue_size: Capacity of the write queue (and of the encoder backlog
+            per thread)
+        sink: Called as sink(filepath, data) by the writer thread; returns
+            False for an unchanged file
+        read: Called as read(filepath) by the writer thread to read back a
+            file the sink wrote (the canonical copy of a duplicate)
+    """
+
+    def __init__(self, encode_threads: int = 4, queue_size: int = 64, sink=write_asset,
+                 read=read_asset):
+        self.metrics: Dict[str, StageMetrics] = {
+            name: StageMetrics(name) for name in ('render', 'encode', 'write')
+        }
+        self.written = 0
+        self.unchanged = 0
+        # filepath -> pixel hash of every unique image
+        self.pixel_hashes: Dict[str, str] = {}
+        # filepath of a duplicate -> filepath of its canonical copy
+        self.aliases: Dict[str, str] = {}
+        self._canonical: Dict[str, str] = {}
+        # Canonical filepaths already queued for writing, and duplicates
+        # waiting for a canonical copy that is still being encoded
+        self._queued: Set[str] = set()
+        self._waiting: Dict[str, List[str]] = {}
+        self._alias_lock = threading.Lock()
+        self.max_queue_depth = 0
+        self._start = time.perf_counter()
+        self._errors = []
+        self._sink = sink
+        self._read = read
+
+        self._encode_pool = ThreadPoolExecutor(encode_threads, thread_name_prefix='encode')
+        self._encode_slots = threading.BoundedSemaphore(encode_threads * queue_size)
+        self._write_queue = queue.Queue(maxsize=queue_size)
+        self._writer = threading.Thread(target=self._write_loop, name='writer', daemon=True)
+        self._writer.start()
+
+    def submit(self, filepath: str, payload) -> None:
+        """
+        Queue one output: an image to encode or bytes ready to write.
+
+        An image whose pixels match an earlier one becomes an alias of it
+        and is written with the earlier one's encoded bytes. Blocks while
+        the encoder backlog or the write queue is full.
+        """
+        if isinstance(payload, bytes):
+            self._enqueue(self.metrics['render'], filepath, payload)
+            return
+
+        digest = pixel_hash(payload)
+        canonical = self._canonical.setdefault(digest, filepath)
+        if canonical != filepath:
+            self.aliases[filepath] = canonical
+            event('dedupe', filepath, canonical=asset_name(canonical))
+            with self._alias_lock:
+                if canonical in self._queued:
+                    # Queued behind the canonical copy, so the writer can read it back
+                    self._enqueue(self.metrics['render'], filepath, None, canonical)
+                else:
+                    self._waiting.setdefault(canonical, []).append(filepath)
+            return
+        self.pixel_hashes[filepath] = digest
+
+        if not self._encode_slots.acquire(blocking=False):
+            start = time.perf_counter()
+            self._encode_slots.acquire()
+            self.metrics['render'].record_stall(time.perf_counter() - start)
+        future = self._encode_pool.submit(self._encode, filepath, payload)
+        future.add_done_callback(self._encode_done)
+
+    def close(self) -> None:
+        """Drain every stage and stop the threads; re-raises the first error."""
+        self._encode_pool.shutdown(wait=True)
+        self._write_queue.put(None)
+        self._writer.join()
+        if self._errors:
+            raise self._errors[0]
+
+    @property
+    def elapsed(self) -> float:
+        return time.perf_counter() - self._start
+
+    def _encode(self, filepath: str, img) -> None:
+        start = time.perf_counter()
+        data = encode_png(img)
+        seconds = time.perf_counter() - start
+        self.metrics['encode'].record(seconds, nbytes=len(data))
+        event('encode', filepath, seconds, len(data))
+        with self._alias_lock:
+            for target in [filepath] + self._waiting.pop(filepath, []):
+                self._enqueue(self.metrics['encode'], target, data)
+            self._queued.add(filepath)
+
+    def _encode_done(self, future) -> None:
+        self._encode_slots.release()
+        if future.exception() is not None:
+            self._errors.append(future.exception())
+
+    def _enqueue(self, stage: StageMetrics, filepath: str, data: Optional[bytes],
+                 source: Optional[str] = None) -> None:
+        """Queue a write of data, or (with data None) a copy of source."""
+        item = (filepath, data, source)
+        try:
+            self._write_queue.put_nowait(item)
+        except queue.Full:
+            start = time.perf_counter()
+            self._write_queue.put(item)
+            stage.record_stall(time.perf_counter() - start)
+        self.max_queue_depth = max(self.max_queue_depth, self._write_queue.qsize())
+
+    def _write_loop(self) -> None:
+        while True:
+            item = self._write_queue.get()
+            if item is None:
+                return
+            if self._errors:
+                # Keep draining so producers never block on a dead writer
+                continue
+            filepath, data, source = item
+            start = time.perf_counter()
+            try:
+                if data is None:
+                    data = self._read(source)
+                if self._sink(filepath, data):
+                    self.written += 1
+                else:
+                    self.unchanged += 1
+            except Exception as e:
+                self._errors.append(e)
+                continue
+            self.metrics['write'].record(time.perf_counter() - start, nbytes=len(data))
+
+    def report(self) -> str:
+        """Format a per-stage throughput and backpressure table."""
+        elapsed = self.elapsed
+        lines = [f'{"stage":<8} {"items":>7} {"busy s":>8} {"items/s":>9} '
+                 f'{"KiB":>8} {"stalls":>7} {"blocked s":>10}']
+        for stage in self.metrics.values():
+            rate = stage.items / elapsed if elapsed else 0.0
+            lines.append(f'{stage.name:<8} {stage.items:>7} {stage.busy:>8.2f} {rate:>9.1f} '
+                         f'{stage.bytes / 1024:>8.1f} {stage.stalls:>7} {stage.blocked:>10.2f}')
+        lines.append(f'{elapsed:.2f}s wall, {self.written} written, {self.unchanged} unchanged, '
+                     f'{len(self.aliases)} duplicates not re-encoded, write queue peak {self.max_queue_depth}/{self._write_queue.maxsize}')
+        return '\n'.join(lines)
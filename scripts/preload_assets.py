@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+m00-os-7 Preload Manifest
+
+Ranks the images shown while the system boots (see BOOT_PHASES in
+analyze_assets.py) so they can be fetched in parallel with the JS bundle
+instead of one by one as each screen first renders.
+
+Writes:
+    public/assets/preload.json  phases and ranked assets (URL, bytes,
+                                phase, fetch priority)
+    app/utils/preloadAssets.ts  PRELOAD_LINKS: <link rel="preload">
+                                attributes, added to app.head.link in
+                                nuxt.config.ts
+
+generate_assets.py writes both after a full build; run this script on its
+own after the individual generators.
+
+Usage:
+    python -m scripts.preload_assets
+"""
+
+import os
+
+from .analyze_assets import analyze, build_registry, load_aliases, scan_sources
+from .asset_utils import get_output_layout, write_json_asset, write_text_asset
+from .build_log import add_logging_arguments, configure_from_args, info, print_summary
+from .inline_assets import MIME_TYPES
+
+
+PRELOAD_MANIFEST = 'preload.json'
+
+# Generated module, relative to the project directory
+TS_MODULE = 'app/utils/preloadAssets.ts'
+
+HEADER = 'Generated by scripts/preload_assets.py - do not edit.'
+
+def get_project_dir():
+    return os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def rank_assets(graph):
+    """
+    Turn the critical path of an analyze() graph into ranked preloads.
+
+    Returns:
+        List of dicts (rank, url, bytes, phase, fetchpriority, type),
+        boot phases first; non-image assets are left out
+    """
+    ranked = []
+    seen = set()
+    for entry in graph['critical']:
+        url = entry['url']
+        mime = MIME_TYPES.get(os.path.splitext(url)[1])
+        if mime is None or url in seen:
+            continue
+        seen.add(url)
+        ranked.append({
+            'rank': len(ranked) + 1,
+            'url': url,
+            'bytes': entry['bytes'],
+            'phase': entry['phase'],
+            'fetchpriority': entry['fetchpriority'],
+            'type': mime,
+        })
+    return ranked
+
+def build_manifest(ranked):
+    """preload.json contents: per-phase totals and the ranked assets."""
+    phases = {}
+    for entry in ranked:
+        phase = phases.setdefault(entry['phase'], {
+            'name': entry['phase'], 'fetchpriority': entry['fetchpriority'], 'assets': 0, 'bytes': 0,
+        })
+        phase['assets'] += 1
+        phase['bytes'] += entry['bytes'] or 0
+    return {'phases': list(phases.values()), 'assets': ranked}
+
+def write_ts_module(ranked, filepath):
+    lines = [
+        f'// {HEADER}',
+        '',
+        'export interface PreloadLink {',
+        "  rel: 'preload'",
+        "  as: 'image'",
+        '  type: string',
+        '  href: string',
+        "  fetchpriority: 'high' | 'low' | 'auto'",
+        '}',
+        '',
+        '/** Boot-critical images in load order, as <link rel="preload"> attributes. */',
+        'export const PRELOAD_LINKS: PreloadLink[] = [',
+    ]
+    lines += [
+        f"  {{ rel: 'preload', as: 'image', type: '{entry['type']}', href: '{entry['url']}', "
+        f"fetchpriority: '{entry['fetchpriority']}' }},"
+        for entry in ranked
+    ]
+    lines += [']', '']
+    return write_text_asset(filepath, '\n'.join(lines))
+
+def generate_preload_manifest(graph, root=None, write_module=True):
+    """
+    Write preload.json (and the TS module) for an analyze() graph.
+
+    Args:
+        graph: Asset dependency graph from analyze_assets.analyze()
+        root: Assets directory (default: the output layout root)
+        write_module: Also write app/utils/preloadAssets.ts
+    """
+    ranked = rank_assets(graph)
+    root = root or get_output_layout().root
+    write_json_asset(os.path.join(root, PRELOAD_MANIFEST), build_manifest(ranked))
+    if write_module:
+        write_ts_module(ranked, os.path.join(get_project_dir(), *TS_MODULE.split('/')))
+
+    total = sum(entry['bytes'] or 0 for entry in ranked)
+    info(f'Preloading {len(ranked)} boot assets ({total} bytes)')
+
+
+# ============================================
+# CLI Entry Point
+# ============================================
+
+if __name__ == '__main__':
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Write the boot asset preload manifest')
+    parser.add_argument('--jobs', type=int, default=None,
+                        help='Number of render processes (default: CPU count)')
+    add_logging_arguments(parser)
+
+    args = parser.parse_args()
+    configure_from_args(args)
+    root = get_output_layout().root
+    graph = analyze(scan_sources(), build_registry(args.jobs), load_aliases(root))
+    generate_preload_manifest(graph, root)
+    print_summary()
@@ -0,0 +1,332 @@
+#!/usr/bin/env python3
+"""
+m00-os-7 Pixel-Art Upscaler
+
+Upscales the rendered assets with pixel-art-aware filters, so enlarged
+icons keep their hard edges instead of the blur of browser bilinear
+filtering:
+
+    nearest2x, nearest3x   pixel replication
+    scale2x, scale3x       Scale2x/Scale3x (AdvMAME): replication, except
+                           that diagonal edges are smoothed by copying a
+                           matching neighbour into the corner subpixels
+
+Each filter works on whole arrays: RGBA pixels are packed into one uint32
+per pixel, the eight neighbours are shifted views of an edge-padded copy,
+and every output subpixel is one np.where() over the image. Per-pixel
+reference implementations are kept for --benchmark, which checks that
+both give identical output and compares their speed.
+
+Generator units render and upscale in worker processes; the main process
+encodes and writes through the asset pipeline (see pipeline.py). Output
+goes to a tree of its own per filter, e.g.
+upscaled/scale2x/icons/system/folder.png, outside the groups that
+generate_themes.py recolours. As in the full build, duplicates are
+encoded once and written under each of their names.
+
+Usage:
+    python -m scripts.upscale_assets [--method NAME ...] [--jobs N] [--benchmark]
+"""
+
+import io
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
+from functools import partial
+
+from ._lazy import lazy_import
+from .asset_utils import capture_assets, defer_writes, get_output_layout, output_layout
+from .build_log import add_logging_arguments, configure_from_args, event, info, print_summary
+from .generate_assets import IMAGE_UNITS
+from .pipeline import AssetPipeline
+
+Image = lazy_import('PIL.Image')
+np = lazy_import('numpy')
+
+
+# ============================================
+# Vectorised Filters
+# ============================================
+
+def pixel_keys(img):
+    """Pack an image into one uint32 per RGBA pixel (height x width)."""
+    pixels = np.ascontiguousarray(np.asarray(img.convert('RGBA')))
+    return pixels.view(np.uint32).reshape(pixels.shape[:2])
+
+def keys_to_image(keys, mode='RGBA'):
+    """Unpack pixel_keys() output into an image of the given mode."""
+    height, width = keys.shape
+    pixels = np.ascontiguousarray(keys).view(np.uint8).reshape(height, width, 4)
+    img = Image.fromarray(pixels, 'RGBA')
+    return img if mode == 'RGBA' else img.convert(mode)
+
+def neighbours(keys):
+    """
+    The eight neighbours of every pixel, edges replicated.
+
+    Returns:
+        (A, B, C, D, F, G, H, I) arrays laid out around E:
+            A B C
+            D E F
+            G H I
+    """
+    p = np.pad(keys, 1, mode='edge')
+    return (p[:-2, :-2], p[:-2, 1:-1], p[:-2, 2:],
+            p[1:-1, :-2], p[1:-1, 2:],
+            p[2:, :-2], p[2:, 1:-1], p[2:, 2:])
+
+def scale_nearest(keys, factor):
+    return np.repeat(np.repeat(keys, factor, axis=0), factor, axis=1)
+
+def scale2x(keys):
+    """Scale2x on packed pixels; returns an array twice the size."""
+    _, B, _, D, F, _, H, _ = neighbours(keys)
+    E = keys
+    edge = (B != H) & (D != F)
+
+    out = np.empty((E.shape[0], 2, E.shape[1], 2), dtype=np.uint32)
+    out[:, 0, :, 0] = np.where(edge & (D == B), D, E)
+    out[:, 0, :, 1] = np.where(edge & (B == F), F, E)
+    out[:, 1, :, 0] = np.where(edge & (D == H), D, E)
+    out[:, 1, :, 1] = np.where(edge & (H == F), F, E)
+    return out.reshape(E.shape[0] * 2, E.shape[1] * 2)
+
+def scale3x(keys):
+    """Scale3x on packed pixels; returns an array three times the size."""
+    A, B, C, D, F, G, H, I = neighbours(keys)
+    E = keys
+    edge = (B != H) & (D != F)
+    db, bf, dh, hf = edge & (D == B), edge & (B == F), edge & (D == H), edge & (H == F)
+
+    out = np.empty((E.shape[0], 3, E.shape[1], 3), dtype=np.uint32)
+    out[:, 0, :, 0] = np.where(db, D, E)
+    out[:, 0, :, 1] = np.where((db & (E != C)) | (bf & (E != A)), B, E)
+    out[:, 0, :, 2] = np.where(bf, F, E)
+    out[:, 1, :, 0] = np.where((db & (E != G)) | (dh & (E != A)), D, E)
+    out[:, 1, :, 1] = E
+    out[:, 1, :, 2] = np.where((bf & (E != I)) | (hf & (E != C)), F, E)
+    out[:, 2, :, 0] = np.where(dh, D, E)
+    out[:, 2, :, 1] = np.where((dh & (E != I)) | (hf & (E != G)), H, E)
+    out[:, 2, :, 2] = np.where(hf, F, E)
+    return out.reshape(E.shape[0] * 3, E.shape[1] * 3)
+
+# Output tree, below the assets root: upscaled/<filter>/<asset key>.png
+UPSCALED_DIR = 'upscaled'
+
+# Filter name -> function of a pixel_keys() array
+SCALERS = {
+    'nearest2x': partial(scale_nearest, factor=2),
+    'nearest3x': partial(scale_nearest, factor=3),
+    'scale2x': scale2x,
+    'scale3x': scale3x,
+}
+
+def upscale(img, method):
+    """
+    Upscale an image with one of SCALERS.
+
+    Args:
+        img: Source image (e.g. from create_icon())
+        method: Filter name
+
+    Returns:
+        Upscaled image (RGB stays RGB, anything else becomes RGBA)
+    """
+    mode = 'RGB' if img.mode == 'RGB' else 'RGBA'
+    return keys_to_image(SCALERS[method](pixel_keys(img)), mode)
+
+# ============================================
+# Per-Pixel Reference Filters
+# ============================================
+
+def _reference_scale(img, factor, subpixels):
+    """
+    Run a per-pixel filter in plain Python.
+
+    Args:
+        img: Source image
+        factor: Scale factor
+        subpixels: Function of (A, B, C, D, E, F, G, H, I) returning the
+            factor * factor output pixels, row-major
+    """
+    src = img.convert('RGBA')
+    width, height = src.size
+    pixels = src.load()
+    out = Image.new('RGBA', (width * factor, height * factor))
+    dest = out.load()
+
+    for y in range(height):
+        up, down = max(y - 1, 0), min(y + 1, height - 1)
+        for x in range(width):
+            left, right = max(x - 1, 0), min(x + 1, width - 1)
+            block = subpixels(
+                pixels[left, up], pixels[x, up], pixels[right, up],
+                pixels[left, y], pixels[x, y], pixels[right, y],
+                pixels[left, down], pixels[x, down], pixels[right, down],
+            )
+            for i, value in enumerate(block):
+                dest[x * factor + i % factor, y * factor + i // factor] = value
+    return out
+
+def _nearest_subpixels(factor):
+    def subpixels(A, B, C, D, E, F, G, H, I):
+        return [E] * (factor * factor)
+    return subpixels
+
+def _scale2x_subpixels(A, B, C, D, E, F, G, H, I):
+    if B == H or D == F:
+        return [E, E, E, E]
+    return [
+        D if D == B else E,
+        F if B == F else E,
+        D if D == H else E,
+        F if H == F else E,
+    ]
+
+def _scale3x_subpixels(A, B, C, D, E, F, G, H, I):
+    if B == H or D == F:
+        return [E] * 9
+    return [
+        D if D == B else E,
+        B if (D == B and E != C) or (B == F and E != A) else E,
+        F if B == F else E,
+        D if (D == B and E != G) or (D == H and E != A) else E,
+        E,
+        F if (B == F and E != I) or (H == F and E != C) else E,
+        D if D == H else E,
+        H if (D == H and E != I) or (H == F and E != G) else E,
+        F if H == F else E,
+    ]
+
+REFERENCE_SCALERS = {
+    'nearest2x': partial(_reference_scale, factor=2, subpixels=_nearest_subpixels(2)),
+    'nearest3x': partial(_reference_scale, factor=3, subpixels=_nearest_subpixels(3)),
+    'scale2x': partial(_reference_scale, factor=2, subpixels=_scale2x_subpixels),
+    'scale3x': partial(_reference_scale, factor=3, subpixels=_scale3x_subpixels),
+}
+
+# ============================================
+# Asset Set
+# ============================================
+
+def capture_unit(generate):
+    """Render one generator unit in memory; returns its images by asset key."""
+    with redirect_stdout(io.StringIO()), defer_writes(), capture_assets() as captured:
+        generate()
+    return captured
+
+def upscale_unit(generate, methods, root):
+    """
+    Render one unit and upscale its images (in a worker process).
+
+    Args:
+        generate: Generator unit from generate_assets.IMAGE_UNITS
+        methods: Filter names from SCALERS
+        root: Assets root; passed explicitly, as a spawned worker does not
+            inherit an output_layout() override
+
+    Returns:
+        (list of (filepath, image), seconds)
+    """
+    start = time.perf_counter()
+    outputs = []
+    captured = capture_unit(generate)
+    with output_layout(root) as layout:
+        for key, img in captured.items():
+            # 'icons/system/folder' -> upscaled/<method>/icons/system/folder.png
+            subdir, name = key.rsplit('/', 1)
+            for method in methods:
+                filepath = layout.file(f'{UPSCALED_DIR}/{method}/{subdir}', f'{name}.png')
+                outputs.append((filepath, upscale(img, method)))
+    return outputs, time.perf_counter() - start
+
+def upscale_assets(methods=tuple(SCALERS), jobs=None, encode_threads=4, queue_size=64):
+    """
+    Upscale every generated image with each method, in parallel.
+
+    Args:
+        methods: Filter names from SCALERS
+        jobs: Number of render processes (default: one per CPU)
+        encode_threads: Number of PNG encoder threads
+        queue_size: Capacity of the write queue
+    """
+    info(f'Upscaling {len(IMAGE_UNITS)} units ({", ".join(methods)})...')
+    root = get_output_layout().root
+    pipeline = AssetPipeline(encode_threads, queue_size)
+    try:
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            futures = [
+                (label, executor.submit(upscale_unit, generate, methods, root))
+                for label, generate in IMAGE_UNITS.items()
+            ]
+            for label, future in futures:
+                outputs, seconds = future.result()
+                pipeline.metrics['render'].record(seconds, items=len(outputs))
+                event('upscale', label, seconds, outputs=len(outputs))
+                for filepath, img in outputs:
+                    pipeline.submit(filepath, img)
+    finally:
+        pipeline.close()
+
+    info(pipeline.report())
+    info('Upscaling complete!')
+
+# ============================================
+# Benchmark
+# ============================================
+
+def benchmark(methods=tuple(SCALERS)):
+    """
+    Time the per-pixel and vectorised filters over the whole asset set
+    (single process) and check that their output is identical.
+    """
+    images = {}
+    for generate in IMAGE_UNITS.values():
+        images.update(capture_unit(generate))
+    pixels = sum(img.width * img.height for img in images.values())
+    info(f'Benchmarking {len(images)} images ({pixels} pixels)...')
+
+    print(f'{"method":<10} {"per-pixel s":>11} {"vector s":>9} {"speedup":>8} {"Mpx/s":>7} {"match":>6}')
+    for method in methods:
+        start = time.perf_counter()
+        reference = [REFERENCE_SCALERS[method](img) for img in images.values()]
+        reference_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        vectorised = [upscale(img, method) for img in images.values()]
+        vector_seconds = time.perf_counter() - start
+
+        match = all(
+            ref.tobytes() == out.convert('RGBA').tobytes()
+            for ref, out in zip(reference, vectorised)
+        )
+        print(f'{method:<10} {reference_seconds:>11.2f} {vector_seconds:>9.3f} '
+              f'{reference_seconds / vector_seconds:>7.0f}x {pixels / vector_seconds / 1e6:>7.1f} '
+              f'{"yes" if match else "NO":>6}')
+
+
+# ============================================
+# CLI Entry Point
+# ============================================
+
+if __name__ == '__main__':
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Upscale Mac OS 7 style assets with pixel-art filters')
+    parser.add_argument('--method', action='append', choices=list(SCALERS),
+                        help='Filter to apply (repeatable, default: all)')
+    parser.add_argument('--jobs', type=int, default=None,
+                        help='Number of render processes (default: CPU count)')
+    parser.add_argument('--benchmark', action='store_true',
+                        help='Compare per-pixel and vectorised filters instead of writing files')
+    add_logging_arguments(parser)
+
+    args = parser.parse_args()
+    configure_from_args(args)
+    methods = args.method or list(SCALERS)
+    if args.benchmark:
+        benchmark(methods)
+    else:
+        upscale_assets(methods, args.jobs)
+    print_summary()
@@ -30,9 +30,28 @@ const mockGain = {
   }
 }
 
+const mockBufferSource = {
+  connect: vi.fn(),
+  start: vi.fn(),
+  stop: vi.fn(),
+  buffer: null
+}
+
+const mockFilter = {
+  connect: vi.fn(),
+  frequency: { setValueAtTime: vi.fn() },
+  type: 'lowpass'
+}
+
 const mockAudioContext = {
   createOscillator: vi.fn().mockReturnValue(mockOscillator),
   createGain: vi.fn().mockReturnValue(mockGain),
+  createBuffer: vi.fn((_channels: number, length: number) => ({
+    getChannelData: () => new Float32Array(length)
+  })),
+  createBufferSource: vi.fn().mockReturnValue(mockBufferSource),
+  createBiquadFilter: vi.fn().mockReturnValue(mockFilter),
+  sampleRate: 44100,
   currentTime: 0,
   destination: {},
   close: vi.fn()
@@ -89,13 +108,71 @@ describe('useSound', () => {
     expect(mockAudio.volume).toBe(0.75) // 75 from mocked settings
   })
 
-  it('should play startup chime', () => {
+  it('should play pre-rendered startup chime', () => {
+    const mockAudio = {
+      play: vi.fn().mockResolvedValue(undefined),
+      volume: 1
+    }
+    global.Audio = vi.fn().mockImplementation(() => mockAudio) as any
+
     const { playStartupChime } = useSound()
     playStartupChime()
 
+    expect(global.Audio).toHaveBeenCalledWith('/assets/sounds/startup-chime.wav')
+    expect(mockAudio.play).toHaveBeenCalled()
+    expect(global.AudioContext).not.toHaveBeenCalled()
+  })
+
+  it('should synthesize startup chime when the asset fails to play', async () => {
+    const mockAudio = {
+      play: vi.fn().mockRejectedValue(new Error('not found')),
+      volume: 1
+    }
+    global.Audio = vi.fn().mockImplementation(() => mockAudio) as any
+
+    const { playStartupChime } = useSound()
+    playStartupChime()
+    await Promise.resolve()
+    await Promise.resolve()
+
     expect(global.AudioContext).toHaveBeenCalled()
     // Should create multiple oscillators for the chord
     expect(mockAudioContext.createOscillator).toHaveBeenCalled()
     expect(mockOscillator.start).toHaveBeenCalled()
   })
+
+  it('should play pre-rendered trash sound', () => {
+    const mockAudio = {
+      play: vi.fn().mockResolvedValue(undefined),
+      volume: 1
+    }
+    global.Audio = vi.fn().mockImplementation(() => mockAudio) as any
+
+    const { playTrashSound } = useSound()
+    playTrashSound()
+
+    expect(global.Audio).toHaveBeenCalledWith('/assets/sounds/trash.wav')
+    expect(mockAudio.play).toHaveBeenCalled()
+    expect(mockAudio.volume).toBe(0.75)
+    expect(global.AudioContext).not.toHaveBeenCalled()
+  })
+
+  it('should synthesize trash sound when the asset fails to play', async () => {
+    const mockAudio = {
+      play: vi.fn().mockRejectedValue(new Error('not found')),
+      volume: 1
+    }
+    global.Audio = vi.fn().mockImplementation(() => mockAudio) as any
+
+    const { playTrashSound } = useSound()
+    playTrashSound()
+    await Promise.resolve()
+    await Promise.resolve()
+
+    expect(global.AudioContext).toHaveBeenCalled()
+    // High-passed white noise
+    expect(mockAudioContext.createBufferSource).toHaveBeenCalled()
+    expect(mockFilter.type).toBe('highpass')
+    expect(mockBufferSource.start).toHaveBeenCalled()
+  })
 })
@@ -0,0 +1,66 @@
+"""
+Asset pack builds and extraction.
+
+Run from the project directory:
+    python -m pytest tests/unit/scripts
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from scripts.asset_pack import AssetPack, PackWriter
+from scripts.asset_utils import get_assets_root
+from scripts.build_log import configure
+from scripts.generate_assets import generate_assets
+
+
+def snapshot(root):
+    """Every directory and file below root, with file sizes and mtimes."""
+    dirs, files = [], {}
+    for dirpath, _, filenames in os.walk(root):
+        dirs.append(os.path.relpath(dirpath, root))
+        for name in filenames:
+            stat = os.stat(os.path.join(dirpath, name))
+            files[os.path.relpath(os.path.join(dirpath, name), root)] = (stat.st_size, stat.st_mtime_ns)
+    return sorted(dirs), files
+
+class AssetPackTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp(prefix='m00-pack-')
+        self.addCleanup(shutil.rmtree, self.tmp)
+        configure('quiet', os.path.join(self.tmp, 'events.jsonl'))
+
+    def test_pack_build_leaves_public_assets_untouched(self):
+        pack_path = os.path.join(self.tmp, 'assets.pack')
+        dirs, files = snapshot(get_assets_root())
+
+        generate_assets(themes=('graphite',), scales=(2,), jobs=2, pack_path=pack_path)
+
+        with AssetPack(pack_path) as pack:
+            self.assertIn('manifest.json', pack)
+            self.assertIn('themes/graphite/icons/system/folder.png', pack)
+            self.assertIn('cards/2x/back-classic.png', pack)
+        after_dirs, after_files = snapshot(get_assets_root())
+        self.assertEqual(after_dirs, dirs, 'pack build created directories in public/assets')
+        self.assertEqual(after_files, files)
+
+    def test_extract_rejects_names_outside_dest(self):
+        pack_path = os.path.join(self.tmp, 'evil.pack')
+        writer = PackWriter(pack_path, self.tmp)
+        for name in ('ok/a.png', '../escaped.png', 'x/../../escaped.png'):
+            writer.files[name] = b'data'
+        writer.close()
+
+        dest = os.path.join(self.tmp, 'out')
+        with AssetPack(pack_path) as pack:
+            self.assertEqual(pack.extract('ok/a.png', dest), os.path.join(dest, 'ok', 'a.png'))
+            for name in ('../escaped.png', 'x/../../escaped.png'):
+                with self.assertRaises(ValueError):
+                    pack.extract(name, dest)
+        self.assertFalse(os.path.exists(os.path.join(self.tmp, 'escaped.png')))
+
+
+if __name__ == '__main__':
+    unittest.main()
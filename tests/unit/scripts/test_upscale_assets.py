@@ -0,0 +1,50 @@
+"""
+Upscaled copies must stay out of the theme build.
+
+Run from the project directory:
+    python -m pytest tests/unit/scripts
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from scripts.asset_utils import get_assets_root, output_layout
+from scripts.build_log import configure
+from scripts.generate_themes import THEMED_SUBDIRS, generate_themes
+from scripts.upscale_assets import UPSCALED_DIR, upscale_assets
+
+
+def list_files(root):
+    files = []
+    for dirpath, _, filenames in os.walk(root):
+        files += [os.path.relpath(os.path.join(dirpath, name), root) for name in filenames]
+    return sorted(files)
+
+class ThemeAfterUpscaleTest(unittest.TestCase):
+    def setUp(self):
+        self.root = tempfile.mkdtemp(prefix='m00-assets-')
+        self.addCleanup(shutil.rmtree, self.root)
+        configure('quiet', os.path.join(self.root, 'events.jsonl'))
+        for subdir in THEMED_SUBDIRS:
+            shutil.copytree(os.path.join(get_assets_root(), subdir), os.path.join(self.root, subdir))
+
+    def build_theme(self):
+        themes_dir = os.path.join(self.root, 'themes')
+        shutil.rmtree(themes_dir, ignore_errors=True)
+        generate_themes(['graphite'], jobs=1)
+        return list_files(themes_dir)
+
+    def test_theme_files_unchanged_by_upscale(self):
+        with output_layout(self.root):
+            without_upscale = self.build_theme()
+            upscale_assets(['nearest2x'], jobs=2)
+            with_upscale = self.build_theme()
+
+        self.assertTrue(list_files(os.path.join(self.root, UPSCALED_DIR, 'nearest2x')))
+        self.assertEqual(with_upscale, without_upscale)
+
+
+if __name__ == '__main__':
+    unittest.main()